@@ -0,0 +1 @@
+"""Benchmarks de desempenho do jogo (execute com ``python -m benchmarks.<nome>``)"""
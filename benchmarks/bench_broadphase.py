@@ -0,0 +1,72 @@
+"""Colisões projétil x obstáculo: teste de todos os pares com Rects vs broadphase SweepAndPrune"""
+import random
+
+from benchmarks.common import init_display, measure, report
+import pygame
+import src.config as config
+from src.broadphase import SweepAndPrune
+from src.entity_pool import EntityPool
+from src.obstacle import Obstacle
+from src.projectile import Projetil
+
+OBSTACLE_SPACING = 150  # Distância em x entre obstáculos consecutivos
+
+
+def old_colide_com(proj, obstaculo):
+    """Teste anterior: três pygame.Rect por par projétil/obstáculo"""
+    largura_obstaculo = getattr(obstaculo, 'top_width', obstaculo.WIDTH)
+    altura_superior = (obstaculo.gap_y - obstaculo.GAP // 2)
+    altura_inferior = (obstaculo.gap_y + obstaculo.GAP // 2)
+    ret_proj = pygame.Rect(proj.x, proj.y, proj.LARGURA, proj.ALTURA)
+    ret_sup = pygame.Rect(obstaculo.x, 0, largura_obstaculo, altura_superior)
+    ret_inf = pygame.Rect(obstaculo.x, altura_inferior, largura_obstaculo, config.SCREEN_HEIGHT - altura_inferior)
+    return ret_proj.colliderect(ret_sup) or ret_proj.colliderect(ret_inf)
+
+
+def main():
+    init_display()
+    Obstacle.warm_up("Earth", config.SCREEN_HEIGHT)
+    random.seed(1)
+
+    # Obstáculos espalhados pela tela em ordem de x, como no jogo
+    index = SweepAndPrune(Obstacle.WIDTH)
+    pool = EntityPool(Obstacle, index)
+    for x in range(0, config.SCREEN_WIDTH + OBSTACLE_SPACING, OBSTACLE_SPACING):
+        pool.acquire(x, random.randint(200, config.SCREEN_HEIGHT - 200), 3, None, config.SCREEN_HEIGHT, "Earth")
+    obstacles = pool.active
+
+    for count in (10, 100, 300, 1000):
+        projectiles = [Projetil(random.uniform(0, config.SCREEN_WIDTH), random.uniform(0, config.SCREEN_HEIGHT))
+                       for _ in range(count)]
+
+        def brute_force():
+            hits = 0
+            for proj in projectiles:
+                for obst in obstacles:
+                    if old_colide_com(proj, obst):
+                        hits += 1
+                        break
+            return hits
+
+        def broadphase():
+            hits = 0
+            for proj in projectiles:
+                for obst in index.query(proj.x, proj.x + proj.LARGURA):
+                    if proj.colide_com(obst):
+                        hits += 1
+                        break
+            return hits
+
+        # Os totais só diferem em toques de borda: Rect trunca coordenadas fracionárias
+        print(f"{count} projéteis x {len(obstacles)} obstáculos: "
+              f"{brute_force()} colisões (todos os pares), {broadphase()} (broadphase)")
+        old = measure(brute_force, 20)
+        report("  todos os pares com Rects", old)
+        new = measure(broadphase, 20)
+        report("  SweepAndPrune + teste aritmético", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
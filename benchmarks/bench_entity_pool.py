@@ -0,0 +1,100 @@
+"""Cenário de estresse: criação e remoção de entidades com e sem o EntityPool"""
+import random
+
+from benchmarks.common import init_display, measure, report
+import pygame
+import src.config as config
+from src.collectible import Collectible
+from src.entity_pool import EntityPool
+from src.obstacle import Obstacle
+from src.projectile import Projetil
+
+SPAWN_INTERVAL = 5  # Quadros entre obstáculos/itens (o jogo usa ~90 quadros)
+FRAMES = 600
+
+
+def spawn_args(frame):
+    """Argumentos de criação das três entidades no quadro informado"""
+    gap_y = random.randint(200, config.SCREEN_HEIGHT - 200)
+    obstacle = (config.SCREEN_WIDTH, gap_y, 3, None, config.SCREEN_HEIGHT, "Earth")
+    collectible = (config.SCREEN_WIDTH, gap_y, random.choice(["data", "weapon", "life"]),
+                   frame % 3 if frame % 2 else None)
+    projectile = (config.SCREEN_WIDTH // 2, gap_y)
+    return obstacle, collectible, projectile
+
+
+def main():
+    init_display()
+    Obstacle.warm_up("Earth", config.SCREEN_HEIGHT)
+
+    # Caminho anterior: construtores, listas recriadas por compreensão e list.remove
+    state = {"obstacles": [], "collectibles": [], "projectiles": [], "frame": 0}
+
+    def old_frame():
+        frame = state["frame"] = state["frame"] + 1
+        if frame % SPAWN_INTERVAL == 0:
+            obstacle, collectible, projectile = spawn_args(frame)
+            state["obstacles"].append(Obstacle(*obstacle))
+            state["collectibles"].append(Collectible(*collectible))
+            state["projectiles"].append(Projetil(*projectile))
+        for obstacle in state["obstacles"]:
+            obstacle.update()
+        for collectible in state["collectibles"]:
+            collectible.update()
+            collectible.x -= 3
+        for projectile in list(state["projectiles"]):
+            projectile.atualizar()
+            if projectile.fora_da_tela():
+                state["projectiles"].remove(projectile)
+        state["obstacles"] = [obs for obs in state["obstacles"] if obs.x > -obs.WIDTH]
+        state["collectibles"] = [col for col in state["collectibles"] if col.x > -col.WIDTH]
+
+    old = measure(old_frame, FRAMES)
+    report("listas e construtores (quadro)", old)
+
+    # Caminho novo: pools com acquire/release e compactação no lugar
+    pools = {"obstacles": EntityPool(Obstacle), "collectibles": EntityPool(Collectible),
+             "projectiles": EntityPool(Projetil)}
+    state["frame"] = 0
+
+    def new_frame():
+        frame = state["frame"] = state["frame"] + 1
+        if frame % SPAWN_INTERVAL == 0:
+            obstacle, collectible, projectile = spawn_args(frame)
+            pools["obstacles"].acquire(*obstacle)
+            pools["collectibles"].acquire(*collectible)
+            pools["projectiles"].acquire(*projectile)
+        for obstacle in pools["obstacles"].active:
+            obstacle.update()
+            if obstacle.x <= -obstacle.WIDTH:
+                pools["obstacles"].release(obstacle)
+        for collectible in pools["collectibles"].active:
+            collectible.update()
+            collectible.move(-3)
+            if collectible.x <= -collectible.WIDTH:
+                pools["collectibles"].release(collectible)
+        for projectile in pools["projectiles"].active:
+            projectile.atualizar()
+            if projectile.fora_da_tela():
+                pools["projectiles"].release(projectile)
+        pools["projectiles"].compact()
+        pools["obstacles"].compact()
+        pools["collectibles"].compact()
+
+    # Aquece até o regime permanente antes de contar as alocações
+    for _ in range(FRAMES):
+        new_frame()
+    warm = {name: pool.allocations for name, pool in pools.items()}
+
+    new = measure(new_frame, FRAMES)
+    report("EntityPool (quadro)", new, old)
+
+    for name, pool in pools.items():
+        print(f"{name:<14} vivas: {len(pool):4d}   construídas no aquecimento: {warm[name]:4d}"
+              f"   no regime permanente: {pool.allocations - warm[name]}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
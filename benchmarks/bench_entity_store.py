@@ -0,0 +1,90 @@
+"""Compara listas de objetos Obstacle com o protótipo EntityStore em colunas NumPy"""
+import random
+
+from benchmarks.common import init_display, measure, report
+import pygame
+import src.config as config
+from benchmarks.entity_store import EntityStore
+from src.obstacle import Obstacle
+
+SPACECRAFT_X = config.SCREEN_WIDTH // 2
+HITBOX = (SPACECRAFT_X, 300, SPACECRAFT_X + 70, 328)  # left, top, right, bottom
+
+
+def main():
+    screen = init_display()
+    top_sprite, bottom_sprite = Obstacle.get_planet_sprites("Earth")
+
+    for count in (10, 100, 1000):
+        # Obstáculos espalhados além da borda esquerda até a direita da tela
+        spawns = [(random.uniform(-Obstacle.WIDTH, config.SCREEN_WIDTH), random.randint(200, 520))
+                  for _ in range(count)]
+
+        obstacles = [Obstacle(x, gap_y, 3, planet_name="Earth") for x, gap_y in spawns]
+        state = {"obstacles": obstacles}
+
+        def objects_step():
+            # Movimento, pontuação, remoção e colisão como em GameMechanics/CollisionManager
+            score = 0
+            for obstacle in state["obstacles"]:
+                obstacle.update()
+                if not obstacle.scored and obstacle.x + obstacle.WIDTH < SPACECRAFT_X:
+                    obstacle.scored = True
+                    score += 1
+            hits = 0
+            left, top, right, bottom = HITBOX
+            for obstacle in state["obstacles"]:
+                if right > obstacle.x and left < obstacle.x + obstacle.WIDTH:
+                    if top < obstacle.gap_y - obstacle.GAP // 2 or bottom > obstacle.gap_y + obstacle.GAP // 2:
+                        hits += 1
+            alive = [obs for obs in state["obstacles"] if obs.x > -obs.WIDTH]
+            # Repõe os removidos para manter a contagem estável
+            for obstacle in state["obstacles"]:
+                if obstacle.x <= -obstacle.WIDTH:
+                    obstacle.x = config.SCREEN_WIDTH
+                    obstacle.scored = False
+                    alive.append(obstacle)
+            state["obstacles"] = alive
+            return score, hits
+
+        store = EntityStore(count, gap=Obstacle.GAP)
+        for x, gap_y in spawns:
+            store.add(x, 0, Obstacle.WIDTH, config.SCREEN_HEIGHT, 3, gap_y=gap_y)
+
+        def store_step():
+            store.update()
+            score = store.score(SPACECRAFT_X)
+            hits = len(store.hits(*HITBOX))
+            # Repõe os que saíram pela esquerda para manter a contagem estável
+            n = store.count
+            gone = store.x[:n] <= -Obstacle.WIDTH
+            store.x[:n][gone] = config.SCREEN_WIDTH
+            store.scored[:n][gone] = False
+            store.cull(-Obstacle.WIDTH)
+            return score, hits
+
+        print(f"{count} obstáculos vivos")
+        old = measure(objects_step, 200)
+        report("  objetos: mover/pontuar/remover/colidir", old)
+        new = measure(store_step, 200)
+        report("  EntityStore: mesma etapa vetorizada", new, old)
+
+        def objects_draw():
+            for obstacle in state["obstacles"]:
+                obstacle.draw(screen)
+
+        sprites = [(top_sprite, bottom_sprite)]
+
+        def store_draw():
+            store.draw(screen, sprites)
+
+        old = measure(objects_draw, 20)
+        report("  objetos: draw", old)
+        new = measure(store_draw, 20)
+        report("  EntityStore: draw em lote", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
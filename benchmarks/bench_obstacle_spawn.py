@@ -0,0 +1,65 @@
+"""Mede o custo de criar obstáculos com e sem o cache de sprites e o banco de texturas de fallback"""
+import os
+import random
+
+from benchmarks.common import init_display, measure, report
+import pygame
+from src.obstacle import Obstacle
+
+
+def main():
+    init_display()
+
+    for planet_name in ("Earth", "Venus", "Saturn", "Neptune"):
+        folder_name = Obstacle.PLANET_FOLDER_NAMES[planet_name]
+        folder = os.path.join("assets", "images", "planets_sprites", folder_name)
+        if planet_name == "Earth":
+            path = os.path.join(folder, f"obstaculo_cima_{folder_name}.png")
+        else:
+            path = os.path.join(folder, f"obstaculo_{folder_name}.png")
+        raw_sprite = pygame.image.load(path).convert_alpha()
+
+        # Caminho anterior: cada obstáculo redimensionava o sprite original
+        def old_spawn():
+            height = int(raw_sprite.get_height() * (Obstacle.WIDTH / raw_sprite.get_width()))
+            top = pygame.transform.scale(raw_sprite, (Obstacle.WIDTH, height))
+            bottom = pygame.transform.scale(raw_sprite, (Obstacle.WIDTH, height))
+            return top, bottom
+
+        old = measure(old_spawn, 50)
+        report(f"{planet_name}: scale por obstáculo", old)
+
+        Obstacle.get_planet_sprites(planet_name)  # Aquece o cache
+        new = measure(lambda: Obstacle(1280, 360, 3, planet_name=planet_name), 500)
+        report(f"{planet_name}: Obstacle() com cache", new, old)
+
+    # Marte não tem sprites: compara o fallback procedural antigo com o banco de texturas
+    colors_by_type = Obstacle.TYPES
+    details = {
+        "asteroid": Obstacle._add_asteroid_details,
+        "debris": Obstacle._add_debris_details,
+        "storm": Obstacle._add_storm_details,
+    }
+
+    def old_fallback_spawn():
+        # Caminho anterior: as duas superfícies eram geradas duas vezes por obstáculo
+        obstacle_type = random.choice(list(colors_by_type))
+        colors = colors_by_type[obstacle_type]
+        for _ in range(2):
+            for height in (360 - Obstacle.GAP // 2, 720 - 360 - Obstacle.GAP // 2):
+                surface = pygame.Surface((Obstacle.WIDTH, height))
+                surface.fill(colors["color"])
+                details[obstacle_type](surface, colors)
+
+    old = measure(old_fallback_spawn, 50)
+    report("Mars: fallback gerado por obstáculo", old)
+
+    Obstacle.warm_up("Mars", 720)  # Gera o banco de texturas
+    new = measure(lambda: Obstacle(1280, 360, 3, planet_name="Mars"), 500)
+    report("Mars: Obstacle() com banco de texturas", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compara partículas em dicionários com o ParticleSystem em arrays NumPy"""
+import math
+import random
+
+from benchmarks.common import init_display, measure, report
+import numpy as np
+import pygame
+from src.particles import ParticleSystem
+
+COLOR = (220, 20, 60)
+LIFE = 30
+
+
+class DictParticles:
+    """Implementação anterior da NOVA: lista de dicionários, pop(i) e um draw.circle por partícula"""
+
+    def __init__(self):
+        self.particles = []
+
+    def emit(self, x, y):
+        angle = random.uniform(0, math.pi * 2)
+        speed = random.uniform(0.5, 2.0)
+        self.particles.append({
+            'x': x, 'y': y,
+            'dx': math.cos(angle) * speed, 'dy': math.sin(angle) * speed,
+            'size': random.uniform(2, 5), 'color': (*COLOR, 200), 'life': LIFE
+        })
+
+    def update(self):
+        i = 0
+        while i < len(self.particles):
+            particle = self.particles[i]
+            particle['x'] += particle['dx']
+            particle['y'] += particle['dy']
+            particle['life'] -= 1
+            if particle['life'] <= 0:
+                self.particles.pop(i)
+            else:
+                i += 1
+
+    def draw(self, screen):
+        for particle in self.particles:
+            alpha = int(255 * (particle['life'] / LIFE))
+            color = (particle['color'][0], particle['color'][1], particle['color'][2], alpha)
+            pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), int(particle['size']))
+
+
+def main():
+    screen = init_display()
+    center = (640, 360)
+
+    for count in (10, 100, 1000, 10000):
+        # Emissão contínua que mantém ~count partículas vivas
+        per_frame = max(1, count // LIFE)
+
+        old_system = DictParticles()
+
+        def old_frame():
+            for _ in range(per_frame):
+                old_system.emit(*center)
+            old_system.update()
+            old_system.draw(screen)
+
+        for _ in range(LIFE):
+            old_frame()
+        old = measure(old_frame, 50)
+        report(f"dicionários ({len(old_system.particles)} partículas)", old)
+
+        new_system = ParticleSystem(capacity=per_frame * (LIFE + 1))
+
+        def new_frame():
+            angle = np.random.uniform(0, math.pi * 2, per_frame)
+            speed = np.random.uniform(0.5, 2.0, per_frame)
+            new_system.emit_many(center[0], center[1], np.cos(angle) * speed, np.sin(angle) * speed,
+                                 LIFE, np.random.uniform(2, 5, per_frame), COLOR)
+            new_system.update()
+            new_system.draw(screen)
+
+        for _ in range(LIFE):
+            new_frame()
+        new = measure(new_frame, 50)
+        report(f"ParticleSystem ({len(new_system)} partículas)", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Tempo por quadro (update e draw) do jogo completo em cenários nomeados
+
+Cada cenário cria um ``Game`` novo e o coloca direto no estado desejado
+(jogando em cada planeta, transição, quiz, contagem de falha no quiz,
+diálogo, player de música e um caso de estresse com 200 obstáculos e 1000
+partículas). Depois de alguns quadros de aquecimento, mede ``game.update``
+e o desenho (``game.draw`` mais a apresentação do quadro) separadamente em
+cada quadro e relata p50, p95, p99 e máximo em milissegundos.
+
+    python -m benchmarks.bench_scenarios --output resultados.json
+    python -m benchmarks.bench_scenarios --baseline resultados.json   # compara com uma execução salva
+    python -m benchmarks.bench_scenarios --only stress quiz --frames 600
+"""
+import argparse
+import json
+import platform
+import time
+
+from benchmarks.common import init_display
+import numpy as np
+import pygame
+import src.config as config
+from src import font_registry
+from src.dirty_rects import dirty_rects
+from src.obstacle import Obstacle
+from src.particles import ParticleSystem
+from src.rng import rng
+
+PERCENTILES = (50, 95, 99)
+STRESS_OBSTACLES = 200
+STRESS_PARTICLES = 1000
+
+bench_random = rng.stream("benchmark")
+
+
+def start_playing(game, planet_index):
+    """Entra no modo de jogo no planeta informado, como ao chegar nele"""
+    game.current_planet_index = planet_index
+    game.current_planet = game.planets[planet_index]
+    game.reset(new_planet=True)
+
+
+def keep_playing(game):
+    """Mantém a partida no mesmo ponto: nave no centro, sem fim de jogo nem avanço de fase"""
+    game.spacecraft.y = config.SCREEN_HEIGHT // 2
+    game.spacecraft.velocity = 0
+    game.lives = game.max_lives
+    game.score = 0
+
+
+def keep_transition(game):
+    """Reinicia a animação de transição antes que ela termine"""
+    if game.state_manager.transition_time >= config.TRANSITION_DURATION - 1:
+        game.state_manager.transition_time = 0
+        game.state_manager.welcome_sound_timer = 0
+
+
+def keep_quiz(game):
+    """Impede que o tempo do quiz se esgote"""
+    if game.quiz.quiz_timer <= 1:
+        game.quiz.quiz_timer = config.QUIZ_DURATION
+
+
+def keep_quiz_failure(game):
+    """Reinicia a contagem regressiva antes que ela volte ao jogo"""
+    if game.state_manager.quiz_failure_timer <= 1:
+        game.state_manager.change_state(config.QUIZ_FAILURE)
+
+
+def keep_dialogue(game):
+    """Avança o diálogo assim que cada fala termina de ser digitada, recomeçando no fim"""
+    if game.dialogue_manager.text_complete:
+        if not game.dialogue_manager.advance_dialogue():
+            game.start_character_dialogue()
+
+
+def fill_obstacles(game):
+    """Completa STRESS_OBSTACLES obstáculos espaçados do fim da fila até a direita da tela"""
+    stride = (config.SCREEN_WIDTH + Obstacle.WIDTH) / STRESS_OBSTACLES
+    x = max((obstacle.x for obstacle in game.obstacles), default=-Obstacle.WIDTH)
+    types = list(Obstacle.TYPES.keys())
+    while len(game.obstacles) < STRESS_OBSTACLES:
+        x += stride
+        obstacle = game.obstacle_pool.acquire(
+            x,
+            bench_random.randint(Obstacle.GAP // 2, config.SCREEN_HEIGHT - config.FLOOR_HEIGHT - Obstacle.GAP // 2),
+            game.obstacle_speed,
+            bench_random.choice(types),
+            config.SCREEN_HEIGHT,
+            game.current_planet.name
+        )
+        # Já nasce pontuado: dezenas de pontos por quadro disparariam o quiz
+        obstacle.scored = True
+
+
+def fill_particles(particles):
+    """Completa a capacidade do sistema de partículas com pontos espalhados pela tela"""
+    amount = particles.capacity - len(particles)
+    if amount <= 0:
+        return
+    generator = rng.numpy("benchmark")
+    particles.emit_many(
+        generator.uniform(0, config.SCREEN_WIDTH, amount),
+        generator.uniform(0, config.SCREEN_HEIGHT, amount),
+        generator.normal(0, 1, amount),
+        generator.normal(0, 1, amount),
+        generator.uniform(30, 90, amount),
+        generator.integers(1, 5, amount),
+        (220, 20, 60)
+    )
+
+
+def setup_stress(game):
+    start_playing(game, 0)
+    # Troca as partículas da NOVA por um sistema grande (desenhado atrás dela a cada quadro)
+    game.nova.particles = ParticleSystem(capacity=STRESS_PARTICLES)
+
+    def keep(game):
+        keep_playing(game)
+        fill_obstacles(game)
+        fill_particles(game.nova.particles)
+
+    keep(game)
+    return keep
+
+
+def setup_transition(game):
+    game.reset()
+    return keep_transition
+
+
+def setup_quiz(game):
+    start_playing(game, 0)
+    game.state_manager.start_quiz()
+    return keep_quiz
+
+
+def setup_quiz_failure(game):
+    start_playing(game, 0)
+    game.state_manager.start_quiz()
+    game.state_manager.change_state(config.QUIZ_FAILURE)
+    return keep_quiz_failure
+
+
+def setup_dialogue(game):
+    game.start_character_dialogue()
+    return keep_dialogue
+
+
+def setup_music_player(game):
+    game.music_player.load_unlocked_planets()
+    game.state_manager.change_state(config.MUSIC_PLAYER)
+    return None
+
+
+def playing_scenario(planet_index):
+    def setup(game):
+        start_playing(game, planet_index)
+        return keep_playing
+    return setup
+
+
+def build_scenarios(planet_names):
+    """Cenários na ordem de execução: nome -> função que prepara o jogo e retorna a de manutenção"""
+    scenarios = {
+        f"playing_{name.lower()}": playing_scenario(index)
+        for index, name in enumerate(planet_names)
+    }
+    scenarios.update({
+        "transition": setup_transition,
+        "quiz": setup_quiz,
+        "quiz_failure": setup_quiz_failure,
+        "dialogue": setup_dialogue,
+        "music_player": setup_music_player,
+        "stress": setup_stress,
+    })
+    return scenarios
+
+
+def summarize(samples):
+    """Percentis e máximo de uma série de tempos (segundos), em milissegundos"""
+    values = np.asarray(samples) * 1000
+    summary = {f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES}
+    summary["max"] = float(values.max())
+    summary["mean"] = float(values.mean())
+    return summary
+
+
+def run_scenario(setup, frames, warmup):
+    """Prepara um jogo novo com ``setup`` e mede ``frames`` quadros após ``warmup``"""
+    from src.game import Game
+
+    game = Game()
+    keep = setup(game)
+    state = game.state
+
+    update_times = []
+    draw_times = []
+    for frame in range(warmup + frames):
+        if keep is not None:
+            keep(game)
+        font_registry.registry.begin_frame()
+        game.input_handler.handle_events()
+
+        start = time.perf_counter()
+        game.update()
+        middle = time.perf_counter()
+        game.draw()
+        dirty_rects.present()
+        end = time.perf_counter()
+
+        if frame >= warmup:
+            update_times.append(middle - start)
+            draw_times.append(end - middle)
+
+    if game.state != state:
+        print(f"  aviso: o cenário terminou no estado {game.state} (começou em {state})")
+
+    frame_times = [u + d for u, d in zip(update_times, draw_times)]
+    return {
+        "state": state,
+        "frames": frames,
+        "update": summarize(update_times),
+        "draw": summarize(draw_times),
+        "frame": summarize(frame_times),
+    }
+
+
+def print_result(name, result, baseline=None):
+    line = f"{name:<18}"
+    for part in ("update", "draw", "frame"):
+        summary = result[part]
+        line += f"  {part} {summary['p50']:6.2f}/{summary['p95']:6.2f}/{summary['p99']:6.2f}/{summary['max']:6.2f}"
+    if baseline is not None:
+        before = baseline["frame"]["p95"]
+        after = result["frame"]["p95"]
+        if after > 0:
+            line += f"   p95 {before:6.2f} -> {after:6.2f} ({before / after:4.2f}x)"
+    print(line)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Tempo por quadro do jogo em cenários nomeados")
+    parser.add_argument("--frames", type=int, default=300, help="quadros medidos por cenário (padrão: 300)")
+    parser.add_argument("--warmup", type=int, default=30, help="quadros descartados no início (padrão: 30)")
+    parser.add_argument("--seed", type=int, default=0, help="semente dos geradores aleatórios (padrão: 0)")
+    parser.add_argument("--only", nargs="+", metavar="CENÁRIO", help="roda só os cenários informados")
+    parser.add_argument("--output", metavar="ARQUIVO", help="grava os resultados em JSON")
+    parser.add_argument("--baseline", metavar="ARQUIVO", help="compara com resultados JSON salvos anteriormente")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Sons silenciosos, como no modo headless
+    config.HEADLESS = True
+    init_display()
+    pygame.mixer.init()
+
+    from src.planet_data import create_planet_data
+    scenarios = build_scenarios([data["name"] for data in create_planet_data()])
+    if args.only:
+        unknown = [name for name in args.only if name not in scenarios]
+        if unknown:
+            print(f"Cenários desconhecidos: {', '.join(unknown)}")
+            print(f"Disponíveis: {', '.join(scenarios)}")
+            return
+        scenarios = {name: scenarios[name] for name in args.only}
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file).get("scenarios", {})
+
+    print(f"{args.frames} quadros por cenário, tempos em ms (p50/p95/p99/máx)")
+    results = {}
+    for name, setup in scenarios.items():
+        # Cada cenário parte da mesma semente, independentemente de quais rodam antes
+        rng.seed(args.seed)
+        results[name] = run_scenario(setup, args.frames, args.warmup)
+        print_result(name, results[name], baseline.get(name))
+
+    if args.output:
+        report = {
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "scenarios": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Resultados salvos em {args.output}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
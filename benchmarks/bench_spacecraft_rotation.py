@@ -0,0 +1,60 @@
+"""Compara a rotação por quadro da nave com o atlas de sprites pré-rotacionados"""
+import time
+
+from benchmarks.common import init_display, measure, report
+import pygame
+from src.spacecraft import Spacecraft
+
+
+def draw_rotating(ship, screen, invulnerable, frame):
+    """Caminho antigo: copia, tinge e rotaciona o quadro a cada desenho"""
+    current = ship.thrust_images[frame % len(ship.thrust_images)]
+    if invulnerable:
+        current = current.copy()
+        overlay = pygame.Surface(current.get_size(), pygame.SRCALPHA)
+        overlay.fill((100, 100, 255, 100))
+        current.blit(overlay, (0, 0))
+    rotated = pygame.transform.rotate(current, ship.angle)
+    cx = ship.x + ship.WIDTH // 2 + ship.flame_extent // 2
+    cy = ship.y + ship.HEIGHT // 2
+    rect = rotated.get_rect(center=(cx, cy))
+    screen.blit(rotated, rect.topleft)
+
+
+def main():
+    screen = init_display()
+
+    Spacecraft.ROTATION_ATLAS_CACHE.clear()
+    start = time.perf_counter()
+    ship = Spacecraft(200, 300)
+    print(f"Construção do atlas: {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(ship.rotation_atlas)} sprites)")
+
+    angles = [a * 0.7 for a in range(-43, 86)]
+    state = {"i": 0}
+
+    def step():
+        i = state["i"] = state["i"] + 1
+        ship.angle = angles[i % len(angles)]
+        ship.current_frame = i % ship.animation_frames
+        return i
+
+    for invulnerable in (False, True):
+        label = "invulnerável" if invulnerable else "normal"
+        old = measure(lambda: draw_rotating(ship, screen, invulnerable, step()), 2000)
+        report(f"rotação por quadro ({label})", old)
+
+        # Mantém a chama visível para exercitar os quadros de empuxo
+        def draw_atlas():
+            step()
+            ship.last_thrust_time = pygame.time.get_ticks()
+            ship.draw(screen, invulnerable)
+
+        new = measure(draw_atlas, 2000)
+        report(f"atlas pré-rotacionado ({label})", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
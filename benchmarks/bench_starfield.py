@@ -0,0 +1,69 @@
+"""Compara o campo de estrelas em dicionários com o campo vetorizado em NumPy"""
+import math
+import random
+
+from benchmarks.common import init_display, measure, report
+import pygame
+import src.config as config
+from src.starfield import Starfield
+
+
+class DictStarfield:
+    """Implementação anterior: uma lista de dicionários e um draw.circle por estrela"""
+
+    def __init__(self, count, width, height):
+        self.stars = []
+        for _ in range(count):
+            brightness = random.randint(150, 255)
+            self.stars.append({
+                "x": random.randint(0, width),
+                "y": random.randint(0, height),
+                "size": random.uniform(0.5, 2.0),
+                "brightness": brightness,
+                "base_brightness": brightness,
+                "twinkle_speed": random.uniform(0.02, 0.1),
+                "phase": random.uniform(0, 2 * math.pi),
+            })
+
+    def update(self):
+        for star in self.stars:
+            star["phase"] += star["twinkle_speed"]
+            star["brightness"] = int(star["base_brightness"] * (0.5 + 0.5 * math.sin(star["phase"])))
+
+    def draw(self, screen):
+        for star in self.stars:
+            color = (star["brightness"], star["brightness"], star["brightness"])
+            pygame.draw.circle(screen, color, (int(star["x"]), int(star["y"])), int(star["size"]))
+
+
+def main():
+    screen = init_display()
+    width = config.SCREEN_WIDTH
+    height = config.SCREEN_HEIGHT - config.FLOOR_HEIGHT
+
+    for count in (100, 1000, 5000):
+        old_field = DictStarfield(count, width, height)
+
+        def old_frame():
+            old_field.update()
+            old_field.draw(screen)
+
+        old = measure(old_frame, 200)
+        report(f"dicionários ({count} estrelas)", old)
+
+        for layers in (1, 3):
+            new_field = Starfield(count, width, height, layers=layers)
+            scroll = 1.5 if layers > 1 else 0.0
+
+            def new_frame():
+                new_field.update(scroll)
+                new_field.draw(screen)
+
+            new = measure(new_frame, 200)
+            report(f"numpy ({count} estrelas, {layers} camada(s))", new, old)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import time
+
+# Os benchmarks rodam sem janela e sem áudio; precisa vir antes do import do pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import src.config as config
+
+
+def init_display():
+    """Inicializa o pygame com um display do tamanho da tela do jogo"""
+    pygame.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    from src import font_registry
+    font_registry.init_fonts()
+    return screen
+
+
+def measure(func, iterations, repeats=5):
+    """Executa ``func`` ``iterations`` vezes por rodada e retorna o melhor tempo por chamada (segundos)"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = (time.perf_counter() - start) / iterations
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(label, seconds, baseline=None):
+    """Imprime uma linha de resultado em microssegundos, com o ganho relativo opcional"""
+    line = f"{label:<40} {seconds * 1e6:10.2f} us"
+    if baseline:
+        line += f"   ({baseline / seconds:5.1f}x)"
+    print(line)
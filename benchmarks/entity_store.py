@@ -0,0 +1,139 @@
+import numpy as np
+
+
+class EntityStore:
+    """Armazenamento orientado a dados (structure of arrays) para entidades simples.
+
+    Cada atributo é uma coluna NumPy de capacidade fixa: x, y, largura,
+    altura, centro do vão (gap_y), velocidade, pontuado e tipo. Movimento,
+    pontuação, remoção das entidades fora da tela e testes de colisão AABB
+    são feitos em uma única passada vetorizada sobre as ``count`` primeiras
+    linhas, em vez de um laço Python por objeto.
+
+    Com ``gap`` > 0 cada entidade é uma coluna de obstáculo (partes superior
+    e inferior separadas por um vão de ``gap`` pixels centrado em gap_y);
+    com ``gap`` = 0 é uma caixa comum em (x, y, largura, altura), como
+    colecionáveis e projéteis. A velocidade é subtraída de x, então
+    projéteis usam velocidade negativa.
+
+    Protótipo usado só por ``bench_entity_store.py`` para comparar o layout
+    em colunas com as listas de objetos do jogo. O jogo não o usa: com as
+    poucas dezenas de entidades de uma partida normal as listas continuam
+    mais rápidas, e a vantagem só aparece com centenas de entidades.
+    """
+
+    def __init__(self, capacity, gap=0):
+        self.capacity = capacity
+        self.gap = gap
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.width = np.zeros(capacity, dtype=np.float64)
+        self.height = np.zeros(capacity, dtype=np.float64)
+        self.gap_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.scored = np.zeros(capacity, dtype=bool)
+        self.type_id = np.zeros(capacity, dtype=np.int32)
+
+        self._columns = (self.x, self.y, self.width, self.height,
+                         self.gap_y, self.speed, self.scored, self.type_id)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x, y, width, height, speed, type_id=0, gap_y=0):
+        """Adiciona uma entidade; retorna seu índice, ou -1 se a capacidade estiver esgotada"""
+        if self.count >= self.capacity:
+            return -1
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.width[i] = width
+        self.height[i] = height
+        self.gap_y[i] = gap_y
+        self.speed[i] = speed
+        self.scored[i] = False
+        self.type_id[i] = type_id
+        self.count += 1
+        return i
+
+    def clear(self):
+        """Remove todas as entidades"""
+        self.count = 0
+
+    def update(self, dt=1.0):
+        """Move todas as entidades de acordo com a velocidade"""
+        n = self.count
+        self.x[:n] -= self.speed[:n] * dt
+
+    def score(self, threshold_x):
+        """Marca como pontuadas as entidades que passaram de threshold_x; retorna quantas"""
+        n = self.count
+        passed = ~self.scored[:n] & (self.x[:n] + self.width[:n] < threshold_x)
+        self.scored[:n] |= passed
+        return int(np.count_nonzero(passed))
+
+    def cull(self, min_x, max_x=np.inf):
+        """Remove as entidades totalmente fora do intervalo [min_x, max_x); retorna quantas"""
+        n = self.count
+        keep = (self.x[:n] + self.width[:n] > min_x) & (self.x[:n] < max_x)
+        return self._keep(keep)
+
+    def remove(self, indices):
+        """Remove as entidades dos índices informados, preservando a ordem das demais"""
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        return self._keep(keep)
+
+    def _keep(self, keep):
+        """Compacta as colunas mantendo só as linhas marcadas, na mesma ordem"""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return 0
+        for column in self._columns:
+            column[:kept] = column[:n][keep]
+        self.count = kept
+        return n - kept
+
+    def hits(self, left, top, right, bottom):
+        """Índices das entidades que sobrepõem o retângulo [left, right) x [top, bottom)"""
+        n = self.count
+        x = self.x[:n]
+        overlap = (x < right) & (x + self.width[:n] > left)
+        if self.gap:
+            # Colunas: atinge a parte superior acima do vão ou a inferior abaixo dele
+            half_gap = self.gap // 2
+            gap_y = self.gap_y[:n]
+            overlap &= (top < gap_y - half_gap) | (bottom > gap_y + half_gap)
+        else:
+            y = self.y[:n]
+            overlap &= (y < bottom) & (y + self.height[:n] > top)
+        return np.flatnonzero(overlap)
+
+    def draw(self, screen, sprites):
+        """Desenha as entidades a partir das colunas.
+
+        ``sprites`` é indexado pelo tipo: uma superfície por tipo para caixas,
+        ou um par (superior, inferior) por tipo para colunas com vão.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        xs = self.x[:n].astype(np.int32).tolist()
+        types = self.type_id[:n].tolist()
+        if self.gap:
+            half_gap = self.gap // 2
+            gap_ys = self.gap_y[:n].astype(np.int32).tolist()
+            blits = []
+            for x, gap_y, type_id in zip(xs, gap_ys, types):
+                top, bottom = sprites[type_id]
+                blits.append((top, (x, gap_y - half_gap - top.get_height())))
+                blits.append((bottom, (x, gap_y + half_gap)))
+        else:
+            ys = self.y[:n].astype(np.int32).tolist()
+            blits = [(sprites[type_id], (x, y)) for x, y, type_id in zip(xs, ys, types)]
+        screen.blits(blits, doreturn=False)
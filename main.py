@@ -5,12 +5,48 @@ Project Violetnova: Explorador do Sistema Solar - Ponto de Entrada Principal
 Este script inicia o jogo de exploração do Sistema Solar.
 """
 
+import argparse
 import os
 import sys
 
+def parse_args():
+    """Lê as opções de linha de comando"""
+    parser = argparse.ArgumentParser(description="Project Violetnova: Explorador do Sistema Solar")
+    parser.add_argument("--headless", action="store_true",
+                        help="roda sem janela e sem som (também ativado por VIOLETNOVA_HEADLESS=1)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="quadros simulados no modo headless (padrão: 3600, ou a duração do replay)")
+    parser.add_argument("--no-draw", action="store_true",
+                        help="no modo headless, não executa o desenho da interface")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="semente dos geradores aleatórios, para execuções reproduzíveis")
+    parser.add_argument("--record", metavar="ARQUIVO", default=None,
+                        help="grava as entradas da partida em um arquivo de replay")
+    parser.add_argument("--replay", metavar="ARQUIVO", default=None,
+                        help="reproduz um arquivo de replay no modo headless (usa a semente gravada)")
+    args = parser.parse_args()
+
+    # Replays sempre rodam no modo headless
+    from src.headless import headless_requested
+    args.headless = args.headless or bool(args.replay) or headless_requested()
+    if not args.headless and (args.frames is not None or args.no_draw):
+        parser.error("--frames e --no-draw só valem no modo headless (use --headless)")
+    # O modo headless não recebe entradas e começa já jogando, sem a tela inicial
+    # de onde os replays partem: uma gravação feita nele não seria reproduzível
+    if args.record and args.headless:
+        parser.error("--record só vale em partidas interativas (não com --headless, --replay ou VIOLETNOVA_HEADLESS)")
+    return args
+
 def main():
     """Ponto de entrada principal para o jogo"""
+    args = parse_args()
     print("Iniciando Project Violetnova: Explorador do Sistema Solar...")
+
+    # Os drivers dummy do SDL precisam ser configurados antes do pygame iniciar
+    from src.headless import use_dummy_drivers
+    headless = args.headless
+    if headless:
+        use_dummy_drivers()
     
     # Verifica se os requisitos estão instalados
     try:
@@ -22,7 +58,8 @@ def main():
     
     # Inicia o jog
     import src.main 
-    src.main.main()
+    src.main.main(headless=headless, frames=args.frames, draw=not args.no_draw, seed=args.seed,
+                  record=args.record, replay=args.replay)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,50 @@
+import pygame
+
+
+class PlanetBackgroundCache:
+    """Cache do fundo composto de cada planeta.
+
+    O céu do planeta (``ceu_*.png``) é ladrilhado uma única vez em uma
+    superfície do tamanho da tela, convertida para o formato do display sem
+    alfa (os céus são opacos), de modo que redesenhar o fundo custa um único
+    blit. A superfície tem uma margem extra à direita e embaixo para que o
+    deslocamento do tremor de tela não revele bordas vazias.
+    """
+
+    SPACE_COLOR = (0, 0, 20)  # Cor do espaço por trás do céu
+    SHAKE_MARGIN = 8  # Deslocamento máximo do tremor de tela (pixels)
+
+    def __init__(self):
+        # (nome do planeta, (largura, altura)) -> superfície composta
+        self._layers = {}
+
+    def get(self, planet, screen_size):
+        """Obtém o fundo composto do planeta, ou ``None`` se ele não tiver céu"""
+        if not planet.background_image:
+            return None
+
+        key = (planet.name, tuple(screen_size))
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._compose(planet.background_image, screen_size)
+            self._layers[key] = layer
+        return layer
+
+    def clear(self):
+        """Descarta todos os fundos compostos (ex.: ao mudar a resolução)"""
+        self._layers.clear()
+
+    def _compose(self, background_image, screen_size):
+        """Ladrilha o céu em uma única superfície opaca"""
+        width = screen_size[0] + self.SHAKE_MARGIN
+        height = screen_size[1] + self.SHAKE_MARGIN
+        layer = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(self.SPACE_COLOR)
+
+        bg_width, bg_height = background_image.get_size()
+        for y in range(0, height, bg_height):
+            for x in range(0, width, bg_width):
+                layer.blit(background_image, (x, y))
+        return layer
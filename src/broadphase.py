@@ -0,0 +1,66 @@
+class SweepAndPrune:
+    """Broadphase de colisão em um eixo: entidades ordenadas pela borda esquerda (x).
+
+    A ordem é mantida de forma incremental: ``insert`` usa busca binária para
+    posicionar a entidade nova e ``compact`` retira as mortas no próprio
+    lugar. Como todos os obstáculos de uma fase se movem com a mesma
+    velocidade, a ordem relativa não muda entre quadros e não é preciso
+    reordenar. ``query`` devolve apenas as entidades cujo intervalo em x pode
+    sobrepor o intervalo consultado; o teste exato fica com quem consulta.
+    """
+
+    def __init__(self, max_width):
+        # Largura máxima das entidades, usada para achar as que começam à esquerda
+        self.max_width = max_width
+        self.entities = []
+
+    def __len__(self):
+        return len(self.entities)
+
+    def _lower_bound(self, x):
+        """Primeiro índice cuja borda esquerda é >= x"""
+        entities = self.entities
+        low, high = 0, len(entities)
+        while low < high:
+            middle = (low + high) // 2
+            if entities[middle].x < x:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _upper_bound(self, x):
+        """Primeiro índice cuja borda esquerda é > x"""
+        entities = self.entities
+        low, high = 0, len(entities)
+        while low < high:
+            middle = (low + high) // 2
+            if entities[middle].x <= x:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def insert(self, entity):
+        """Insere uma entidade mantendo a ordenação por x"""
+        self.entities.insert(self._upper_bound(entity.x), entity)
+
+    def compact(self):
+        """Remove as entidades mortas (``alive`` falso) sem criar listas novas"""
+        entities = self.entities
+        write = 0
+        for entity in entities:
+            if entity.alive:
+                entities[write] = entity
+                write += 1
+        del entities[write:]
+
+    def clear(self):
+        """Remove todas as entidades"""
+        self.entities.clear()
+
+    def query(self, left, right):
+        """Retorna as entidades cujo intervalo [x, x + max_width) sobrepõe [left, right)"""
+        start = self._upper_bound(left - self.max_width)
+        end = self._lower_bound(right)
+        return self.entities[start:end]
@@ -1,5 +1,17 @@
 import pygame
-import random
+from src.rng import gameplay_random
+from src.font_registry import get_font
+
+def _weapon_star_points(width, height):
+    """Calcula (uma única vez) os vértices da estrela do colecionável de arma"""
+    points = []
+    for i in range(10):
+        radius = width//2 if i % 2 == 0 else width//4
+        points.append((
+            width//2 + int(radius * 0.9 * (0 if i % 2 != 0 else 1) * 0.8 * (0.5 if i == 0 else 1) * (0.5 if i == 4 else 1) * (0.6 if i == 6 else 1) * (0.7 if i == 8 else 1) * (0.8 if i == 2 else 1) * (-1 if i > 5 else 1)),
+            height//2 + int(radius * 0.9 * (0 if i % 2 != 0 else 1) * 0.8 * (0.5 if i == 2 else 1) * (0.5 if i == 6 else 1) * (0.6 if i == 0 else 1) * (0.7 if i == 8 else 1) * (0.8 if i == 4 else 1) * (-1 if i > 7 or i < 3 else 1))
+        ))
+    return points
 
 class Collectible:
     WIDTH = 30
@@ -23,10 +35,25 @@ class Collectible:
             "effect": "life"  # Adiciona uma vida extra
         }
     }
+
+    # Vértices da estrela da arma, calculados uma vez
+    WEAPON_STAR_POINTS = _weapon_star_points(WIDTH, HEIGHT)
+
+    # Superfícies compartilhadas por variante: (tipo, tem dica de quiz) -> superfície
+    SURFACE_CACHE = {}
     
     def __init__(self, x, y, collectible_type=None, quiz_index=None):
+        # Retângulo de colisão persistente, atualizado no lugar quando o item se move
+        self.rect = pygame.Rect(x, y, self.WIDTH, self.HEIGHT)
+        self.reset(x, y, collectible_type, quiz_index)
+
+    def reset(self, x, y, collectible_type=None, quiz_index=None):
+        """(Re)inicializa o item; usado pelo construtor e pelo pool de entidades"""
         self.x = x
         self.y = y
+        self.prev_x = x  # Posição no passo de simulação anterior, para interpolar o desenho
+        self.rect.x = x
+        self.rect.y = y
         self.collected = False
         self.animation_counter = 0
         self.bob_offset = 0  # Para animação flutuante
@@ -35,84 +62,87 @@ class Collectible:
         # Seleciona aleatoriamente o tipo de colecionável se não especificado
         if collectible_type is None or collectible_type not in self.TYPES:
             # Padrão para tipos disponíveis (dados ou arma)
-            collectible_type = random.choice(list(self.TYPES.keys()))
+            collectible_type = gameplay_random.choice(list(self.TYPES.keys()))
         self.type = collectible_type
         self.properties = self.TYPES[self.type]
         
-        # Cria superfície do colecionável
-        self.create_collectible_surface()
+        # Superfície compartilhada com os outros itens da mesma variante
+        self.surface = self.get_surface(self.type, self.quiz_index is not None)
+
+    @classmethod
+    def get_surface(cls, collectible_type, has_hint=False):
+        """Obtém a superfície do tipo de colecionável, desenhando-a na primeira vez"""
+        key = (collectible_type, has_hint)
+        surface = cls.SURFACE_CACHE.get(key)
+        if surface is None:
+            surface = cls._create_surface(collectible_type, has_hint)
+            cls.SURFACE_CACHE[key] = surface
+        return surface
     
-    def create_collectible_surface(self):
-        self.surface = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-        self.surface.fill((0, 0, 0, 0))  # Fundo transparente
-        
-        color = self.properties["color"]
+    @classmethod
+    def _create_surface(cls, collectible_type, has_hint):
+        surface = pygame.Surface((cls.WIDTH, cls.HEIGHT), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))  # Fundo transparente
         
+        color = cls.TYPES[collectible_type]["color"]
+
         # Formas diferentes baseadas no tipo de colecionável
-        if self.type == "data":
+        if collectible_type == "data":
             # Módulo de dados (hexágono com detalhes internos)
-            pygame.draw.polygon(self.surface, color, [
-                (self.WIDTH//2, 0),                    # Topo
-                (self.WIDTH, self.HEIGHT//4),         # Canto superior direito
-                (self.WIDTH, self.HEIGHT*3//4),       # Canto inferior direito
-                (self.WIDTH//2, self.HEIGHT),         # Base
-                (0, self.HEIGHT*3//4),               # Canto inferior esquerdo
-                (0, self.HEIGHT//4)                  # Canto superior esquerdo
+            pygame.draw.polygon(surface, color, [
+                (cls.WIDTH//2, 0),                    # Topo
+                (cls.WIDTH, cls.HEIGHT//4),         # Canto superior direito
+                (cls.WIDTH, cls.HEIGHT*3//4),       # Canto inferior direito
+                (cls.WIDTH//2, cls.HEIGHT),         # Base
+                (0, cls.HEIGHT*3//4),               # Canto inferior esquerdo
+                (0, cls.HEIGHT//4)                  # Canto superior esquerdo
             ])
             # Detalhes internos
-            pygame.draw.circle(self.surface, (255, 255, 255), 
-                             (self.WIDTH//2, self.HEIGHT//2), self.WIDTH//4)
-            pygame.draw.lines(self.surface, (0, 0, 0), False, [
-                (self.WIDTH//4, self.HEIGHT//2),
-                (self.WIDTH*3//4, self.HEIGHT//2)
+            pygame.draw.circle(surface, (255, 255, 255), 
+                             (cls.WIDTH//2, cls.HEIGHT//2), cls.WIDTH//4)
+            pygame.draw.lines(surface, (0, 0, 0), False, [
+                (cls.WIDTH//4, cls.HEIGHT//2),
+                (cls.WIDTH*3//4, cls.HEIGHT//2)
             ], 2)
-            pygame.draw.lines(self.surface, (0, 0, 0), False, [
-                (self.WIDTH//2, self.HEIGHT//4),
-                (self.WIDTH//2, self.HEIGHT*3//4)
+            pygame.draw.lines(surface, (0, 0, 0), False, [
+                (cls.WIDTH//2, cls.HEIGHT//4),
+                (cls.WIDTH//2, cls.HEIGHT*3//4)
             ], 2)
             # Ícone de dica de quiz (apenas se for um colecionável de dados com quiz)
-            if self.quiz_index is not None:
-                font = pygame.font.Font(None, 18)
+            if has_hint:
+                font = get_font(18)
                 text = font.render("?", True, (0, 0, 0))
-                text_rect = text.get_rect(center=(self.WIDTH//2, self.HEIGHT//2))
-                self.surface.blit(text, text_rect)
+                text_rect = text.get_rect(center=(cls.WIDTH//2, cls.HEIGHT//2))
+                surface.blit(text, text_rect)
             
-        elif self.type == "fuel":
+        elif collectible_type == "fuel":
             # Contêiner de combustível (cilindro)
-            pygame.draw.rect(self.surface, color, 
-                           (self.WIDTH//4, self.HEIGHT//6, self.WIDTH//2, self.HEIGHT*2//3))
-            pygame.draw.ellipse(self.surface, color,
-                              (self.WIDTH//4, self.HEIGHT//6 - self.HEIGHT//12, 
-                               self.WIDTH//2, self.HEIGHT//6))
-            pygame.draw.ellipse(self.surface, color,
-                              (self.WIDTH//4, self.HEIGHT*5//6 - self.HEIGHT//12, 
-                               self.WIDTH//2, self.HEIGHT//6))
+            pygame.draw.rect(surface, color, 
+                           (cls.WIDTH//4, cls.HEIGHT//6, cls.WIDTH//2, cls.HEIGHT*2//3))
+            pygame.draw.ellipse(surface, color,
+                              (cls.WIDTH//4, cls.HEIGHT//6 - cls.HEIGHT//12, 
+                               cls.WIDTH//2, cls.HEIGHT//6))
+            pygame.draw.ellipse(surface, color,
+                              (cls.WIDTH//4, cls.HEIGHT*5//6 - cls.HEIGHT//12, 
+                               cls.WIDTH//2, cls.HEIGHT//6))
             # Indicador de nível de combustível
-            pygame.draw.rect(self.surface, (255, 0, 0),
-                           (self.WIDTH*3//8, self.HEIGHT//3, self.WIDTH//4, self.HEIGHT//3))
+            pygame.draw.rect(surface, (255, 0, 0),
+                           (cls.WIDTH*3//8, cls.HEIGHT//3, cls.WIDTH//4, cls.HEIGHT//3))
             
-        elif self.type == "weapon":
+        elif collectible_type == "weapon":
             # Arma (forma de estrela)
-            points = []
-            for i in range(10):
-                angle = 2 * 3.14159 * i / 10
-                radius = self.WIDTH//2 if i % 2 == 0 else self.WIDTH//4
-                points.append((
-                    self.WIDTH//2 + int(radius * 0.9 * (0 if i % 2 != 0 else 1) * 0.8 * (0.5 if i == 0 else 1) * (0.5 if i == 4 else 1) * (0.6 if i == 6 else 1) * (0.7 if i == 8 else 1) * (0.8 if i == 2 else 1) * (-1 if i > 5 else 1)),
-                    self.HEIGHT//2 + int(radius * 0.9 * (0 if i % 2 != 0 else 1) * 0.8 * (0.5 if i == 2 else 1) * (0.5 if i == 6 else 1) * (0.6 if i == 0 else 1) * (0.7 if i == 8 else 1) * (0.8 if i == 4 else 1) * (-1 if i > 7 or i < 3 else 1))
-                ))
-            pygame.draw.polygon(self.surface, color, points)
+            pygame.draw.polygon(surface, color, cls.WEAPON_STAR_POINTS)
             # Círculo interno
-            pygame.draw.circle(self.surface, (255, 255, 255),
-                             (self.WIDTH//2, self.HEIGHT//2), self.WIDTH//6)
+            pygame.draw.circle(surface, (255, 255, 255),
+                             (cls.WIDTH//2, cls.HEIGHT//2), cls.WIDTH//6)
                              
-        elif self.type == "life":
+        elif collectible_type == "life":
             # Vida (forma de coração)
-            center_x, center_y = self.WIDTH//2, self.HEIGHT//2 - 2
+            center_x, center_y = cls.WIDTH//2, cls.HEIGHT//2 - 2
             
             # Desenha as duas partes superiores do coração
-            pygame.draw.circle(self.surface, color, (center_x - 6, center_y - 3), 8)
-            pygame.draw.circle(self.surface, color, (center_x + 6, center_y - 3), 8)
+            pygame.draw.circle(surface, color, (center_x - 6, center_y - 3), 8)
+            pygame.draw.circle(surface, color, (center_x + 6, center_y - 3), 8)
             
             # Desenha a parte inferior do coração
             points = [
@@ -121,36 +151,43 @@ class Collectible:
                 (center_x + 14, center_y + 1),
                 (center_x, center_y - 2)
             ]
-            pygame.draw.polygon(self.surface, color, points)
+            pygame.draw.polygon(surface, color, points)
             
             # Adiciona um brilho no coração
-            pygame.draw.circle(self.surface, (255, 255, 255), 
+            pygame.draw.circle(surface, (255, 255, 255), 
                              (center_x - 4, center_y - 3), 3)
-    
+
+        return surface
+
     def update(self):
         # Animação flutuante
         self.animation_counter += 0.1
         self.bob_offset = int(3 * (0.5 - 0.5 * (self.animation_counter % 1)))
         
-    def draw(self, screen):
+    def move(self, dx):
+        """Desloca o item na horizontal, mantendo o retângulo de colisão em dia"""
+        self.prev_x = self.x
+        self.x += dx
+        self.rect.x = self.x
+
+    def draw(self, screen, alpha=1.0):
+        """Desenha o item e retorna a região da tela alterada.
+
+        ``alpha`` interpola entre a posição do passo de simulação anterior (0) e a atual (1).
+        """
         if not self.collected:
+            x = self.prev_x + (self.x - self.prev_x) * alpha
             # Aplica deslocamento para efeito flutuante
-            screen.blit(self.surface, (self.x, self.y + self.bob_offset))
+            return screen.blit(self.surface, (x, self.y + self.bob_offset))
+        return None
     
     def check_collision(self, spacecraft):
         """Verifica se a nave espacial coletou este item"""
         if self.collected:
             return False
             
-        # Colisão simples de retângulo
-        # Ajusta x para centralizar a hitbox dentro do sprite visual, se necessário
-        spacecraft_hitbox_x = spacecraft.x + spacecraft.flame_extent + (spacecraft.WIDTH - spacecraft.HITBOX_WIDTH) / 2
-        spacecraft_hitbox_y = spacecraft.y + (spacecraft.HEIGHT - spacecraft.HITBOX_HEIGHT) / 2
-
-        spacecraft_rect = pygame.Rect(spacecraft_hitbox_x, spacecraft_hitbox_y, spacecraft.HITBOX_WIDTH, spacecraft.HITBOX_HEIGHT)
-        collectible_rect = pygame.Rect(self.x, self.y, self.WIDTH, self.HEIGHT)
-        
-        if spacecraft_rect.colliderect(collectible_rect):
+        # Colisão simples de retângulo, com os retângulos persistentes
+        if spacecraft.update_hitbox().colliderect(self.rect):
             self.collected = True
             return True
         
@@ -1,4 +1,5 @@
 import src.config as config
+from src.swept_aabb import sweep_aabb
 from src.planet_data import LEVEL_PROGRESSION_THRESHOLDS, PLANET_NAME_PT
 
 class CollisionManager:
@@ -27,8 +28,9 @@ class CollisionManager:
         if self.game.current_planet.name != "Earth" and self.game.current_planet.name != "Mercury":
             floor_height = 60  # Ajusta a altura do chão para planetas depois de Mercúrio
             
-        if (spacecraft.y <= 0 or 
-            spacecraft.y + spacecraft.HITBOX_HEIGHT >= config.SCREEN_HEIGHT - floor_height):
+        # Considera todo o trajeto do quadro, não só a posição final
+        if (min(spacecraft.prev_y, spacecraft.y) <= 0 or 
+            max(spacecraft.prev_y, spacecraft.y) + spacecraft.HITBOX_HEIGHT >= config.SCREEN_HEIGHT - floor_height):
             
             return self.handle_collision("boundary")
         
@@ -39,33 +41,46 @@ class CollisionManager:
         spacecraft = self.game.spacecraft
         
         # Calcula a posição da hitbox da nave
-        spacecraft_body_x = spacecraft.x + spacecraft.flame_extent + (spacecraft.WIDTH - spacecraft.HITBOX_WIDTH) / 2
-        spacecraft_body_y = spacecraft.y + (spacecraft.HEIGHT - spacecraft.HITBOX_HEIGHT) / 2
-        
-        # Verifica cada obstáculo para colisão
-        for obstacle in self.game.obstacles:
+        offset_x = spacecraft.flame_extent + (spacecraft.WIDTH - spacecraft.HITBOX_WIDTH) / 2
+        offset_y = (spacecraft.HEIGHT - spacecraft.HITBOX_HEIGHT) / 2
+        spacecraft_body_x = spacecraft.x + offset_x
+        spacecraft_body_y = spacecraft.y + offset_y
+        # Posição da hitbox no início do quadro, para o teste contínuo (swept AABB)
+        previous_body_x = spacecraft.prev_x + offset_x
+        previous_body_y = spacecraft.prev_y + offset_y
+        delta_y = spacecraft_body_y - previous_body_y
+        
+        # Verifica apenas os obstáculos que podem sobrepor o trajeto da nave em x
+        candidates = self.game.obstacle_index.query(
+            min(previous_body_x - self.game.obstacle_speed, spacecraft_body_x),
+            max(previous_body_x, spacecraft_body_x) + spacecraft.HITBOX_WIDTH
+        )
+        for obstacle in candidates:
             # Determina se está usando sprites e obtém a largura
             using_sprites = hasattr(obstacle, 'using_sprites') and obstacle.using_sprites
             obstacle_width = obstacle.top_width if using_sprites else obstacle.WIDTH
             
-            # Verifica sobreposição horizontal
-            horizontal_overlap = (
-                spacecraft_body_x + spacecraft.HITBOX_WIDTH > obstacle.x and
-                spacecraft_body_x < obstacle.x + obstacle_width
-            )
+            # No referencial do obstáculo, que também se moveu para a esquerda neste quadro
+            start_x = previous_body_x - obstacle.speed
+            delta_x = spacecraft_body_x - start_x
+            obstacle_right = obstacle.x + obstacle_width
+
+            # Calcula os limites do gap
+            upper_gap_limit = obstacle.gap_y - obstacle.GAP // 2
+            lower_gap_limit = obstacle.gap_y + obstacle.GAP // 2
             
-            if horizontal_overlap:
-                # Calcula os limites do gap
-                upper_gap_limit = obstacle.gap_y - obstacle.GAP // 2
-                lower_gap_limit = obstacle.gap_y + obstacle.GAP // 2
-                
-                # Verifica colisão com o obstáculo superior
-                if spacecraft_body_y < upper_gap_limit:
-                    return self.handle_collision("obstacle", obstacle, "upper")
-                
-                # Verifica colisão com o obstáculo inferior
-                if spacecraft_body_y + spacecraft.HITBOX_HEIGHT > lower_gap_limit:
-                    return self.handle_collision("obstacle", obstacle, "lower")
+            # Verifica colisão com o obstáculo superior ao longo do trajeto
+            upper_hit = sweep_aabb(start_x, previous_body_y, spacecraft.HITBOX_WIDTH, spacecraft.HITBOX_HEIGHT,
+                                   delta_x, delta_y, obstacle.x, float("-inf"), obstacle_right, upper_gap_limit)
+            # Verifica colisão com o obstáculo inferior ao longo do trajeto
+            lower_hit = sweep_aabb(start_x, previous_body_y, spacecraft.HITBOX_WIDTH, spacecraft.HITBOX_HEIGHT,
+                                   delta_x, delta_y, obstacle.x, lower_gap_limit, obstacle_right, float("inf"))
+
+            # Em caso de dois contatos, vale o que aconteceu primeiro
+            if upper_hit is not None and (lower_hit is None or upper_hit <= lower_hit):
+                return self.handle_collision("obstacle", obstacle, "upper")
+            if lower_hit is not None:
+                return self.handle_collision("obstacle", obstacle, "lower")
         
         return False
     
@@ -140,15 +155,23 @@ class CollisionManager:
     
     def check_collectible_collisions(self):
         """Verifica e lida com colisões com coletáveis"""
-        spacecraft = self.game.spacecraft
-        
-        for collectible in list(self.game.collectibles):
-            # Verifica colisão
-            if collectible.check_collision(spacecraft):
-                self._handle_collectible_effect(collectible)
+        # Hitbox da nave calculada uma vez e testada contra todos os itens em uma chamada
+        hitbox = self.game.spacecraft.update_hitbox()
+        collectibles = self.game.collectibles
+        
+        for index in hitbox.collidelistall(collectibles):
+            # O efeito de um item pode reiniciar a fase e esvaziar a lista
+            if index >= len(collectibles):
+                break
+            collectible = collectibles[index]
+            if not collectible.alive or collectible.collected:
+                continue
+            collectible.collected = True
+            self._handle_collectible_effect(collectible)
                 
-                # Remove o item coletado
-                self.game.collectibles.remove(collectible)
+            # Devolve o item coletado ao pool
+            self.game.collectible_pool.release(collectible)
+        self.game.collectible_pool.compact()
     
     def _handle_collectible_effect(self, collectible):
         """Aplica o efeito de um item coletado"""
@@ -5,6 +5,17 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FLOOR_HEIGHT = 80
 
+# Laço de simulação com passo fixo: a física e os temporizadores em
+# quadros rodam sempre a SIMULATION_HZ, independente da taxa de desenho
+SIMULATION_HZ = 60
+SIMULATION_STEP_MS = 1000 / SIMULATION_HZ
+RENDER_FPS = 60  # Limite de quadros desenhados por segundo (0 = sem limite)
+MAX_UPDATES_PER_FRAME = 5  # Passos de recuperação por quadro antes de descartar o atraso
+
+# Modo headless (sem janela e sem som), ativado por main.py com --headless
+# ou com a variável de ambiente VIOLETNOVA_HEADLESS=1
+HEADLESS = False
+
 # Estados do jogo
 SPLASH = 0
 MENU = 1
@@ -30,6 +41,34 @@ GAME_FONT_SIZE = 36
 SMALL_FONT_SIZE = 24
 COUNTDOWN_FONT_SIZE = 180
 
+# Registro de fontes: tamanhos até o limite são exatos, acima são agrupados em faixas
+FONT_EXACT_SIZE_LIMIT = 48
+FONT_SIZE_BUCKET = 6
+
+# Número máximo de superfícies de texto mantidas no cache LRU
+TEXT_CACHE_SIZE = 256
+
+# Passo de quantização do alfa das sobreposições animadas (flash de dano)
+OVERLAY_ALPHA_STEP = 16
+
+# Passo de quantização da escala dos textos com brilho pulsantes (contagem regressiva)
+GLOW_TEXT_SCALE_STEP = 0.05
+
+# Modo de retângulos sujos: apresenta apenas as regiões alteradas nos estados quase estáticos
+DIRTY_RECTS_ENABLED = False
+DIRTY_RECTS_FULL_THRESHOLD = 0.6  # Fração da tela acima da qual usa um flip completo
+DIRTY_RECTS_SHOW_COVERAGE = False  # Mostra a fração da tela atualizada por quadro
+
+# Cache de quadros da Violet (escala de foco/pulso e cor da expressão quantizadas)
+VIOLET_SCALE_STEPS = 32
+VIOLET_COLOR_STEPS = 4
+VIOLET_FRAME_CACHE_SIZE = 64
+
+# Cache de sprites da NOVA (pulsação e mistura de cores quantizadas)
+NOVA_PULSE_STEP = 0.025
+NOVA_BLEND_STEPS = 5
+NOVA_SPRITE_CACHE_SIZE = 128
+
 # Dicionários de tradução
 PLANET_NAME_PT = {
     "Earth": "Terra",
@@ -50,9 +89,14 @@ THRUST_SOUND_VOLUME = 0.1  # Volume reduzido para o som do propulsor
 HIT_SOUND_VOLUME = 0.1     # Volume reduzido para o som de colisão (igual ao propulsor)
 SOUND_FADEOUT_TIME = 500  # ms
 
+# Campo de estrelas do fundo
+STAR_COUNT = 100
+STAR_PARALLAX_LAYERS = 1  # Camadas de paralaxe (1 = estrelas estáticas)
+
 # Parâmetros da espaçonave
 SPACECRAFT_MAX_LIVES = 3
-SPACECRAFT_INVULNERABILITY_TIME = 90  # quadros (1.5s a 60fps)
+SPACECRAFT_INVULNERABILITY_TIME = int(1.5 * SIMULATION_HZ)  # passos de simulação (1.5s)
+SPACECRAFT_ROTATION_STEP = 3  # graus entre os sprites pré-rotacionados da nave
 
 # Configurações do menu
 MENU_OPTIONS = ["Jogar", "Dificuldade", "Player de Música", "Diálogo Demo", "Créditos", "Sair"]
@@ -68,14 +112,17 @@ DEFAULT_OBSTACLE_SPAWN_RATE = 2500  # ms
 DEFAULT_COLLECTIBLE_SPAWN_RATE = 3000  # ms
 
 # Duração da transição
-TRANSITION_DURATION = 180  # quadros (3s a 60fps)
+TRANSITION_DURATION = 3 * SIMULATION_HZ  # passos de simulação (3s)
+# Pré-carrega a imagem de transição do próximo planeta durante o quiz
+TRANSITION_IMAGE_WARM_UP = True
 
 # Duração da arma
-WEAPON_DURATION = 600  # quadros (10s a 60fps)
+WEAPON_DURATION = 10 * SIMULATION_HZ  # passos de simulação (10s)
 
 # Durações do quiz
-QUIZ_DURATION = 600  # quadros (10s a 60fps)
-QUIZ_RESULT_DURATION = 120  # quadros (2s a 60fps)
+QUIZ_DURATION = 10 * SIMULATION_HZ  # passos de simulação (10s)
+QUIZ_RESULT_DURATION = 2 * SIMULATION_HZ  # passos de simulação (2s)
+QUIZ_FAILURE_DURATION = 3 * SIMULATION_HZ  # contagem regressiva após errar o quiz (3s)
 
 # ================================
 # Configurações de dificuldade
@@ -2,6 +2,10 @@ import pygame
 import math
 import os
 import src.config as config
+from src.font_registry import get_font
+from src.text_cache import render_text
+from src.overlay_cache import get_overlay
+from src.rng import cosmetic_random
 
 class DialogueManager:
     def __init__(self, game):
@@ -112,9 +116,8 @@ class DialogueManager:
                         self.game.nova.start_radio_signal(audio.get_length() * 1000)
         elif speaker == "Violet":
             # Para a Violet, utilizamos um áudio aleatório de miau
-            import random
             if self.violet_audio_files:
-                audio = random.choice(self.violet_audio_files)
+                audio = cosmetic_random.choice(self.violet_audio_files)
                 if audio:
                     audio.play()
                     self.current_audio = audio
@@ -217,9 +220,7 @@ class DialogueManager:
     def draw_background(self, screen):
         """Desenha o fundo e a caixa de diálogo"""
         # Sobreposição semitransparente para o fundo
-        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((0, 0, 0), 160), (0, 0))
     
     def draw_text(self, screen):
         """Desenha o texto do diálogo e elementos da interface"""
@@ -265,7 +266,7 @@ class DialogueManager:
             )
             
             # Nome do personagem
-            name_text = config.SMALL_FONT.render(current["speaker"], True, (255, 255, 255))
+            name_text = render_text(config.SMALL_FONT, current["speaker"], True, (255, 255, 255))
             screen.blit(
                 name_text, 
                 (name_box_x + name_box_width//2 - name_text.get_width()//2, 
@@ -274,7 +275,7 @@ class DialogueManager:
         
         # Desenha o texto do diálogo
         text_padding = 20
-        font = pygame.font.Font(None, 28)
+        font = get_font(28)
         
         # Trata texto multilinha quebrando
         words = self.displayed_text.split(' ')
@@ -296,12 +297,16 @@ class DialogueManager:
         
         # Desenha cada linha
         for i, line in enumerate(lines):
-            line_surf = font.render(line, True, (255, 255, 255))
+            if self.text_complete:
+                line_surf = render_text(font, line, True, (255, 255, 255))
+            else:
+                # Linhas ainda em digitação mudam a cada quadro, sem cache
+                line_surf = font.render(line, True, (255, 255, 255))
             screen.blit(line_surf, (40, box_y + text_padding + (i * 30)))
             
         # Desenha o indicador "continuar" se o texto estiver completo
         if self.text_complete:
-            continue_text = config.SMALL_FONT.render("Pressione ESPAÇO para continuar", True, (200, 200, 255))
+            continue_text = render_text(config.SMALL_FONT, "Pressione ESPAÇO para continuar", True, (200, 200, 255))
             
             # Adiciona efeito de pulsação
             alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.005))
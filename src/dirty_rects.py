@@ -0,0 +1,106 @@
+import pygame
+import src.config as config
+
+
+class DirtyRectTracker:
+    """Acompanha as regiões da tela alteradas em cada quadro.
+
+    No modo de retângulos sujos, os caminhos de desenho informam as áreas
+    animadas com ``mark`` e o quadro é apresentado com
+    ``pygame.display.update(retângulos)``, incluindo as áreas do quadro
+    anterior (para apagar o que se moveu). Rolagem do fundo, tremor de tela,
+    mudanças de estado e entradas do jogador pedem ``mark_full``, que
+    apresenta o quadro inteiro com ``flip``. Com o modo desativado,
+    ``present`` equivale a ``pygame.display.flip()``.
+    """
+
+    def __init__(self, enabled=config.DIRTY_RECTS_ENABLED, full_threshold=config.DIRTY_RECTS_FULL_THRESHOLD):
+        self.enabled = enabled
+        # Fração da tela acima da qual um flip completo é mais barato
+        self.full_threshold = full_threshold
+        self._rects = []
+        self._previous_rects = []
+        self._full = True
+
+        # Estatísticas de cobertura
+        self.frames = 0
+        self.full_frames = 0
+        self.last_coverage = 1.0
+        self._coverage_total = 0.0
+
+    def mark(self, rect):
+        """Registra uma região alterada neste quadro"""
+        if self.enabled and rect:
+            self._rects.append(pygame.Rect(rect))
+
+    def mark_full(self):
+        """Pede que o quadro inteiro seja apresentado"""
+        self._full = True
+
+    def present(self):
+        """Apresenta o quadro atual e prepara o próximo"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+
+        screen = pygame.display.get_surface()
+        screen_rect = screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in self._rects + self._previous_rects]
+        rects = self._merge([rect for rect in rects if rect.width and rect.height])
+
+        # Fração da tela coberta pelos retângulos (já sem sobreposições entre si)
+        screen_area = screen_rect.width * screen_rect.height
+        coverage = min(1.0, sum(rect.width * rect.height for rect in rects) / screen_area)
+
+        if self._full or coverage >= self.full_threshold:
+            pygame.display.flip()
+            coverage = 1.0
+            self.full_frames += 1
+        elif rects:
+            pygame.display.update(rects)
+
+        self.frames += 1
+        self.last_coverage = coverage
+        self._coverage_total += coverage
+
+        self._previous_rects = self._rects
+        self._rects = []
+        self._full = False
+
+    @staticmethod
+    def _merge(rects):
+        """Une retângulos sobrepostos para não atualizar a mesma área duas vezes"""
+        merged = []
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def get_stats(self):
+        """Retorna as estatísticas de cobertura da tela"""
+        return {
+            "enabled": self.enabled,
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "last_coverage": self.last_coverage,
+            "average_coverage": self._coverage_total / self.frames if self.frames else 0.0,
+        }
+
+    def reset_stats(self):
+        """Zera as estatísticas de cobertura"""
+        self.frames = 0
+        self.full_frames = 0
+        self.last_coverage = 1.0
+        self._coverage_total = 0.0
+
+
+# Rastreador padrão usado pelo loop principal
+dirty_rects = DirtyRectTracker()
+
+
+def mark_dirty(rect):
+    """Atalho para registrar uma região alterada no rastreador padrão"""
+    dirty_rects.mark(rect)
@@ -0,0 +1,72 @@
+class EntityPool:
+    """Pool de entidades reutilizáveis (obstáculos, colecionáveis, projéteis).
+
+    As entidades vivas ficam em ``active``, uma lista que nunca é substituída
+    (o jogo guarda referências a ela). ``acquire`` reaproveita uma entidade
+    livre chamando seu ``reset`` com os mesmos argumentos do construtor, e só
+    cria uma nova quando não há nenhuma livre. ``release`` apenas marca a
+    entidade como morta, então é seguro chamá-lo durante uma iteração sobre
+    ``active``; ``compact`` remove as mortas no próprio lugar e as devolve à
+    lista livre (e não faz nada nos quadros sem remoções). Um ``index``
+    opcional (como ``SweepAndPrune``) é mantido junto com ``active``.
+    """
+
+    def __init__(self, factory, index=None):
+        self.factory = factory
+        self.index = index
+        self.active = []
+        self._free = []
+        self._pending = 0  # Entidades marcadas por release e ainda não compactadas
+        # Quantas entidades já foram construídas (não reaproveitadas)
+        self.allocations = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def acquire(self, *args, **kwargs):
+        """Obtém uma entidade inicializada com os argumentos informados"""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(*args, **kwargs)
+        else:
+            entity = self.factory(*args, **kwargs)
+            self.allocations += 1
+        entity.alive = True
+        self.active.append(entity)
+        if self.index is not None:
+            self.index.insert(entity)
+        return entity
+
+    def release(self, entity):
+        """Marca uma entidade para ser devolvida ao pool no próximo ``compact``"""
+        if entity.alive:
+            entity.alive = False
+            self._pending += 1
+
+    def compact(self):
+        """Remove as entidades mortas de ``active`` sem criar listas novas"""
+        if not self._pending:
+            return
+
+        active = self.active
+        write = 0
+        for entity in active:
+            if entity.alive:
+                active[write] = entity
+                write += 1
+            else:
+                self._free.append(entity)
+        del active[write:]
+        self._pending = 0
+        if self.index is not None:
+            self.index.compact()
+
+    def release_all(self):
+        """Devolve todas as entidades vivas ao pool"""
+        for entity in self.active:
+            entity.alive = False
+        self._free.extend(self.active)
+        self.active.clear()
+        self._pending = 0
+        if self.index is not None:
+            self.index.clear()
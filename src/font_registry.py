@@ -0,0 +1,76 @@
+import pygame
+import src.config as config
+
+
+class FontRegistry:
+    """Registro central de fontes compartilhadas por tamanho.
+
+    Construir ``pygame.font.Font`` analisa o arquivo da fonte a cada chamada;
+    o registro cria cada tamanho uma única vez e devolve sempre o mesmo objeto.
+    Tamanhos grandes (como a contagem regressiva pulsante) são agrupados em
+    faixas para limitar o número de fontes criadas.
+    """
+
+    def __init__(self, bucket_size=config.FONT_SIZE_BUCKET, exact_limit=config.FONT_EXACT_SIZE_LIMIT):
+        self.bucket_size = max(1, bucket_size)
+        self.exact_limit = exact_limit
+        self._fonts = {}  # (arquivo, tamanho) -> pygame.font.Font
+
+        # Contadores de criação de fontes
+        self.fonts_created = 0
+        self.fonts_created_this_frame = 0
+        self.fonts_created_last_frame = 0
+        self.frames = 0
+
+    def bucket(self, size):
+        """Retorna o tamanho efetivo usado para um tamanho solicitado"""
+        size = max(1, int(size))
+        if size <= self.exact_limit:
+            return size
+        return int(round(size / self.bucket_size)) * self.bucket_size
+
+    def get(self, size, font_file=None):
+        """Obtém a fonte compartilhada para o tamanho (e arquivo) informado"""
+        key = (font_file, self.bucket(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(font_file, key[1])
+            self._fonts[key] = font
+            self.fonts_created += 1
+            self.fonts_created_this_frame += 1
+        return font
+
+    def begin_frame(self):
+        """Marca o início de um novo quadro para os contadores por quadro"""
+        self.fonts_created_last_frame = self.fonts_created_this_frame
+        self.fonts_created_this_frame = 0
+        self.frames += 1
+
+    def get_stats(self):
+        """Retorna as estatísticas de criação de fontes"""
+        return {
+            "fonts_cached": len(self._fonts),
+            "fonts_created": self.fonts_created,
+            "fonts_created_last_frame": self.fonts_created_last_frame,
+            "frames": self.frames,
+        }
+
+    def clear(self):
+        """Descarta todas as fontes (ex.: após reinicializar o pygame.font)"""
+        self._fonts.clear()
+
+
+# Registro padrão usado pelo jogo
+registry = FontRegistry()
+
+
+def get_font(size, font_file=None):
+    """Atalho para obter uma fonte do registro padrão"""
+    return registry.get(size, font_file)
+
+
+def init_fonts():
+    """Inicializa as fontes globais de ``config`` a partir do registro"""
+    config.GAME_FONT = get_font(config.GAME_FONT_SIZE)
+    config.SMALL_FONT = get_font(config.SMALL_FONT_SIZE)
+    config.COUNTDOWN_FONT = get_font(config.COUNTDOWN_FONT_SIZE)
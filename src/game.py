@@ -1,6 +1,10 @@
 import pygame
 import sys
 from src.spacecraft import Spacecraft
+from src.obstacle import Obstacle
+from src.collectible import Collectible
+from src.entity_pool import EntityPool
+from src.broadphase import SweepAndPrune
 from src.planet import Planet
 from src.highscore import PlanetTracker
 from src.nova_ai import NovaAI
@@ -11,7 +15,9 @@ from src.music_player import MusicPlayer
 
 # Import refactored modules
 import src.config as config
-from src.sound_manager import SoundManager
+from src import font_registry
+from src.game_loop import FixedTimestepLoop
+from src.sound_manager import SoundManager, SilentSoundManager
 from src.state_manager import StateManager
 from src.collision_manager import CollisionManager
 from src.visual_effects import VisualEffectsManager
@@ -65,29 +71,26 @@ class Game:
                       for data in self.planet_data]
 
         # Encontra o índice do planeta salvo e do mais distante
-        self.current_planet_index = 0
-        for i, planet in enumerate(self.planets):
-            if planet.name.lower() == self.last_planet.lower():
-                self.current_planet_index = i
-                break
-                
-        # Encontra o índice do planeta mais distante
-        for i, planet in enumerate(self.planets):
-            if planet.name.lower() == self.furthest_planet.lower():
-                self.furthest_planet_index = i
-                break
-        
-        self.current_planet = self.planets[self.current_planet_index]
+        self.apply_planet_progress(self.last_planet, self.furthest_planet)
 
         # Configuração da nave espacial
         self.spacecraft = Spacecraft(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
 
-        # Elementos do jogo
-        self.obstacles = []
-        self.collectibles = []
-        # Inicializa controle de tempo
-        self.last_obstacle_time = pygame.time.get_ticks() - 2000
-        self.last_collectible_time = pygame.time.get_ticks()
+        # Elementos do jogo, reaproveitados pelos pools (as listas nunca são substituídas)
+        # Obstáculos também ficam em um índice ordenado por x para as colisões
+        self.obstacle_index = SweepAndPrune(Obstacle.WIDTH)
+        self.obstacle_pool = EntityPool(Obstacle, self.obstacle_index)
+        self.collectible_pool = EntityPool(Collectible)
+        self.obstacles = self.obstacle_pool.active
+        self.collectibles = self.collectible_pool.active
+        # Inicializa controle de tempo (tempo de simulação, avança SIMULATION_STEP_MS por update)
+        self.sim_time_ms = 0.0
+        # Número de passos de simulação já executados (índice dos quadros nos replays)
+        self.sim_frame = 0
+        # Fração do passo de simulação já decorrida, para interpolar o desenho
+        self.render_alpha = 1.0
+        self.last_obstacle_time = self.sim_time_ms - 2000
+        self.last_collectible_time = self.sim_time_ms
         self.floor_x = 0
 
         # Temporização de obstáculos e colecionáveis
@@ -122,7 +125,7 @@ class Game:
         self.difficulty_multiplier = 1.0
 
         # Inicializa os gerenciadores
-        self.sound_manager = SoundManager()
+        self.sound_manager = SilentSoundManager() if config.HEADLESS else SoundManager()
         self.visual_effects = VisualEffectsManager(self)
         self.collision_manager = CollisionManager(self)
         self.ui_manager = UIManager(self)
@@ -133,6 +136,9 @@ class Game:
         # Inicializa o gerenciador de estado por último para evitar dependências circulares
         self.state_manager = StateManager(self)
 
+        # Pré-carrega a transição do planeta salvo, exibida ao iniciar o jogo
+        self.ui_manager.warm_up_transition(self.current_planet)
+
         # Inicializa o estado do jogo (usa o valor existente de _state)
         self.state_manager.change_state(config.SPLASH)
         
@@ -198,7 +204,7 @@ class Game:
             self.state_manager.change_state(config.TRANSITION)
             self.state = config.TRANSITION
             self.state_manager.welcome_sound_timer = 0  # Skip welcome sound timer
-            self.state_manager.transition_time = config.TRANSITION_DURATION - 60  # Set transition near end (1 second)
+            self.state_manager.transition_time = config.TRANSITION_DURATION - config.SIMULATION_HZ  # Set transition near end (1 second)
 
             # NOVA message about continuing on same planet
             from src.planet_data import PLANET_NAME_PT
@@ -288,14 +294,16 @@ class Game:
         # Reset spacecraft position
         self.spacecraft = Spacecraft(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
 
-        # Clear all obstacles and collectibles
-        self.obstacles = []
-        self.collectibles = []
+        # Clear all obstacles and collectibles (devolvendo-os aos pools)
+        self.obstacle_pool.release_all()
+        self.collectible_pool.release_all()
         if hasattr(self, 'weapon_system'):
-            self.weapon_system.projectiles = []
+            self.weapon_system.projectile_pool.release_all()
+        # Prepara as texturas de obstáculo do planeta antes do primeiro obstáculo
+        Obstacle.warm_up(self.current_planet.name, config.SCREEN_HEIGHT)
         # Initialize time tracking for immediate obstacle generation
-        self.last_obstacle_time = pygame.time.get_ticks() - 2000
-        self.last_collectible_time = pygame.time.get_ticks()
+        self.last_obstacle_time = self.sim_time_ms - 2000
+        self.last_collectible_time = self.sim_time_ms
         # Reset floor position
         self.floor_x = 0
 
@@ -361,8 +369,32 @@ class Game:
         """Retorna o estado atual de invulnerabilidade"""
         return self.invulnerable
 
+    def apply_planet_progress(self, last_planet, furthest_planet):
+        """Posiciona o jogo no planeta salvo e registra o mais distante alcançado"""
+        self.last_planet = last_planet
+        self.furthest_planet = furthest_planet
+
+        self.current_planet_index = 0
+        for i, planet in enumerate(self.planets):
+            if planet.name.lower() == last_planet.lower():
+                self.current_planet_index = i
+                break
+
+        # Encontra o índice do planeta mais distante
+        self.furthest_planet_index = 0
+        for i, planet in enumerate(self.planets):
+            if planet.name.lower() == furthest_planet.lower():
+                self.furthest_planet_index = i
+                break
+
+        self.current_planet = self.planets[self.current_planet_index]
+
     def update(self):
         try:
+            # Avança o relógio da simulação em um passo fixo
+            self.sim_time_ms += config.SIMULATION_STEP_MS
+            self.sim_frame += 1
+
             # Update visual effects if available
             if hasattr(self, 'visual_effects'):
                 self.visual_effects.update()
@@ -373,11 +405,11 @@ class Game:
 
             # Update welcome sound timer
             if hasattr(self, 'welcome_sound_timer') and self.welcome_sound_timer > 0:
-                self.welcome_sound_timer -= 16  # Approximately 16ms per frame at 60fps
+                self.welcome_sound_timer -= config.SIMULATION_STEP_MS  # One fixed simulation step
 
                 # Check if the user tries to skip the intro (by pressing space)
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_SPACE] and self.state == config.TRANSITION:
+                # (estado mantido pelo InputHandler, para valer também nos replays)
+                if self.input_handler.is_pressed(pygame.K_SPACE) and self.state == config.TRANSITION:
                     # Don't completely stop welcome sound, just reduce volume
                     if hasattr(self, 'current_welcome_sound') and self.current_welcome_sound and hasattr(self, 'sound_manager'):
                         self.sound_manager.adjust_welcome_volume(self.current_planet.name, 0.3)
@@ -417,15 +449,8 @@ def main():
     # Create and start the game
     game = Game()
 
-    # Game loop
-    clock = pygame.time.Clock()
-    while True:
-        game.input_handler.handle_events()
-        game.update()
-        game.draw()
-
-        pygame.display.flip()
-        clock.tick(60)
+    # Game loop (simulação em passo fixo)
+    FixedTimestepLoop(game).run()
 
 if __name__ == "__main__":
     # Initialize pygame
@@ -437,9 +462,6 @@ if __name__ == "__main__":
     pygame.display.set_caption("Projeto Violeta Nova: Explorador do Sistema Solar")
     
     # Initialize fonts after pygame is initialized
-    import src.config as config
-    config.GAME_FONT = pygame.font.Font(None, config.GAME_FONT_SIZE)
-    config.SMALL_FONT = pygame.font.Font(None, config.SMALL_FONT_SIZE)
-    config.COUNTDOWN_FONT = pygame.font.Font(None, config.COUNTDOWN_FONT_SIZE)
+    font_registry.init_fonts()
     
     main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+import time
+import pygame
+import src.config as config
+from src import font_registry
+from src.dirty_rects import dirty_rects
+
+
+class FixedTimestepLoop:
+    """Laço principal com simulação em passo fixo e desenho interpolado.
+
+    O tempo real decorrido entre quadros vai para um acumulador, e
+    ``game.update`` roda uma vez para cada passo de 1/SIMULATION_HZ
+    acumulado, de modo que física, temporizadores contados em quadros e
+    surgimento de obstáculos avançam na mesma velocidade com 30 ou 144
+    quadros desenhados por segundo. Se a máquina não acompanhar, no máximo
+    ``max_updates`` passos rodam por quadro e o atraso restante é
+    descartado (evitando a espiral de recuperação). A fração do passo que
+    sobra no acumulador vira ``game.render_alpha``, usada para interpolar
+    as posições desenhadas.
+    """
+
+    def __init__(self, game, simulation_hz=config.SIMULATION_HZ, render_fps=config.RENDER_FPS,
+                 max_updates=config.MAX_UPDATES_PER_FRAME):
+        self.game = game
+        self.step = 1.0 / simulation_hz
+        self.render_fps = render_fps
+        self.max_updates = max_updates
+        self.accumulator = 0.0
+        self.clock = pygame.time.Clock()
+        # Começa com um passo acumulado para que o primeiro quadro já simule
+        self._last_time = time.perf_counter() - self.step
+
+    def advance(self, elapsed):
+        """Acumula ``elapsed`` segundos e roda os passos de simulação devidos; retorna quantos rodaram"""
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_updates:
+            self.game.update()
+            self.accumulator -= self.step
+            steps += 1
+
+        # Limite de recuperação atingido: descarta o atraso em vez de acumulá-lo
+        if self.accumulator >= self.step:
+            self.accumulator %= self.step
+
+        self.game.render_alpha = self.accumulator / self.step
+        return steps
+
+    def run_frame(self):
+        """Processa entradas, avança a simulação e desenha um quadro"""
+        now = time.perf_counter()
+        elapsed = now - self._last_time
+        self._last_time = now
+
+        font_registry.registry.begin_frame()
+        self.game.input_handler.handle_events()
+        self.advance(elapsed)
+        self.game.draw()
+
+        dirty_rects.present()
+        self.clock.tick(self.render_fps)
+
+    def run(self):
+        """Executa o laço principal até o jogo encerrar o processo"""
+        while True:
+            self.run_frame()
@@ -1,7 +1,6 @@
-import random
 import pygame
 from src.obstacle import Obstacle
-from src.collectible import Collectible
+from src.rng import gameplay_random
 import src.config as config
 from src.planet_data import LEVEL_PROGRESSION_THRESHOLDS, PLANET_NAME_PT
 
@@ -37,14 +36,13 @@ class GameMechanics:
         if self.game.sound_manager.music_active and self.game.score >= 2:
             self.game.sound_manager.increase_music_volume_on_progress(self.game.score)
                 
-        # Gera obstáculos
-        current_time = pygame.time.get_ticks()
+        # Gera obstáculos (no tempo de simulação, que acompanha os passos fixos)
+        current_time = self.game.sim_time_ms
         if current_time - self.game.last_obstacle_time > self.game.obstacle_spawn_rate:
             self.generate_obstacle()
             self.game.last_obstacle_time = current_time
             
         # Gera colecionáveis
-        current_time = pygame.time.get_ticks()
         if current_time - self.game.last_collectible_time > self.game.collectible_spawn_rate:
             self.generate_collectible()
             self.game.last_collectible_time = current_time
@@ -60,18 +58,24 @@ class GameMechanics:
                 
                 # Verifica progressão
                 self.check_progression()
+
+            # Obstáculos que saíram pela esquerda voltam ao pool
+            if obstacle.x <= -obstacle.WIDTH:
+                self.game.obstacle_pool.release(obstacle)
                 
         # Verifica colisões com colecionáveis
         self.game.collision_manager.check_collectible_collisions()
         
         # Atualiza colecionáveis
-        for collectible in list(self.game.collectibles):
+        for collectible in self.game.collectibles:
             collectible.update()
-            collectible.x -= self.game.obstacle_speed  # Move na mesma velocidade dos obstáculos
+            collectible.move(-self.game.obstacle_speed)  # Move na mesma velocidade dos obstáculos
+            if collectible.x <= -collectible.WIDTH:
+                self.game.collectible_pool.release(collectible)
             
-        # Remove obstáculos e itens fora da tela
-        self.game.obstacles = [obs for obs in self.game.obstacles if obs.x > -obs.WIDTH]
-        self.game.collectibles = [col for col in self.game.collectibles if col.x > -col.WIDTH]
+        # Remove obstáculos e itens fora da tela, devolvendo-os aos pools
+        self.game.obstacle_pool.compact()
+        self.game.collectible_pool.compact()
         
         # Verifica colisões
         collision_result = self.game.collision_manager.check_collisions()
@@ -115,16 +119,16 @@ class GameMechanics:
             max_gap_center_y = target_y
             
         # Gera posição aleatória para o centro do vão
-        gap_y = random.randint(min_gap_center_y, max_gap_center_y)
+        gap_y = gameplay_random.randint(min_gap_center_y, max_gap_center_y)
         
         # Seleciona aleatoriamente o tipo de obstáculo
-        obstacle_type = random.choice(list(Obstacle.TYPES.keys()))
+        obstacle_type = gameplay_random.choice(list(Obstacle.TYPES.keys()))
         
         # Obtém o nome do planeta atual
         current_planet_name = self.game.current_planet.name
         
-        # Cria novo obstáculo com o nome do planeta
-        new_obstacle = Obstacle(
+        # Obtém um obstáculo do pool com o nome do planeta
+        self.game.obstacle_pool.acquire(
             config.SCREEN_WIDTH, 
             gap_y, 
             self.game.obstacle_speed, 
@@ -132,10 +136,9 @@ class GameMechanics:
             config.SCREEN_HEIGHT,
             current_planet_name
         )
-        self.game.obstacles.append(new_obstacle)
         
         # Ocasionalmente a NOVA pode alertar sobre obstáculos
-        if random.random() < 0.3:  # 30% de chance
+        if gameplay_random.random() < 0.3:  # 30% de chance
             pass  # Placeholder para alertas futuros da NOVA
             
     def generate_collectible(self):
@@ -147,9 +150,9 @@ class GameMechanics:
             return
 
         x = config.SCREEN_WIDTH
-        y = random.randint(100, config.SCREEN_HEIGHT - config.FLOOR_HEIGHT - 50)
+        y = gameplay_random.randint(100, config.SCREEN_HEIGHT - config.FLOOR_HEIGHT - 50)
 
-        rand_val = random.random()
+        rand_val = gameplay_random.random()
         collectible_type = "data"
         life_chance = settings["life_collectible_chance"]
         weapon_chance = settings["weapon_collectible_chance"]
@@ -161,9 +164,9 @@ class GameMechanics:
             
         quiz_idx = None
         if collectible_type == "data":
-            quiz_idx = random.randrange(len(self.game.current_planet.quiz_questions))
+            quiz_idx = gameplay_random.randrange(len(self.game.current_planet.quiz_questions))
 
-        self.game.collectibles.append(Collectible(x, y, collectible_type, quiz_idx))
+        self.game.collectible_pool.acquire(x, y, collectible_type, quiz_idx)
         
     def check_progression(self):
         """Verifica se o jogador cumpriu os requisitos para avançar"""
@@ -0,0 +1,69 @@
+import math
+import pygame
+import src.config as config
+
+
+class GlowTextCache:
+    """Cache de textos com brilho (glow) pré-renderizado.
+
+    O brilho é formado por cópias translúcidas do texto deslocadas em uma
+    grade ao redor dele. Em vez de renderizar cada cópia a cada quadro, a
+    composição (brilho + texto) é feita uma única vez por fonte, texto e
+    cores; efeitos de pulso usam escalas quantizadas (``quantize_scale``) e o
+    desvanecimento é feito apenas com o alfa da superfície.
+    """
+
+    def __init__(self, scale_step=config.GLOW_TEXT_SCALE_STEP):
+        self.scale_step = scale_step
+        self._sprites = {}
+
+    def quantize_scale(self, scale):
+        """Arredonda um fator de escala para o passo configurado"""
+        if self.scale_step <= 0:
+            return scale
+        return round(scale / self.scale_step) * self.scale_step
+
+    def get(self, font, text, color, glow_color, glow_size=12, glow_spacing=3, glow_alpha=120):
+        """Obtém a superfície com o brilho e o texto já compostos.
+
+        A superfície tem ``glow_size`` pixels de margem em cada lado, então
+        seu centro coincide com o centro do texto.
+        """
+        key = (font, text, tuple(color), tuple(glow_color), glow_size, glow_spacing, glow_alpha)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._build(font, text, color, glow_color, glow_size, glow_spacing, glow_alpha)
+            self._sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        """Descarta todas as superfícies em cache"""
+        self._sprites.clear()
+
+    def _build(self, font, text, color, glow_color, glow_size, glow_spacing, glow_alpha):
+        """Compõe as cópias de brilho e o texto principal em uma superfície"""
+        text_surface = font.render(text, True, color)
+        glow_surface = font.render(text, True, glow_color)
+        width, height = text_surface.get_size()
+        sprite = pygame.Surface((width + 2 * glow_size, height + 2 * glow_size), pygame.SRCALPHA)
+
+        for offset_x in range(-glow_size, glow_size + 1, glow_spacing):
+            for offset_y in range(-glow_size, glow_size + 1, glow_spacing):
+                if offset_x == 0 and offset_y == 0:
+                    continue
+
+                # Calcula a distância para o desvanecimento do brilho
+                distance = math.sqrt(offset_x**2 + offset_y**2)
+                alpha = int(glow_alpha * (1 - distance / glow_size))
+                if alpha <= 0:
+                    continue
+
+                glow_surface.set_alpha(alpha)
+                sprite.blit(glow_surface, (glow_size + offset_x, glow_size + offset_y))
+
+        sprite.blit(text_surface, (glow_size, glow_size))
+        return sprite
+
+
+# Cache padrão usado pelos efeitos visuais
+glow_text_cache = GlowTextCache()
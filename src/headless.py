@@ -0,0 +1,79 @@
+import hashlib
+import os
+import time
+
+HEADLESS_ENV_VAR = "VIOLETNOVA_HEADLESS"
+
+
+def headless_requested():
+    """Indica se o modo headless foi pedido pela variável de ambiente VIOLETNOVA_HEADLESS"""
+    return os.environ.get(HEADLESS_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def use_dummy_drivers():
+    """Configura o SDL para rodar sem janela e sem placa de som.
+
+    Precisa ser chamada antes de ``pygame.init()``: com os drivers dummy o
+    display e o mixer são inicializados normalmente (``convert_alpha`` e
+    ``pygame.mixer.music`` continuam funcionando), mas nada é mostrado nem tocado.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+def gameplay_fingerprint(game):
+    """Resumo (hash) do estado de jogabilidade, para comparar execuções com a mesma semente"""
+    spacecraft = game.spacecraft
+    state = (
+        game.state, game.score, game.lives, game.current_planet.name,
+        spacecraft.x, spacecraft.y, spacecraft.velocity,
+        [(obstacle.x, obstacle.gap_y, obstacle.type) for obstacle in game.obstacles],
+        [(collectible.x, collectible.y, collectible.type) for collectible in game.collectibles],
+    )
+    return hashlib.sha1(repr(state).encode()).hexdigest()[:12]
+
+
+def run_headless(game, frames, draw=False, player=None):
+    """Roda ``frames`` passos de simulação sem limite de FPS e retorna as estatísticas.
+
+    Sem ``player`` a partida começa como se "Jogar" tivesse sido escolhido
+    no menu. Com um ``InputPlayer`` o jogo parte da tela inicial e recebe as
+    entradas gravadas no replay. Com ``draw`` falso, ``UIManager.draw`` não
+    é chamado, medindo só a simulação.
+    """
+    import src.config as config
+    from src import font_registry
+
+    if player is not None:
+        player.attach(game)
+    else:
+        game.reset()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        font_registry.registry.begin_frame()
+        game.input_handler.handle_events()
+        game.update()
+        if draw:
+            game.draw()
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        "frames": frames,
+        "seconds": elapsed,
+        "frames_per_second": frames / elapsed if elapsed > 0 else float("inf"),
+        "simulated_seconds": frames * config.SIMULATION_STEP_MS / 1000,
+        "draw": draw,
+        "state": game.state,
+        "score": game.score,
+        "lives": game.lives,
+        "planet": game.current_planet.name,
+        "fingerprint": gameplay_fingerprint(game),
+    }
+    print(
+        f"Modo headless: {frames} quadros simulados em {elapsed:.2f}s "
+        f"({stats['frames_per_second']:.0f} quadros/s, "
+        f"{stats['simulated_seconds']:.1f}s de jogo, desenho {'ligado' if draw else 'desligado'}, "
+        f"estado {stats['fingerprint']})"
+    )
+    return stats
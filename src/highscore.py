@@ -1,5 +1,6 @@
 import os
 import json
+import src.config as config
 
 # Toggle debug prints for PlanetTracker
 DEBUG_PLANET_TRACKER = False
@@ -51,6 +52,11 @@ class PlanetTracker:
                 print(f"Furthest planet: {furthest_lower}, idx: {furthest_idx}")
                 print(f"Updated furthest: {self.furthest_planet}")
         
+        # No modo headless (replays, benchmarks, balanceamento em lote) o
+        # progresso fica só em memória e o arquivo do jogador não é alterado
+        if config.HEADLESS:
+            return False
+
         try:
             with open(self.file_path, 'w') as f:
                 json.dump({
@@ -2,22 +2,45 @@ import pygame
 import pygame.time
 import sys
 import src.config as config
+from src.dirty_rects import dirty_rects
 
 class InputHandler:
     def __init__(self, game):
         self.game = game
+        # Origem dos eventos: a fila do pygame, ou um InputPlayer ao reproduzir um replay
+        self.event_source = pygame.event.get
+        # InputRecorder opcional que grava os eventos antes de processá-los
+        self.recorder = None
+        # Teclas pressionadas segundo os próprios eventos (substitui pygame.key.get_pressed,
+        # que não enxerga eventos reproduzidos)
+        self.pressed_keys = set()
+
+    def is_pressed(self, key):
+        """Indica se a tecla está pressionada no momento"""
+        return key in self.pressed_keys
         
     def handle_events(self):
         """Processa todos os eventos de entrada do jogo"""
-        for event in pygame.event.get():
+        events = self.event_source()
+        if self.recorder is not None:
+            self.recorder.record(self.game.sim_frame, events)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+
+            # Entradas do jogador (e eventos da janela) podem mudar qualquer
+            # parte da interface, então o quadro é apresentado por inteiro
+            if event.type != pygame.MOUSEMOTION:
+                dirty_rects.mark_full()
                 
             if event.type == pygame.KEYDOWN:
+                self.pressed_keys.add(event.key)
                 self._handle_key_down(event)
                     
             if event.type == pygame.KEYUP:
+                self.pressed_keys.discard(event.key)
                 self._handle_key_up(event)
                     
             if event.type == pygame.MOUSEBUTTONDOWN:
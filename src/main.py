@@ -1,9 +1,39 @@
 import pygame
+import random
 import sys
 from src.game import Game
 from src.config import *
+import src.config as config
+from src import font_registry
+from src.game_loop import FixedTimestepLoop
+from src.rng import rng
+from src.replay import InputRecorder, InputPlayer
+
+def main(headless=False, frames=None, draw=True, seed=None, record=None, replay=None):
+    # Gravações partem da tela inicial com entradas reais; o modo headless não tem nenhuma das duas
+    if record and (headless or replay):
+        raise ValueError("A gravação de replays só funciona em partidas interativas")
+
+    # Replays são sempre reproduzidos no modo headless, com a semente gravada
+    player = None
+    if replay:
+        player = InputPlayer(replay)
+        headless = True
+        seed = player.seed
+        if frames is None:
+            frames = player.frames
+    elif record and seed is None:
+        # Uma gravação só é reproduzível com semente conhecida
+        seed = random.randrange(2 ** 31)
+    if frames is None:
+        frames = 3600
+
+    # No modo headless o jogo usa um gerenciador de som silencioso
+    config.HEADLESS = headless
+
+    # Semeia os fluxos aleatórios antes de criar o jogo (o campo de estrelas já os usa)
+    rng.seed(seed)
 
-def main():
     # Inicializa o pygame
     pygame.init()
     pygame.mixer.init()
@@ -14,23 +44,29 @@ def main():
 
     # Inicializa as fontes após o pygame
     # Quiz e outros componentes dependem dessas fontes na criação
-    import src.config as config
-    config.GAME_FONT = pygame.font.Font(None, config.GAME_FONT_SIZE)
-    config.SMALL_FONT = pygame.font.Font(None, config.SMALL_FONT_SIZE)
-    config.COUNTDOWN_FONT = pygame.font.Font(None, config.COUNTDOWN_FONT_SIZE)
+    font_registry.init_fonts()
     
     # Cria a instância do jogo
     game = Game()
 
-    # Loop principal do jogo
-    clock = pygame.time.Clock()
-    while True:
-        game.input_handler.handle_events()
-        game.update()
-        game.draw()
-        
-        pygame.display.flip()
-        clock.tick(60)
+    recorder = None
+    if record:
+        recorder = InputRecorder(record, seed)
+        recorder.attach(game)
+
+    try:
+        if headless:
+            # Simulação sem limite de FPS, relatando quadros por segundo de relógio
+            from src.headless import run_headless
+            run_headless(game, frames, draw, player)
+            return
+
+        # Loop principal do jogo (simulação em passo fixo)
+        FixedTimestepLoop(game).run()
+    finally:
+        # O jogo encerra com sys.exit, então a gravação é salva aqui
+        if recorder is not None:
+            recorder.save()
 
 if __name__ == "__main__":
     main()
@@ -4,6 +4,9 @@ import math
 import json
 import src.config as config
 from src.planet_data import PLANET_NAME_PT
+from src.text_cache import render_text
+from src.overlay_cache import overlay_cache
+from src.dirty_rects import mark_dirty
 
 class MusicPlayer:
     def __init__(self, screen_width, screen_height):
@@ -159,27 +162,41 @@ class MusicPlayer:
                 pygame.mixer.music.unpause()
                 self.is_playing = True
     
-    def draw(self, screen):
-        """Desenha a interface do player de música"""
+    def _build_background(self, size):
+        """Compõe o fundo do player (cor base e gradiente) em uma única superfície"""
+        width, height = size
+
         # Fundo
-        background = pygame.Surface((self.screen_width, self.screen_height))
+        background = pygame.Surface((width, height))
         background.fill((10, 10, 40))  # Azul escuro espacial
         
         # Adiciona um gradiente do centro para as bordas
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        center_x, center_y = self.screen_width // 2, self.screen_height // 2
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        center_x, center_y = width // 2, height // 2
         max_radius = int(math.sqrt(center_x**2 + center_y**2))
         
         for radius in range(0, max_radius, 2):
             alpha = 255 - int(255 * (radius / max_radius) * 0.8)
             pygame.draw.circle(overlay, (50, 50, 100, alpha), (center_x, center_y), radius)
         
+        background.blit(overlay, (0, 0))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        return background
+
+    def draw(self, screen):
+        """Desenha a interface do player de música"""
+        # Fundo composto uma única vez por resolução
+        background = overlay_cache.get_custom(
+            "music_player_background",
+            (self.screen_width, self.screen_height),
+            self._build_background
+        )
         screen.blit(background, (0, 0))
-        screen.blit(overlay, (0, 0))
         
         # Título
-        title_text = config.GAME_FONT.render("PLAYER DE MÚSICA", True, (255, 255, 255))
-        subtitle_text = config.SMALL_FONT.render("Sistema Solar Sonoro", True, (200, 200, 255))
+        title_text = render_text(config.GAME_FONT, "PLAYER DE MÚSICA", True, (255, 255, 255))
+        subtitle_text = render_text(config.SMALL_FONT, "Sistema Solar Sonoro", True, (200, 200, 255))
         
         screen.blit(title_text, (self.screen_width // 2 - title_text.get_width() // 2, 80))
         screen.blit(subtitle_text, (self.screen_width // 2 - subtitle_text.get_width() // 2, 130))
@@ -193,7 +210,8 @@ class MusicPlayer:
         # Desenha o quadro do player com borda brilhante
         player_background = pygame.Surface((player_width, player_height), pygame.SRCALPHA)
         player_background.fill((0, 0, 30, 180))
-        screen.blit(player_background, (player_x, player_y))
+        # O estado de reprodução pode mudar sem entrada do jogador (fim da faixa)
+        mark_dirty(screen.blit(player_background, (player_x, player_y)))
         
         # Borda brilhante
         border_color = (100, 100, 255)
@@ -212,7 +230,7 @@ class MusicPlayer:
             end_idx = min(start_idx + visible_tracks, len(self.track_names))
             
             # Título da seção
-            tracks_title = config.GAME_FONT.render("Faixas Desbloqueadas", True, (255, 255, 255))
+            tracks_title = render_text(config.GAME_FONT, "Faixas Desbloqueadas", True, (255, 255, 255))
             screen.blit(tracks_title, (player_x + player_width // 2 - tracks_title.get_width() // 2, player_y + 20))
             
             for i, track_data in enumerate(self.track_names[start_idx:end_idx]):
@@ -248,11 +266,11 @@ class MusicPlayer:
                 
                 # Desenha o texto da faixa
                 track_font_color = (255, 255, 255) if track_idx == self.selected_track else (200, 200, 200)
-                track_text = config.SMALL_FONT.render(f"{status_icon} {planet_text}: {track_name}", True, track_font_color)
+                track_text = render_text(config.SMALL_FONT, f"{status_icon} {planet_text}: {track_name}", True, track_font_color)
                 screen.blit(track_text, (player_x + 30, y_pos + 10))
         else:
             # Mensagem se não houver faixas
-            no_tracks_text = config.SMALL_FONT.render("Nenhuma faixa desbloqueada ainda!", True, (255, 100, 100))
+            no_tracks_text = render_text(config.SMALL_FONT, "Nenhuma faixa desbloqueada ainda!", True, (255, 100, 100))
             screen.blit(no_tracks_text, (player_x + player_width // 2 - no_tracks_text.get_width() // 2, tracks_y + 100))
         
         # Informações da faixa atual ou mensagem de reprodução
@@ -263,20 +281,20 @@ class MusicPlayer:
             current_planet = current_track["pt_name"]
             current_name = current_track["name"].replace(".mp3", "")
             
-            now_playing = config.SMALL_FONT.render("Reproduzindo agora:", True, (150, 150, 255))
-            track_info = config.GAME_FONT.render(f"{current_planet}: {current_name}", True, (255, 255, 255))
+            now_playing = render_text(config.SMALL_FONT, "Reproduzindo agora:", True, (150, 150, 255))
+            track_info = render_text(config.GAME_FONT, f"{current_planet}: {current_name}", True, (255, 255, 255))
             
             screen.blit(now_playing, (player_x + player_width // 2 - now_playing.get_width() // 2, current_info_y))
             screen.blit(track_info, (player_x + player_width // 2 - track_info.get_width() // 2, current_info_y + 30))
         else:
-            not_playing = config.SMALL_FONT.render("Nenhuma música tocando", True, (150, 150, 150))
+            not_playing = render_text(config.SMALL_FONT, "Nenhuma música tocando", True, (150, 150, 150))
             screen.blit(not_playing, (player_x + player_width // 2 - not_playing.get_width() // 2, current_info_y + 15))
         
         # Instruções
         controls_y = player_y + player_height + 20
-        controls_text1 = config.SMALL_FONT.render("SETA PARA CIMA/BAIXO - Selecionar faixa", True, (255, 255, 255))
-        controls_text2 = config.SMALL_FONT.render("ESPAÇO/ENTER - Reproduzir/Pausar", True, (255, 255, 255))
-        controls_text3 = config.SMALL_FONT.render("ESC - Voltar ao menu", True, (255, 255, 255))
+        controls_text1 = render_text(config.SMALL_FONT, "SETA PARA CIMA/BAIXO - Selecionar faixa", True, (255, 255, 255))
+        controls_text2 = render_text(config.SMALL_FONT, "ESPAÇO/ENTER - Reproduzir/Pausar", True, (255, 255, 255))
+        controls_text3 = render_text(config.SMALL_FONT, "ESC - Voltar ao menu", True, (255, 255, 255))
         
         # Draw backgrounds for better readability
         for i, text in enumerate([controls_text1, controls_text2, controls_text3]):
@@ -291,5 +309,5 @@ class MusicPlayer:
             screen.blit(text, (self.screen_width // 2 - text.get_width() // 2, text_y))
         
         # Informação de desbloqueio
-        unlock_info = config.SMALL_FONT.render("Explore o Sistema Solar para desbloquear mais faixas!", True, (200, 200, 200))
+        unlock_info = render_text(config.SMALL_FONT, "Explore o Sistema Solar para desbloquear mais faixas!", True, (200, 200, 200))
         screen.blit(unlock_info, (self.screen_width // 2 - unlock_info.get_width() // 2, self.screen_height - 40))
\ No newline at end of file
@@ -1,8 +1,13 @@
 import pygame
-import random
 import math
 import os
 import sys
+from collections import OrderedDict
+import src.config as config
+from src.rng import cosmetic_random, quiz_random
+from src.font_registry import get_font
+from src.text_cache import render_text
+from src.particles import ParticleSystem
 
 # Adiciona o diretório de assets ao caminho do Python
 assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
@@ -21,6 +26,12 @@ class NovaAI:
     WIDTH = 80
     HEIGHT = 80
 
+    # Sprites da IA já rasterizados por tamanho, expressão e cor (LRU)
+    SPRITE_CACHE = OrderedDict()
+    PULSE_STEP = config.NOVA_PULSE_STEP      # Passo de quantização da pulsação
+    BLEND_STEPS = config.NOVA_BLEND_STEPS    # Passos da mistura de cores entre expressões
+    SPRITE_CACHE_SIZE = config.NOVA_SPRITE_CACHE_SIZE
+
     # Cores para diferentes tipos de expressão
     COLORS = {
         "normal": (70, 130, 180),  # Azul aço
@@ -134,7 +145,7 @@ class NovaAI:
         self.message = ""
         self.displayed_message = ""  # Para efeito de máquina de escrever
         self.message_timer = 0
-        self.message_duration = 180  # Quadros (3 segundos a 60fps)
+        self.message_duration = 3 * config.SIMULATION_HZ  # Passos de simulação (3 segundos)
         self.char_timer = 0
         self.char_delay = 2  # Quadros entre a adição de caracteres
 
@@ -146,7 +157,7 @@ class NovaAI:
         self.pulse_max = 1.05
 
         # Sistema de partículas
-        self.particles = []
+        self.particles = ParticleSystem(capacity=64)
         self.particle_timer = 0
         self.particle_spawn_delay = 5  # Quadros entre a geração de partículas
 
@@ -167,31 +178,47 @@ class NovaAI:
     
     def update_surface(self):
         """Atualiza a superfície do assistente AI com a expressão atual"""
-        scaled_width = int(self.WIDTH * self.pulse_factor)
-        scaled_height = int(self.HEIGHT * self.pulse_factor)
-
-        self.surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-        self.surface.fill((0, 0, 0, 0))  # Transparente
+        # Pulsação quantizada para reaproveitar os sprites já rasterizados
+        pulse = round(self.pulse_factor / self.PULSE_STEP) * self.PULSE_STEP
+        scaled_width = int(self.WIDTH * pulse)
+        scaled_height = int(self.HEIGHT * pulse)
 
         # Determina a cor com base na expressão ou transição
         if self.transition_progress < 1.0:
-            # Durante a transição, mescla as cores
+            # Durante a transição, mescla as cores (em passos quantizados)
+            progress = round(self.transition_progress * self.BLEND_STEPS) / self.BLEND_STEPS
             curr_color = self.COLORS[self.expression]
             prev_color = self.COLORS[self.previous_expression]
-            blend_color = [
-                int(prev_color[0] * (1-self.transition_progress) + curr_color[0] * self.transition_progress),
-                int(prev_color[1] * (1-self.transition_progress) + curr_color[1] * self.transition_progress),
-                int(prev_color[2] * (1-self.transition_progress) + curr_color[2] * self.transition_progress)
-            ]
-            color = (blend_color[0], blend_color[1], blend_color[2], 230)
+            color = (
+                int(prev_color[0] * (1-progress) + curr_color[0] * progress),
+                int(prev_color[1] * (1-progress) + curr_color[1] * progress),
+                int(prev_color[2] * (1-progress) + curr_color[2] * progress),
+                230
+            )
         else:
             # Sem transição, usa a cor da expressão atual
             color = (*self.COLORS[self.expression], 230)
 
+        key = (scaled_width, scaled_height, self.expression, color)
+        sprite = self.SPRITE_CACHE.get(key)
+        if sprite is not None:
+            self.SPRITE_CACHE.move_to_end(key)
+        else:
+            sprite = self._render_sprite(scaled_width, scaled_height, color, pulse)
+            self.SPRITE_CACHE[key] = sprite
+            if len(self.SPRITE_CACHE) > self.SPRITE_CACHE_SIZE:
+                self.SPRITE_CACHE.popitem(last=False)
+        self.surface = sprite
+
+    def _render_sprite(self, scaled_width, scaled_height, color, pulse):
+        """Rasteriza o sprite da IA (círculos e expressão) em uma nova superfície"""
+        surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))  # Transparente
+
         # Desenha os círculos externo e interno
-        pygame.draw.circle(self.surface, (50, 50, 50, 200),
+        pygame.draw.circle(surface, (50, 50, 50, 200),
                           (scaled_width // 2, scaled_height // 2), scaled_width // 2)
-        pygame.draw.circle(self.surface, color,
+        pygame.draw.circle(surface, color,
                           (scaled_width // 2, scaled_height // 2), scaled_width // 2 - 3)
 
         # Usa expressões personalizadas ou recorre a emojis
@@ -207,28 +234,29 @@ class NovaAI:
                 draw_func(expression_surface, scaled_width, scaled_height)
 
                 # Blit a expressão na superfície principal
-                self.surface.blit(expression_surface, (0, 0))
+                surface.blit(expression_surface, (0, 0))
             else:
                 # Recorre a emoji se a função de desenho não for encontrada
-                self._draw_emoji_expression(scaled_width, scaled_height)
+                self._draw_emoji_expression(surface, scaled_width, scaled_height, pulse)
         else:
             # Recorre à representação de emoji
-            self._draw_emoji_expression(scaled_width, scaled_height)
+            self._draw_emoji_expression(surface, scaled_width, scaled_height, pulse)
+        return surface
 
-    def _draw_emoji_expression(self, width, height):
+    def _draw_emoji_expression(self, surface, width, height, pulse):
         """Método de fallback para desenhar símbolos de alerta"""
         # Apenas mostra símbolos para expressões de alerta
         if self.expression in ["warning", "alert"]:
-            font = pygame.font.Font(None, int(50 * self.pulse_factor))  # Escala a fonte com a pulsação
+            font = get_font(int(50 * pulse))  # Escala a fonte com a pulsação
             expression_text = font.render(self.EXPRESSIONS[self.expression], True, (255, 255, 255))
             expression_rect = expression_text.get_rect(center=(width // 2, height // 2))
-            self.surface.blit(expression_text, expression_rect)
+            surface.blit(expression_text, expression_rect)
 
     def start_radio_signal(self, duration_ms):
         """Inicia a animação de sinal de rádio por determinado tempo em ms"""
         self.audio_playing = True
-        # Converte duração de ms para quadros (aprox.)
-        self.audio_timer = max(1, int(duration_ms / 16))
+        # Converte duração de ms para passos de simulação
+        self.audio_timer = max(1, int(duration_ms / config.SIMULATION_STEP_MS))
         self.signal_y = 0
 
     def stop_radio_signal(self):
@@ -273,7 +301,7 @@ class NovaAI:
 
         # Reseta o sistema de partículas ao mostrar mensagens importantes
         if expression in ["warning", "alert", "excited"]:
-            self.particles = []  # Limpa partículas existentes
+            self.particles.clear()  # Limpa partículas existentes
             self.particle_timer = 0  # Reseta o temporizador para gerar partículas imediatamente
     
     def alert_gravity_change(self, planet_name_en, gravity_factor):
@@ -284,7 +312,7 @@ class NovaAI:
     def give_random_fact(self, planet_name_pt):
         """Compartilha um fato científico aleatório sobre o planeta atual"""
         if planet_name_pt in self.FACTS:
-            fact = random.choice(self.FACTS[planet_name_pt])
+            fact = quiz_random.choice(self.FACTS[planet_name_pt])
             self.show_message(fact, "curious")
 
     def give_quiz_hint(self, planet_name_en, question_index):
@@ -341,36 +369,22 @@ class NovaAI:
                 # Adiciona nova partícula
                 center_x = self.x + self.WIDTH // 2
                 center_y = self.y + self.HEIGHT // 2
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(0.5, 2.0)
-                size = random.uniform(2, 5)
-
-                color = self.COLORS[self.expression]
-                # Adiciona canal alfa
-                color_with_alpha = (*color, 200)
-
-                self.particles.append({
-                    'x': center_x,
-                    'y': center_y,
-                    'dx': math.cos(angle) * speed,
-                    'dy': math.sin(angle) * speed,
-                    'size': size,
-                    'color': color_with_alpha,
-                    'life': 30  # Quadros até a partícula desaparecer
-                })
+                angle = cosmetic_random.uniform(0, math.pi * 2)
+                speed = cosmetic_random.uniform(0.5, 2.0)
+                size = cosmetic_random.uniform(2, 5)
+
+                self.particles.emit(
+                    center_x,
+                    center_y,
+                    math.cos(angle) * speed,
+                    math.sin(angle) * speed,
+                    30,  # Quadros até a partícula desaparecer
+                    size,
+                    self.COLORS[self.expression]
+                )
 
         # Atualiza partículas existentes
-        i = 0
-        while i < len(self.particles):
-            particle = self.particles[i]
-            particle['x'] += particle['dx']
-            particle['y'] += particle['dy']
-            particle['life'] -= 1
-
-            if particle['life'] <= 0:
-                self.particles.pop(i)
-            else:
-                i += 1
+        self.particles.update()
 
         # Atualiza temporizador da mensagem
         if self.message_timer > 0:
@@ -395,26 +409,24 @@ class NovaAI:
             self.signal_y += self.signal_speed
     
     def draw(self, screen):
-        """Desenha o assistente AI e quaisquer mensagens ativas"""
-        # Desenha partículas atrás da IA
-        for particle in self.particles:
-            # Calcula o alfa com base na vida restante
-            alpha = int(255 * (particle['life'] / 30))
-            color = (particle['color'][0], particle['color'][1], particle['color'][2], alpha)
-
-            pygame.draw.circle(
-                screen,
-                color,
-                (int(particle['x']), int(particle['y'])),
-                int(particle['size'])
-            )
+        """Desenha o assistente AI e quaisquer mensagens ativas
+
+        Retorna as regiões da tela alteradas (IA com partículas e balão).
+        """
+        dirty_rects = []
+        bubble_dirty = None
+
+        # Desenha partículas atrás da IA (o alfa diminui com a vida restante)
+        particle_rect = self.particles.draw(screen)
+        if particle_rect:
+            dirty_rects.append(particle_rect)
 
         # Desenha o círculo da IA (centralizado na posição original)
         center_x = self.x + (self.WIDTH // 2)
         center_y = self.y + (self.HEIGHT // 2)
         offset_x = center_x - (self.surface.get_width() // 2)
         offset_y = center_y - (self.surface.get_height() // 2)
-        screen.blit(self.surface, (offset_x, offset_y))
+        dirty_rect = screen.blit(self.surface, (offset_x, offset_y))
 
         # Desenha animação de sinal de rádio quando áudio está tocando
         if self.audio_playing:
@@ -446,13 +458,18 @@ class NovaAI:
             
             # Desenha a linha ondulada
             if len(points) > 1:
-                pygame.draw.lines(screen, (255, 255, 255), False, points, 2)
+                dirty_rects.append(pygame.draw.lines(screen, (255, 255, 255), False, points, 2))
 
         # Desenha qualquer mensagem ativa
         if self.message and self.message_timer > 0:
             # Calcula as dimensões do balão
-            font = pygame.font.Font(None, 24)
-            message_surf = font.render(self.displayed_message, True, (255, 255, 255))
+            font = get_font(24)
+            if self.displayed_message == self.message:
+                # Mensagem completa: reutiliza a superfície do cache
+                message_surf = render_text(font, self.displayed_message, True, (255, 255, 255))
+            else:
+                # Durante a digitação cada quadro tem um texto novo, sem cache
+                message_surf = font.render(self.displayed_message, True, (255, 255, 255))
             message_width = message_surf.get_width() + 20  # Preenchimento
             message_height = message_surf.get_height() + 15  # Preenchimento
 
@@ -468,7 +485,7 @@ class NovaAI:
             border_color = (50, 50, 50)
 
             # Desenha o contorno do balão
-            pygame.draw.rect(screen, border_color, bubble_rect, border_radius=10)
+            bubble_dirty = pygame.draw.rect(screen, border_color, bubble_rect, border_radius=10)
             # Desenha o preenchimento do balão com transparência
             inner_rect = bubble_rect.inflate(-4, -4)
             pygame.draw.rect(screen, (*bubble_color, 180), inner_rect, border_radius=8)
@@ -477,4 +494,7 @@ class NovaAI:
             # Posiciona e desenha o texto da mensagem
             text_x = bubble_x + 10  # Preenchimento esquerdo
             text_y = bubble_y + 8   # Preenchimento superior
-            screen.blit(message_surf, (text_x, text_y))
\ No newline at end of file
+            screen.blit(message_surf, (text_x, text_y))
+
+        dirty_rect = dirty_rect.unionall(dirty_rects)
+        return [dirty_rect, bubble_dirty] if bubble_dirty else [dirty_rect]
\ No newline at end of file
@@ -1,20 +1,82 @@
 import pygame
-import random
 import os
+from src.rng import gameplay_random, cosmetic_random
 
 class Obstacle:
     WIDTH = 80
     GAP = 225  # Espaço entre obstáculos superior e inferior
 
-    # Cache para sprites já carregados, evitando carregamento repetido
+    # Tradução de nomes de planetas para caminhos de arquivo
+    PLANET_FOLDER_NAMES = {
+        "Earth": "terra",
+        "Mercury": "mercurio",
+        "Venus": "venus",
+        "Mars": "marte",
+        "Jupiter": "jupiter",
+        "Saturn": "saturno",
+        "Moon": "lua",
+        "Uranus": "urano",
+        "Neptune": "netuno"
+    }
+
+    # Cache de sprites já redimensionados e convertidos para o display:
+    # (planeta, largura) -> (sprite superior, sprite inferior), ou None se
+    # o planeta não tiver sprites (usa o fallback procedural)
     SPRITE_CACHE = {}
 
+    # Banco de texturas procedurais para planetas sem sprites:
+    # (tipo, altura) -> faixas pré-geradas, recortadas com subsurface
+    FALLBACK_STRIPS = {}
+    FALLBACK_VARIANTS = 3  # Faixas diferentes por tipo, para variar a aparência
+
     @classmethod
-    def _load_sprite(cls, path):
-        """Carrega um sprite e armazena em cache."""
-        if path not in cls.SPRITE_CACHE and os.path.exists(path):
-            cls.SPRITE_CACHE[path] = pygame.image.load(path).convert_alpha()
-        return cls.SPRITE_CACHE.get(path)
+    def get_planet_sprites(cls, planet_name, width=None):
+        """Obtém os sprites superior e inferior do planeta na largura informada"""
+        key = (planet_name, width or cls.WIDTH)
+        if key not in cls.SPRITE_CACHE:
+            cls.SPRITE_CACHE[key] = cls._load_planet_sprites(planet_name, key[1])
+        return cls.SPRITE_CACHE[key]
+
+    @classmethod
+    def _load_planet_sprites(cls, planet_name, width):
+        """Carrega e redimensiona os sprites de obstáculo de um planeta"""
+        folder_name = cls.PLANET_FOLDER_NAMES.get(planet_name, "terra")
+        folder = os.path.join("assets", "images", "planets_sprites", folder_name)
+
+        # Earth tem obstáculos específicos para cima e baixo; os outros
+        # planetas usam o mesmo sprite para ambos
+        if planet_name == "Earth":
+            top_path = os.path.join(folder, f"obstaculo_cima_{folder_name}.png")
+            bottom_path = os.path.join(folder, f"obstaculo_baixo_{folder_name}.png")
+        else:
+            top_path = bottom_path = os.path.join(folder, f"obstaculo_{folder_name}.png")
+
+        try:
+            # Verificando existência dos arquivos antes de carregar
+            if not (os.path.exists(top_path) and os.path.exists(bottom_path)):
+                print(f"Arquivos de sprite para {planet_name} não encontrados, usando fallback")
+                return None
+
+            top_sprite = cls._load_scaled_sprite(top_path, width)
+            if bottom_path == top_path:
+                bottom_sprite = top_sprite
+            else:
+                bottom_sprite = cls._load_scaled_sprite(bottom_path, width)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Não foi possível carregar os sprites de obstáculos para {planet_name}: {e}")
+            return None
+        return top_sprite, bottom_sprite
+
+    @staticmethod
+    def _load_scaled_sprite(path, width):
+        """Carrega um sprite e o redimensiona para a largura, mantendo a proporção"""
+        sprite = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        if sprite.get_width() != width:
+            height = int(sprite.get_height() * (width / sprite.get_width()))
+            sprite = pygame.transform.scale(sprite, (width, height))
+        return sprite
 
     # Tipos de obstáculos espaciais
     TYPES = {
@@ -33,6 +95,10 @@ class Obstacle:
     }
 
     def __init__(self, x, gap_y, speed, obstacle_type=None, screen_height=720, planet_name="Earth"):
+        self.reset(x, gap_y, speed, obstacle_type, screen_height, planet_name)
+
+    def reset(self, x, gap_y, speed, obstacle_type=None, screen_height=720, planet_name="Earth"):
+        """(Re)inicializa o obstáculo; usado pelo construtor e pelo pool de entidades"""
         self.x = x
         self.gap_y = gap_y
         self.speed = speed
@@ -47,129 +113,64 @@ class Obstacle:
         self.top_width = self.WIDTH
         self.bottom_width = self.WIDTH
         
-        # Tradução de nomes de planetas para caminhos de arquivo
-        planet_folder_names = {
-            "Earth": "terra",
-            "Mercury": "mercurio",
-            "Venus": "venus",
-            "Mars": "marte",
-            "Jupiter": "jupiter",
-            "Saturn": "saturno",
-            "Moon": "lua",
-            "Uranus": "urano",
-            "Neptune": "netuno"
-        }
-        
-        folder_name = planet_folder_names.get(planet_name, "terra")
-        
-        # Tenta carregar as imagens de sprites específicas do planeta
-        try:
-            # Earth tem obstáculos específicos para cima e baixo
-            if planet_name == "Earth":
-                self.top_sprite_path = os.path.join("assets", "images", "planets_sprites", folder_name, f"obstaculo_cima_{folder_name}.png")
-                self.bottom_sprite_path = os.path.join("assets", "images", "planets_sprites", folder_name, f"obstaculo_baixo_{folder_name}.png")
-                
-                # Verificando existência dos arquivos antes de carregar
-                if os.path.exists(self.top_sprite_path) and os.path.exists(self.bottom_sprite_path):
-                    # Carrega os sprites usando cache
-                    self.top_sprite = self._load_sprite(self.top_sprite_path)
-                    self.bottom_sprite = self._load_sprite(self.bottom_sprite_path)
-                    
-                    # Obtém as dimensões reais dos sprites
-                    self.top_width = self.top_sprite.get_width()
-                    self.bottom_width = self.bottom_sprite.get_width()
-                    
-                    # Marca que estamos usando sprites
-                    self.using_sprites = True
-                else:
-                    print(f"Arquivos de sprite para {planet_name} não encontrados, usando fallback")
-                    self.using_sprites = False
-            else:
-                # Outros planetas usam o mesmo sprite para ambos os obstáculos
-                obstacle_path = os.path.join("assets", "images", "planets_sprites", folder_name, f"obstaculo_{folder_name}.png")
-                
-                # Verificando existência do arquivo antes de carregar
-                if os.path.exists(obstacle_path):
-                    obstacle_sprite = self._load_sprite(obstacle_path)
-                    
-                    # Usa o mesmo sprite para o topo e a base
-                    self.top_sprite = obstacle_sprite
-                    self.bottom_sprite = obstacle_sprite
-                    
-                    # Obtém as dimensões reais do sprite
-                    self.top_width = obstacle_sprite.get_width()
-                    self.bottom_width = obstacle_sprite.get_width()
-                    
-                    # Marca que estamos usando sprites
-                    self.using_sprites = True
-                else:
-                    print(f"Arquivo de sprite para {planet_name} não encontrado, usando fallback")
-                    self.using_sprites = False
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Não foi possível carregar os sprites de obstáculos para {planet_name}: {e}")
-            self.using_sprites = False
+        # Sprites do planeta, já redimensionados e compartilhados entre obstáculos
+        sprites = self.get_planet_sprites(planet_name)
+        if sprites is not None:
+            self.top_sprite, self.bottom_sprite = sprites
+            # Marca que estamos usando sprites
+            self.using_sprites = True
             
-        # Cria superfícies de fallback para quando não há sprites
-        if not self.using_sprites:
-            self._create_fallback_obstacles(obstacle_type)
-
         # Seleciona aleatoriamente o tipo de obstáculo se não especificado
         if obstacle_type is None or obstacle_type not in self.TYPES:
-            obstacle_type = random.choice(list(self.TYPES.keys()))
+            obstacle_type = gameplay_random.choice(list(self.TYPES.keys()))
         self.type = obstacle_type
         self.colors = self.TYPES[self.type]
 
         # Cria superfícies do obstáculo
         self.create_obstacle_surfaces()
-        
-    def _create_fallback_obstacles(self, obstacle_type):
-        """Cria obstáculos de fallback quando sprites não estão disponíveis"""
-        # Determina o tipo de obstáculo
-        if obstacle_type is None or obstacle_type not in self.TYPES:
-            obstacle_type = random.choice(list(self.TYPES.keys()))
-        self.type = obstacle_type
-        self.colors = self.TYPES[self.type]
-        
-        # Cria obstáculo superior
-        top_obstacle_height = self.gap_y - self.GAP // 2
-        # Garante que a altura seja de pelo menos 1 pixel
-        top_obstacle_height = max(1, top_obstacle_height)
-        self.top_obstacle = pygame.Surface((self.WIDTH, top_obstacle_height))
-        self.top_obstacle.fill(self.colors["color"])
-        
-        # Cria obstáculo inferior
-        bottom_obstacle_height = self.screen_height - self.gap_y - self.GAP // 2
-        # Garante que a altura seja de pelo menos 1 pixel
-        bottom_obstacle_height = max(1, bottom_obstacle_height)
-        self.bottom_obstacle = pygame.Surface((self.WIDTH, bottom_obstacle_height))
-        self.bottom_obstacle.fill(self.colors["color"])
-        
-        # Adiciona detalhes aos obstáculos
-        if self.type == "asteroid":
-            self._add_asteroid_details(self.top_obstacle)
-            self._add_asteroid_details(self.bottom_obstacle)
-        elif self.type == "debris":
-            self._add_debris_details(self.top_obstacle)
-            self._add_debris_details(self.bottom_obstacle)
-        elif self.type == "storm":
-            self._add_storm_details(self.top_obstacle)
-            self._add_storm_details(self.bottom_obstacle)
+
+    @classmethod
+    def warm_up(cls, planet_name, screen_height=720):
+        """Prepara os sprites do planeta, ou as texturas de fallback se ele não tiver sprites"""
+        if cls.get_planet_sprites(planet_name) is None:
+            for obstacle_type in cls.TYPES:
+                cls._get_fallback_strips(obstacle_type, screen_height)
+
+    @classmethod
+    def _get_fallback_strips(cls, obstacle_type, height):
+        """Obtém (gerando na primeira vez) as faixas de textura procedural de um tipo"""
+        key = (obstacle_type, height)
+        strips = cls.FALLBACK_STRIPS.get(key)
+        if strips is None:
+            colors = cls.TYPES[obstacle_type]
+            strips = []
+            for _ in range(cls.FALLBACK_VARIANTS):
+                strip = pygame.Surface((cls.WIDTH, height))
+                strip.fill(colors["color"])
+                if obstacle_type == "asteroid":
+                    # Adiciona detalhes semelhantes a crateras aos asteroides
+                    cls._add_asteroid_details(strip, colors)
+                elif obstacle_type == "debris":
+                    # Adiciona detalhes metálicos/tecnológicos aos detritos
+                    cls._add_debris_details(strip, colors)
+                elif obstacle_type == "storm":
+                    # Adiciona padrão de redemoinho às tempestades solares
+                    cls._add_storm_details(strip, colors)
+                strips.append(strip)
+            cls.FALLBACK_STRIPS[key] = strips
+        return strips
+
+    def _get_fallback_surface(self, height):
+        """Recorta uma faixa de textura de fallback na altura pedida (sem copiar pixels)"""
+        strip_height = max(self.screen_height, height)
+        strip = cosmetic_random.choice(self._get_fallback_strips(self.type, strip_height))
+        y = cosmetic_random.randint(0, strip_height - height)
+        return strip.subsurface((0, y, self.WIDTH, height))
 
     def create_obstacle_surfaces(self):
         if self.using_sprites:
-            # Quando usamos sprites, padronizamos os sprites para garantir consistência
-            
-            # Redimensiona os sprites para a largura padrão, mantendo a proporção
-            if self.top_width != self.WIDTH:
-                top_height = int(self.top_sprite.get_height() * (self.WIDTH / self.top_width))
-                self.top_sprite = pygame.transform.scale(self.top_sprite, (self.WIDTH, top_height))
-                self.top_width = self.WIDTH
-                
-            if hasattr(self, 'bottom_width') and self.bottom_width != self.WIDTH:
-                bottom_height = int(self.bottom_sprite.get_height() * (self.WIDTH / self.bottom_width))
-                self.bottom_sprite = pygame.transform.scale(self.bottom_sprite, (self.WIDTH, bottom_height))
-                self.bottom_width = self.WIDTH
-            
+            # Os sprites do cache já estão na largura padrão (WIDTH)
+
             # Para o obstáculo superior, ajustamos sua posição Y
             # A parte superior do obstáculo fica na posição 0, 
             # mas precisamos ajustar a altura para que o espaço fique na posição gap_y - GAP/2
@@ -179,89 +180,79 @@ class Obstacle:
             # Para o obstáculo inferior, calculamos a posição Y
             self.bottom_y = self.gap_y + self.GAP // 2
         else:
-            # Se não estivermos usando sprites, criamos superfícies como antes
-            top_obstacle_height = self.gap_y - self.GAP // 2
-            # Garante que a altura seja de pelo menos 1 pixel para evitar dimensões de superfície inválidas
-            top_obstacle_height = max(1, top_obstacle_height)
-            self.top_obstacle = pygame.Surface((self.WIDTH, top_obstacle_height))
-            self.top_obstacle.fill(self.colors["color"])
-
-            bottom_obstacle_height = self.screen_height - self.gap_y - self.GAP // 2
-            # Garante que a altura seja de pelo menos 1 pixel para evitar dimensões de superfície inválidas
-            bottom_obstacle_height = max(1, bottom_obstacle_height)
-            self.bottom_obstacle = pygame.Surface((self.WIDTH, bottom_obstacle_height))
-            self.bottom_obstacle.fill(self.colors["color"])
-
-            # Adiciona detalhes do obstáculo com base no tipo
-            if self.type == "asteroid":
-                # Adiciona detalhes semelhantes a crateras aos asteroides
-                self._add_asteroid_details(self.top_obstacle)
-                self._add_asteroid_details(self.bottom_obstacle)
+            # Sem sprites, recortamos as texturas procedurais pré-geradas
+            # Garante que as alturas sejam de pelo menos 1 pixel para evitar dimensões de superfície inválidas
+            top_obstacle_height = max(1, self.gap_y - self.GAP // 2)
+            self.top_obstacle = self._get_fallback_surface(top_obstacle_height)
 
-            elif self.type == "debris":
-                # Adiciona detalhes metálicos/tecnológicos aos detritos
-                self._add_debris_details(self.top_obstacle)
-                self._add_debris_details(self.bottom_obstacle)
+            bottom_obstacle_height = max(1, self.screen_height - self.gap_y - self.GAP // 2)
+            self.bottom_obstacle = self._get_fallback_surface(bottom_obstacle_height)
 
-            elif self.type == "storm":
-                # Adiciona padrão de redemoinho às tempestades solares
-                self._add_storm_details(self.top_obstacle)
-                self._add_storm_details(self.bottom_obstacle)
-
-    def _add_asteroid_details(self, surface):
+    @staticmethod
+    def _add_asteroid_details(surface, colors):
         # Adiciona círculos semelhantes a crateras ao asteroide
         width, height = surface.get_size()
         for _ in range(width // 10):
-            x = random.randint(5, width - 5)
-            y = random.randint(5, height - 5)
-            radius = random.randint(3, 8)
-            pygame.draw.circle(surface, self.colors["detail_color"], (x, y), radius)
+            x = cosmetic_random.randint(5, width - 5)
+            y = cosmetic_random.randint(5, height - 5)
+            radius = cosmetic_random.randint(3, 8)
+            pygame.draw.circle(surface, colors["detail_color"], (x, y), radius)
 
-    def _add_debris_details(self, surface):
+    @staticmethod
+    def _add_debris_details(surface, colors):
         # Adiciona detalhes de detritos tecnológicos (retângulos e linhas)
         width, height = surface.get_size()
         for _ in range(width // 15):
-            x = random.randint(5, width - 15)
-            y = random.randint(5, height - 15)
-            w = random.randint(5, 15)
-            h = random.randint(5, 15)
-            pygame.draw.rect(surface, self.colors["detail_color"], (x, y, w, h))
+            x = cosmetic_random.randint(5, width - 15)
+            y = cosmetic_random.randint(5, height - 15)
+            w = cosmetic_random.randint(5, 15)
+            h = cosmetic_random.randint(5, 15)
+            pygame.draw.rect(surface, colors["detail_color"], (x, y, w, h))
 
             # Adiciona algumas linhas para representar detalhes tecnológicos
-            line_x = random.randint(0, width - 1)
+            line_x = cosmetic_random.randint(0, width - 1)
             pygame.draw.line(surface, (200, 200, 200), 
                              (line_x, 0), 
-                             (line_x, random.randint(10, 30)))
+                             (line_x, cosmetic_random.randint(10, 30)))
 
-    def _add_storm_details(self, surface):
+    @staticmethod
+    def _add_storm_details(surface, colors):
         # Adiciona padrão de redemoinho para representar tempestades solares
         width, height = surface.get_size()
 
         # Cria padrões semelhantes a ondas
         for y in range(0, height, 10):
-            amplitude = random.randint(5, 15)
+            amplitude = cosmetic_random.randint(5, 15)
             for x in range(0, width, 2):
                 wave_y = y + int(amplitude * ((x / width) * 2 - 1) ** 2)
                 if 0 <= wave_y < height and 0 <= x < width:
-                    surface.set_at((x, wave_y), self.colors["detail_color"])
+                    surface.set_at((x, wave_y), colors["detail_color"])
 
     def update(self):
         # Move o obstáculo para a esquerda
         self.x -= self.speed
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """Desenha o obstáculo e retorna a região da tela alterada.
+
+        ``alpha`` interpola entre a posição do passo de simulação anterior (0) e a atual (1).
+        """
+        # A velocidade é constante, então a posição anterior é x + speed
+        x = self.x + self.speed * (1.0 - alpha)
         if self.using_sprites and self.top_sprite is not None and self.bottom_sprite is not None:
             # Para todos os planetas, sempre desenhar ambos os obstáculos
             # Desenha o obstáculo superior
             top_y_position = (self.gap_y - self.GAP // 2) - self.top_sprite.get_height()
             
             # Garante que não desenhamos fora da tela (pode estar parcialmente visível)
+            dirty = None
             if top_y_position + self.top_sprite.get_height() > 0:
-                screen.blit(self.top_sprite, (self.x, top_y_position))
+                dirty = screen.blit(self.top_sprite, (x, top_y_position))
             
             # Desenha o obstáculo inferior
             bottom_y = self.gap_y + self.GAP // 2
-            screen.blit(self.bottom_sprite, (self.x, bottom_y))
+            bottom_rect = screen.blit(self.bottom_sprite, (x, bottom_y))
+            return bottom_rect.union(dirty) if dirty else bottom_rect
         else:
             # Desenha obstáculo superior e inferior quando não há sprites
             if hasattr(self, 'top_obstacle') and hasattr(self, 'bottom_obstacle'):
@@ -269,8 +260,10 @@ class Obstacle:
                 
                 # Sempre desenha ambos os obstáculos para todos os planetas
                 # Desenha obstáculo superior
-                screen.blit(self.top_obstacle, (self.x, 0))
+                top_rect = screen.blit(self.top_obstacle, (x, 0))
                 
                 # Desenha obstáculo inferior
                 bottom_obstacle_y = self.gap_y + self.GAP // 2
-                screen.blit(self.bottom_obstacle, (self.x, bottom_obstacle_y))
+                bottom_rect = screen.blit(self.bottom_obstacle, (x, bottom_obstacle_y))
+                return top_rect.union(bottom_rect)
+        return None
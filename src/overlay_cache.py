@@ -0,0 +1,77 @@
+import pygame
+import src.config as config
+
+
+class OverlayCache:
+    """Cache de sobreposições de tela inteira (escurecimento, flash e tingimento).
+
+    Cada combinação (cor, alfa, tamanho) é construída uma única vez como uma
+    superfície opaca no formato do display com alfa de superfície, que é mais
+    barata de desenhar do que uma superfície SRCALPHA preenchida a cada quadro.
+    O conjunto é descartado e reconstruído quando a resolução muda.
+    """
+
+    def __init__(self, alpha_step=config.OVERLAY_ALPHA_STEP):
+        self.alpha_step = max(1, alpha_step)
+        self._overlays = {}
+        self._display_size = None
+
+    def _check_resolution(self):
+        """Descarta as sobreposições se a resolução do display mudou"""
+        screen = pygame.display.get_surface()
+        display_size = screen.get_size() if screen is not None else (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        if display_size != self._display_size:
+            self._overlays.clear()
+            self._display_size = display_size
+        return display_size
+
+    def quantize_alpha(self, alpha):
+        """Arredonda o alfa para o passo configurado (usado em efeitos animados)"""
+        alpha = max(0, min(255, int(alpha)))
+        return min(255, int(round(alpha / self.alpha_step)) * self.alpha_step)
+
+    def get(self, color, alpha, size=None):
+        """Obtém a sobreposição com a cor e alfa informados.
+
+        Sem ``size`` a sobreposição cobre o display inteiro.
+        """
+        display_size = self._check_resolution()
+        size = display_size if size is None else (int(size[0]), int(size[1]))
+        key = (tuple(color[:3]), int(alpha), size)
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            overlay.fill(color[:3])
+            overlay.set_alpha(int(alpha))
+            self._overlays[key] = overlay
+        return overlay
+
+    def get_quantized(self, color, alpha, size=None):
+        """Obtém a sobreposição com o alfa quantizado, para efeitos animados"""
+        return self.get(color, self.quantize_alpha(alpha), size)
+
+    def get_custom(self, name, size, builder):
+        """Obtém uma sobreposição construída por ``builder(size)`` uma única vez"""
+        self._check_resolution()
+        key = (name, (int(size[0]), int(size[1])))
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            overlay = builder(key[1])
+            self._overlays[key] = overlay
+        return overlay
+
+    def clear(self):
+        """Descarta todas as sobreposições"""
+        self._overlays.clear()
+        self._display_size = None
+
+
+# Cache padrão usado pelos caminhos de desenho
+overlay_cache = OverlayCache()
+
+
+def get_overlay(color, alpha, size=None):
+    """Atalho para obter uma sobreposição do cache padrão"""
+    return overlay_cache.get(color, alpha, size)
@@ -0,0 +1,158 @@
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """Sistema de partículas com arrays NumPy de capacidade fixa.
+
+    Posição, velocidade, vida, raio e cor de cada partícula ficam em arrays
+    pré-alocados; a integração é vetorizada e partículas mortas são
+    removidas por troca com as vivas do fim do bloco (swap-remove), sem
+    realocar memória. O desenho usa sprites de ponto suave pré-renderizados
+    por cor, raio e nível de alfa, enviados em lote ao ``Surface.blits``.
+    """
+
+    ALPHA_LEVELS = 16  # Níveis de transparência com sprite próprio
+
+    def __init__(self, capacity, max_radius=8, soft=True):
+        self.capacity = capacity
+        self.max_radius = max_radius
+        self.soft = soft
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.life = np.zeros(capacity, dtype=np.float64)
+        self.max_life = np.ones(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+
+        # Paleta de cores e tabela de sprites (cor x raio x nível de alfa)
+        self._palette = {}
+        self._sprites = np.empty((0, max_radius + 1, self.ALPHA_LEVELS), dtype=object)
+
+    def __len__(self):
+        return self.count
+
+    def _get_color_index(self, color):
+        """Registra uma cor na paleta, pré-renderizando seus sprites"""
+        color = tuple(color[:3])
+        index = self._palette.get(color)
+        if index is None:
+            index = len(self._palette)
+            self._palette[color] = index
+            sprites = np.empty((1, self.max_radius + 1, self.ALPHA_LEVELS), dtype=object)
+            for radius in range(self.max_radius + 1):
+                for level in range(self.ALPHA_LEVELS):
+                    alpha = 255 * (level + 1) // self.ALPHA_LEVELS
+                    sprites[0, radius, level] = self._build_sprite(color, radius, alpha)
+            self._sprites = np.concatenate((self._sprites, sprites))
+        return index
+
+    def _build_sprite(self, color, radius, alpha):
+        """Cria o sprite de um ponto (suave ou sólido) com o alfa informado"""
+        size = max(1, radius * 2)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        if radius <= 0:
+            return sprite
+
+        if self.soft:
+            # Círculos concêntricos com alfa crescente em direção ao centro
+            for ring in range(radius, 0, -1):
+                ring_alpha = int(alpha * (1 - (ring - 1) / radius) ** 0.5)
+                pygame.draw.circle(sprite, (*color, ring_alpha), (radius, radius), ring)
+        else:
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        return sprite
+
+    def emit(self, x, y, vx, vy, life, radius, color):
+        """Adiciona uma partícula; retorna False se a capacidade estiver esgotada"""
+        if self.count >= self.capacity:
+            return False
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.max_life[i] = life
+        self.radius[i] = min(self.max_radius, max(0, int(radius)))
+        self.color_index[i] = self._get_color_index(color)
+        self.count += 1
+        return True
+
+    def emit_many(self, x, y, vx, vy, life, radius, color):
+        """Adiciona várias partículas de uma vez (arrays ou escalares); retorna quantas couberam"""
+        amount = len(np.atleast_1d(vx))
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return 0
+
+        def column(value):
+            value = np.asarray(value)
+            return np.broadcast_to(value, (amount,)) if value.ndim == 0 else value[:amount]
+
+        block = slice(self.count, self.count + amount)
+        self.x[block] = column(x)
+        self.y[block] = column(y)
+        self.vx[block] = column(vx)
+        self.vy[block] = column(vy)
+        self.life[block] = column(life)
+        self.max_life[block] = column(life)
+        self.radius[block] = np.clip(column(radius), 0, self.max_radius).astype(np.int32)
+        self.color_index[block] = self._get_color_index(color)
+        self.count += amount
+        return amount
+
+    def update(self, dt=1.0):
+        """Integra posições, consome vida e remove as partículas mortas"""
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+        self._compact()
+
+    def _compact(self):
+        """Remove partículas mortas trocando-as pelas vivas do fim do bloco"""
+        n = self.count
+        alive = self.life[:n] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept == n:
+            return
+
+        # Buracos dentro do prefixo mantido recebem as vivas que estão além dele
+        holes = np.flatnonzero(~alive[:kept])
+        movers = kept + np.flatnonzero(alive[kept:n])
+        for array in (self.x, self.y, self.vx, self.vy, self.life,
+                      self.max_life, self.radius, self.color_index):
+            array[holes] = array[movers]
+        self.count = kept
+
+    def clear(self):
+        """Remove todas as partículas"""
+        self.count = 0
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """Desenha todas as partículas e retorna a região alterada (ou None)"""
+        n = self.count
+        if n == 0:
+            return None
+
+        radius = self.radius[:n]
+        # Após a compactação 0 < vida <= vida máxima, então o nível já fica na faixa válida
+        levels = (self.life[:n] * (self.ALPHA_LEVELS - 1) / self.max_life[:n]).astype(np.int32)
+        sprites = self._sprites[self.color_index[:n], radius, levels]
+
+        xs = (self.x[:n] - radius).astype(np.int32) + offset_x
+        ys = (self.y[:n] - radius).astype(np.int32) + offset_y
+        screen.blits(zip(sprites.tolist(), zip(xs.tolist(), ys.tolist())), doreturn=False)
+
+        size = 2 * self.max_radius
+        left, top = int(xs.min()), int(ys.min())
+        return pygame.Rect(left, top, int(xs.max()) - left + size, int(ys.max()) - top + size)
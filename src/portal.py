@@ -1,10 +1,13 @@
 import pygame
 import math
-import random
+import numpy as np
+from src.particles import ParticleSystem
+from src.rng import cosmetic_random
 
 class Portal:
     WIDTH = 60
     HEIGHT = 100
+    PARTICLE_COUNT = 20
     
     def __init__(self, x, y, target_planet):
         self.x = x
@@ -14,8 +17,7 @@ class Portal:
         
         # Variáveis de animação
         self.animation_counter = 0
-        self.particles = []
-        self.generate_particles()
+        self.particles = ParticleSystem(capacity=self.PARTICLE_COUNT, max_radius=3)
         
         # Cores para diferentes portais de planetas
         self.portal_colors = {
@@ -32,41 +34,34 @@ class Portal:
         
         # Obtém cor com base no planeta alvo
         self.color = self.portal_colors.get(target_planet, (128, 0, 128))  # Roxo padrão
+        self.generate_particles()
     
     def generate_particles(self):
-        """Gera partículas para o efeito do portal"""
-        self.particles = []
-        for _ in range(20):
-            angle = random.random() * 2 * math.pi
-            speed = 0.5 + random.random() * 1.5
-            size = 2 + random.random() * 4
-            lifetime = 30 + random.random() * 30
-            self.particles.append({
-                "x": self.x + self.WIDTH // 2,
-                "y": self.y + self.HEIGHT // 2,
-                "angle": angle,
-                "speed": speed,
-                "size": size,
-                "lifetime": lifetime,
-                "current_life": lifetime
-            })
+        """Gera partículas para o efeito do portal até completar PARTICLE_COUNT"""
+        amount = self.PARTICLE_COUNT - len(self.particles)
+        if amount <= 0:
+            return
+        angle = np.array([cosmetic_random.random() * 2 * math.pi for _ in range(amount)])
+        speed = np.array([0.5 + cosmetic_random.random() * 1.5 for _ in range(amount)])
+        size = np.array([2 + cosmetic_random.random() * 4 for _ in range(amount)])
+        lifetime = np.array([30 + cosmetic_random.random() * 30 for _ in range(amount)])
+        self.particles.emit_many(
+            self.x + self.WIDTH // 2,
+            self.y + self.HEIGHT // 2,
+            np.cos(angle) * speed,
+            np.sin(angle) * speed,
+            lifetime,
+            size // 2,  # O tamanho é o diâmetro do ponto
+            self.color
+        )
     
     def update(self):
         """Atualiza a animação do portal"""
         self.animation_counter += 0.05
         
-        # Atualiza partículas existentes
-        for particle in self.particles:
-            particle["x"] += math.cos(particle["angle"]) * particle["speed"]
-            particle["y"] += math.sin(particle["angle"]) * particle["speed"]
-            particle["current_life"] -= 1
-            
-            # Reinicia partículas mortas
-            if particle["current_life"] <= 0:
-                particle["x"] = self.x + self.WIDTH // 2
-                particle["y"] = self.y + self.HEIGHT // 2
-                particle["angle"] = random.random() * 2 * math.pi
-                particle["current_life"] = particle["lifetime"]
+        # Atualiza partículas existentes e repõe as que morreram no centro
+        self.particles.update()
+        self.generate_particles()
     
     def draw(self, screen):
         """Desenha o portal"""
@@ -108,18 +103,8 @@ class Portal:
         pygame.draw.ellipse(screen, darker_color, 
                           (inner_x, inner_y, inner_width, inner_height))
         
-        # Desenha partículas
-        for particle in self.particles:
-            # Calcula alfa com base na vida útil restante
-            alpha = int(255 * (particle["current_life"] / particle["lifetime"]))
-            particle_color = (self.color[0], self.color[1], self.color[2], alpha)
-            particle_surface = pygame.Surface((int(particle["size"]), int(particle["size"])), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, particle_color, 
-                             (int(particle["size"]) // 2, int(particle["size"]) // 2), 
-                             int(particle["size"]) // 2)
-            screen.blit(particle_surface, 
-                       (int(particle["x"] - particle["size"] // 2), 
-                        int(particle["y"] - particle["size"] // 2)))
+        # Desenha partículas (alfa com base na vida útil restante)
+        self.particles.draw(screen)
     
     def check_collision(self, spacecraft):
         """Verifica se a nave espacial entrou no portal"""
@@ -1,5 +1,6 @@
 import pygame
 import src.config as config
+from src.swept_aabb import sweep_aabb
 
 class Projetil:
     """Representa um projétil disparado pela espaçonave"""
@@ -10,36 +11,53 @@ class Projetil:
     COR_ALTERNATIVA = (255, 255, 255)
 
     def __init__(self, x, y, velocidade=12):
+        self.reset(x, y, velocidade)
+
+    def reset(self, x, y, velocidade=12):
+        """(Re)inicializa o projétil; usado pelo construtor e pelo pool de entidades"""
         self.x = x
         self.y = y
+        self.x_anterior = x  # Posição no quadro anterior, para a colisão contínua
         self.velocidade = velocidade
         self.contador_animacao = 0
 
     def atualizar(self):
         """Move o projétil para a direita e atualiza a animação"""
+        self.x_anterior = self.x
         self.x += self.velocidade
         self.contador_animacao += 0.2
 
     def fora_da_tela(self):
         return self.x > config.SCREEN_WIDTH
 
-    def desenhar(self, tela):
-        """Desenha o projétil com simples animação de cintilação"""
+    def desenhar(self, tela, alpha=1.0):
+        """Desenha o projétil com simples animação de cintilação.
+
+        ``alpha`` interpola entre a posição do passo de simulação anterior (0) e a atual (1).
+        """
         cor = self.COR_PRINCIPAL if int(self.contador_animacao) % 2 == 0 else self.COR_ALTERNATIVA
-        pygame.draw.rect(tela, cor, (self.x, self.y, self.LARGURA, self.ALTURA))
+        x = self.x_anterior + (self.x - self.x_anterior) * alpha
+        return pygame.draw.rect(tela, cor, (x, self.y, self.LARGURA, self.ALTURA))
 
     def colide_com(self, obstaculo):
-        """Verifica colisão simples com um obstáculo"""
+        """Verifica colisão com um obstáculo ao longo de todo o trajeto do quadro (sem criar Rects)"""
         largura_obstaculo = getattr(obstaculo, 'top_width', obstaculo.WIDTH)
-        altura_superior = (obstaculo.gap_y - obstaculo.GAP // 2)
-        altura_inferior = (obstaculo.gap_y + obstaculo.GAP // 2)
 
-        # Retângulo do projétil
-        ret_proj = pygame.Rect(self.x, self.y, self.LARGURA, self.ALTURA)
+        # No referencial do obstáculo, que também se moveu para a esquerda desde o último teste
+        inicio_x = self.x_anterior - getattr(obstaculo, 'speed', 0)
+        deslocamento_x = self.x - inicio_x
+        direita_obstaculo = obstaculo.x + largura_obstaculo
 
-        # Retângulo do obstáculo superior
-        ret_sup = pygame.Rect(obstaculo.x, 0, largura_obstaculo, altura_superior)
-        # Retângulo do obstáculo inferior
-        ret_inf = pygame.Rect(obstaculo.x, altura_inferior, largura_obstaculo, config.SCREEN_HEIGHT - altura_inferior)
+        # Descarte rápido: o trajeto nem alcança a coluna do obstáculo
+        if max(inicio_x, self.x) + self.LARGURA <= obstaculo.x or min(inicio_x, self.x) >= direita_obstaculo:
+            return False
 
-        return ret_proj.colliderect(ret_sup) or ret_proj.colliderect(ret_inf)
+        # Obstáculo superior vai de 0 até o início do vão; o inferior, do fim do vão até a base da tela
+        altura_superior = (obstaculo.gap_y - obstaculo.GAP // 2)
+        altura_inferior = (obstaculo.gap_y + obstaculo.GAP // 2)
+        return (
+            sweep_aabb(inicio_x, self.y, self.LARGURA, self.ALTURA, deslocamento_x, 0,
+                       obstaculo.x, 0, direita_obstaculo, altura_superior) is not None
+            or sweep_aabb(inicio_x, self.y, self.LARGURA, self.ALTURA, deslocamento_x, 0,
+                          obstaculo.x, altura_inferior, direita_obstaculo, config.SCREEN_HEIGHT) is not None
+        )
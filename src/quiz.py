@@ -1,6 +1,9 @@
 import pygame
 import pygame.mixer
 import src.config as config
+from src.text_cache import render_text
+from src.overlay_cache import get_overlay
+from src.dirty_rects import dirty_rects, mark_dirty
 
 class Quiz:
     def __init__(self, screen_width, screen_height):
@@ -15,6 +18,7 @@ class Quiz:
         self.quiz_timer = 0
         self.result_timer = 0
         self.explanation = None
+        self._drawn_result = None  # Resultado exibido no último quadro desenhado
         
         # Fonte para texto do quiz usando fontes globais
         # GAME_FONT e SMALL_FONT são inicializados em src.main
@@ -47,7 +51,8 @@ class Quiz:
                 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Verifica se o usuário clicou em um botão de opção
-            mouse_pos = pygame.mouse.get_pos()
+            # (posição do próprio evento, para funcionar também em replays)
+            mouse_pos = event.pos
             
             # Verifica cada botão de opção
             for i in range(len(self.options)):
@@ -112,19 +117,23 @@ class Quiz:
         """Desenha a interface do quiz"""
         if not self.active:
             return
+
+        # O resultado (inclusive por tempo esgotado) muda a tela inteira
+        if self.result != self._drawn_result:
+            dirty_rects.mark_full()
+            self._drawn_result = self.result
             
         # Desenha fundo semitransparente
-        backdrop = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        backdrop.fill((0, 0, 0, 200))  # Preto semitransparente
+        backdrop = get_overlay((0, 0, 0), 200, (self.screen_width, self.screen_height))  # Preto semitransparente
         screen.blit(backdrop, (0, 0))
         
         # Desenha título do quiz
-        title_text = self.font_large.render("Quiz do Sistema Solar", True, (255, 255, 255))
+        title_text = render_text(self.font_large, "Quiz do Sistema Solar", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 100))
         screen.blit(title_text, title_rect)
         
         # Desenha pergunta
-        question_text = self.font_medium.render(self.current_question, True, (255, 255, 255))
+        question_text = render_text(self.font_medium, self.current_question, True, (255, 255, 255))
         question_rect = question_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
         screen.blit(question_text, question_rect)
         
@@ -135,7 +144,7 @@ class Quiz:
         timer_y = self.screen_height // 2 - 20
         
         # Desenha fundo do temporizador
-        pygame.draw.rect(screen, (100, 100, 100), (timer_x, timer_y, timer_width, timer_height))
+        mark_dirty(pygame.draw.rect(screen, (100, 100, 100), (timer_x, timer_y, timer_width, timer_height)))
         
         # Desenha preenchimento do temporizador com base no tempo restante
         timer_fill_width = int(timer_width * (self.quiz_timer / config.QUIZ_DURATION))
@@ -164,27 +173,27 @@ class Quiz:
             pygame.draw.rect(screen, (200, 200, 200), button_rect, width=2, border_radius=5)
             
             # Desenha texto da opção
-            option_text = self.font_small.render(f"{i+1}. {option}", True, text_color)
+            option_text = render_text(self.font_small, f"{i+1}. {option}", True, text_color)
             option_text_rect = option_text.get_rect(midleft=(button_rect.left + 20, button_rect.centery))
             screen.blit(option_text, option_text_rect)
         
         # Desenha mensagem de resultado se apropriado
         if self.result is not None:
             if self.result == "correct":
-                result_text = self.font_large.render("Correto!", True, (0, 255, 0))
+                result_text = render_text(self.font_large, "Correto!", True, (0, 255, 0))
                 result_rect = result_text.get_rect(center=(self.screen_width // 2, 150))
             elif self.result == "incorrect":
-                result_text = self.font_large.render("Incorreto!", True, (255, 0, 0))
+                result_text = render_text(self.font_large, "Incorreto!", True, (255, 0, 0))
                 result_rect = result_text.get_rect(center=(self.screen_width // 2, 150))
             else:  # timeout
-                result_text = self.font_large.render("Tempo Esgotado!", True, (255, 165, 0))
+                result_text = render_text(self.font_large, "Tempo Esgotado!", True, (255, 165, 0))
                 result_rect = result_text.get_rect(center=(self.screen_width // 2, self.screen_height - 100))
 
             screen.blit(result_text, result_rect)
 
             # Desenha explicação ou dica abaixo do resultado
             if self.result in ["correct", "incorrect"] and self.explanation:
-                explanation_text = self.font_small.render(self.explanation, True, (255, 255, 255))
+                explanation_text = render_text(self.font_small, self.explanation, True, (255, 255, 255))
                 explanation_rect = explanation_text.get_rect(center=(self.screen_width // 2, result_rect.bottom + 30))
                 screen.blit(explanation_text, explanation_rect)
     
@@ -0,0 +1,132 @@
+import gzip
+import json
+import time
+import pygame
+
+REPLAY_VERSION = 1
+
+# Eventos gravados e os atributos guardados de cada um. Movimentos do mouse
+# não são gravados: o jogo só usa a posição do clique.
+RECORDED_EVENTS = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ("key", "mod", "unicode", "scancode"),
+    pygame.KEYUP: ("key", "mod", "unicode", "scancode"),
+    pygame.MOUSEBUTTONDOWN: ("pos", "button"),
+    pygame.MOUSEBUTTONUP: ("pos", "button"),
+}
+
+
+class InputRecorder:
+    """Grava os eventos de entrada processados pelo ``InputHandler``.
+
+    Cada evento é guardado com o índice do passo de simulação em que foi
+    processado (``game.sim_frame``) e o tempo real, em milissegundos, desde
+    o início da gravação. O arquivo é um JSON compactado com gzip que inclui
+    a semente dos geradores aleatórios e o progresso salvo no início da
+    partida, o suficiente para ``InputPlayer`` reproduzi-la.
+    """
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.events = []
+        self.game = None
+        self.progress = None
+        self._start = time.perf_counter()
+
+    def attach(self, game):
+        """Passa a gravar as entradas do jogo"""
+        self.game = game
+        self.progress = {"last_planet": game.last_planet, "furthest_planet": game.furthest_planet}
+        self._start = time.perf_counter()
+        game.input_handler.recorder = self
+
+    def record(self, frame, events):
+        """Registra os eventos processados antes do passo de simulação ``frame``"""
+        if not events:
+            return
+        timestamp = int((time.perf_counter() - self._start) * 1000)
+        for event in events:
+            attributes = RECORDED_EVENTS.get(event.type)
+            if attributes is None:
+                continue
+            data = {}
+            for name in attributes:
+                value = getattr(event, name, None)
+                if value is not None:
+                    data[name] = list(value) if isinstance(value, tuple) else value
+            self.events.append([frame, timestamp, event.type, data])
+
+    def save(self):
+        """Grava o arquivo de replay; retorna False se não foi possível"""
+        replay = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "progress": self.progress,
+            "frames": self.game.sim_frame if self.game is not None else 0,
+            "events": self.events,
+        }
+        try:
+            with gzip.open(self.path, "wt", encoding="utf-8") as file:
+                json.dump(replay, file, separators=(",", ":"))
+        except OSError as e:
+            print(f"Erro ao salvar o replay {self.path}: {e}")
+            return False
+        print(f"Replay salvo em {self.path}: {len(self.events)} eventos em {replay['frames']} quadros")
+        return True
+
+
+class InputPlayer:
+    """Reproduz um arquivo de replay gravado pelo ``InputRecorder``.
+
+    Substitui a origem de eventos do ``InputHandler``: a cada chamada de
+    ``handle_events`` entrega os eventos gravados para o passo de simulação
+    atual, ignorando a fila real do pygame. O jogo deve ser criado com a
+    semente do replay (``seed``) e não deve ser reiniciado antes de
+    ``attach``, pois a gravação começa na tela inicial.
+    """
+
+    def __init__(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            replay = json.load(file)
+
+        if replay.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {replay.get('version')}")
+
+        self.path = path
+        self.seed = replay["seed"]
+        self.progress = replay.get("progress")
+        self.frames = replay["frames"]
+        self.events = [
+            (frame, pygame.event.Event(event_type, {
+                name: tuple(value) if isinstance(value, list) else value
+                for name, value in data.items()
+            }))
+            for frame, _timestamp, event_type, data in replay["events"]
+        ]
+        self.game = None
+        self.position = 0
+
+    def attach(self, game):
+        """Passa a alimentar o jogo com os eventos gravados"""
+        self.game = game
+        self.position = 0
+        if self.progress:
+            game.apply_planet_progress(self.progress["last_planet"], self.progress["furthest_planet"])
+        game.input_handler.event_source = self.poll
+
+    def poll(self):
+        """Eventos gravados para o passo de simulação atual"""
+        # Esvazia a fila real para que o sistema não acumule eventos
+        pygame.event.get()
+
+        frame = self.game.sim_frame
+        start = self.position
+        while self.position < len(self.events) and self.events[self.position][0] <= frame:
+            self.position += 1
+        return [event for _frame, event in self.events[start:self.position]]
+
+    @property
+    def finished(self):
+        """Indica se todos os eventos já foram entregues"""
+        return self.position >= len(self.events)
@@ -0,0 +1,67 @@
+import random
+import zlib
+import numpy as np
+
+
+class RNGService:
+    """Serviço central de números aleatórios com fluxos nomeados.
+
+    Cada fluxo ("gameplay", "cosmetic", "quiz") é um ``random.Random``
+    independente, com um ``numpy.random.Generator`` associado para o código
+    vetorizado. Com uma semente fixa, cada fluxo recebe uma semente
+    derivada do seu nome: efeitos visuais podem consumir quantos números
+    quiserem sem alterar a sequência da jogabilidade. Os objetos dos fluxos
+    nunca são substituídos (``seed`` os ressemeia no lugar), então os
+    módulos podem guardar referências a eles.
+    """
+
+    STREAMS = ("gameplay", "cosmetic", "quiz")
+
+    def __init__(self, seed=None):
+        self._streams = {name: random.Random() for name in self.STREAMS}
+        self._numpy_streams = {}
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Ressemeia todos os fluxos; ``None`` usa entropia do sistema (execução não reproduzível)"""
+        self.base_seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(self._derive_seed(name))
+        for name in self._numpy_streams:
+            self._numpy_streams[name] = self._new_numpy_stream(name)
+
+    def _derive_seed(self, name):
+        """Semente do fluxo, derivada da semente base e do nome"""
+        if self.base_seed is None:
+            return None
+        return f"{self.base_seed}:{name}"
+
+    def _new_numpy_stream(self, name):
+        if self.base_seed is None:
+            return np.random.default_rng()
+        return np.random.default_rng([int(self.base_seed), zlib.crc32(name.encode())])
+
+    def stream(self, name):
+        """Obtém o fluxo ``random.Random`` com o nome informado"""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(self._derive_seed(name))
+            self._streams[name] = stream
+        return stream
+
+    def numpy(self, name):
+        """Obtém o ``numpy.random.Generator`` do fluxo (recriado a cada ``seed``)"""
+        generator = self._numpy_streams.get(name)
+        if generator is None:
+            generator = self._new_numpy_stream(name)
+            self._numpy_streams[name] = generator
+        return generator
+
+
+# Serviço padrão usado pelo jogo
+rng = RNGService()
+
+# Fluxos mais usados
+gameplay_random = rng.stream("gameplay")
+cosmetic_random = rng.stream("cosmetic")
+quiz_random = rng.stream("quiz")
@@ -3,6 +3,19 @@ import os
 from src.config import DEFAULT_SOUND_VOLUME, THRUST_SOUND_VOLUME, HIT_SOUND_VOLUME
 
 class SoundManager:
+    # Narração de boas-vindas de cada planeta
+    WELCOME_SOUND_FILES = {
+        "Earth": "assets/sounds/welcome/terra.mp3",
+        "Mercury": "assets/sounds/welcome/mercurio.mp3",
+        "Venus": "assets/sounds/welcome/venus.mp3",
+        "Moon": "assets/sounds/welcome/lua.mp3",
+        "Mars": "assets/sounds/welcome/marte.mp3",
+        "Jupiter": "assets/sounds/welcome/jupiter.mp3",
+        "Saturn": "assets/sounds/welcome/saturno.mp3",
+        "Uranus": "assets/sounds/welcome/urano.mp3",
+        "Neptune": "assets/sounds/welcome/Netuno.mp3"
+    }
+
     def __init__(self):
         # Inicializa o sistema de som
         self.engine_thrust_sound = None
@@ -35,15 +48,8 @@ class SoundManager:
             
             # Carrega os sons de boas-vindas para cada planeta
             self.welcome_sounds = {
-                "Earth": pygame.mixer.Sound("assets/sounds/welcome/terra.mp3"),
-                "Mercury": pygame.mixer.Sound("assets/sounds/welcome/mercurio.mp3"),
-                "Venus": pygame.mixer.Sound("assets/sounds/welcome/venus.mp3"),
-                "Moon": pygame.mixer.Sound("assets/sounds/welcome/lua.mp3"),
-                "Mars": pygame.mixer.Sound("assets/sounds/welcome/marte.mp3"),
-                "Jupiter": pygame.mixer.Sound("assets/sounds/welcome/jupiter.mp3"),
-                "Saturn": pygame.mixer.Sound("assets/sounds/welcome/saturno.mp3"),
-                "Uranus": pygame.mixer.Sound("assets/sounds/welcome/urano.mp3"),
-                "Neptune": pygame.mixer.Sound("assets/sounds/welcome/Netuno.mp3")
+                planet: pygame.mixer.Sound(path)
+                for planet, path in self.WELCOME_SOUND_FILES.items()
             }
             
             # Carrega as músicas de fundo para cada planeta
@@ -227,4 +233,76 @@ class SoundManager:
     def increase_music_volume_on_progress(self, score):
         """Aumenta o volume da música quando o jogador alcança determinada pontuação"""
         if score >= 2 and pygame.mixer.music.get_busy() and pygame.mixer.music.get_volume() < self.target_volume:
-            self.adjust_music_volume(self.target_volume)
\ No newline at end of file
+            self.adjust_music_volume(self.target_volume)
+
+
+class NullSound:
+    """Som silencioso com a mesma interface usada de pygame.mixer.Sound"""
+
+    def play(self, loops=0, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def fadeout(self, time):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+    def get_length(self):
+        return 0.0
+
+    def get_num_channels(self):
+        return 0
+
+
+class SilentSoundManager(SoundManager):
+    """Gerenciador de som do modo headless: não toca sons nem músicas.
+
+    Das narrações de boas-vindas só lê a duração (decodificando cada arquivo
+    uma vez por processo), pois a transição espera a narração terminar.
+    """
+
+    # Duração de cada narração em ms, compartilhada por todas as instâncias
+    WELCOME_DURATIONS = None
+
+    @classmethod
+    def get_welcome_durations(cls):
+        """Durações das narrações de boas-vindas, medidas na primeira chamada"""
+        if cls.WELCOME_DURATIONS is None:
+            cls.WELCOME_DURATIONS = {}
+            for planet, path in cls.WELCOME_SOUND_FILES.items():
+                try:
+                    cls.WELCOME_DURATIONS[planet] = int(pygame.mixer.Sound(path).get_length() * 1000)
+                except pygame.error as e:
+                    print(f"Não foi possível ler a duração da narração de {planet}: {e}")
+        return cls.WELCOME_DURATIONS
+
+    def load_sounds(self):
+        silent = NullSound()
+        self.engine_thrust_sound = silent
+        self.explosion_sound = silent
+        self.hitting_obstacle_sound = silent
+        self.welcome_sounds = {}
+        self.background_music = {}
+
+        # A transição espera a narração de boas-vindas terminar; com as
+        # durações reais o modo headless avança no mesmo ritmo do jogo com som
+        # (necessário para reproduzir replays gravados com som)
+        self.welcome_durations = self.get_welcome_durations()
+        return True
+
+    def play_welcome(self, planet_name):
+        """Não toca nada; retorna a duração que a narração teria, em milissegundos"""
+        return self.welcome_durations.get(planet_name, 0)
+
+    def play_planet_music(self, planet_name):
+        """Apenas registra a música do planeta, sem usar o mixer"""
+        self.current_music = planet_name
+        self.music_active = True
+        return True
@@ -1,17 +1,28 @@
 import pygame
 import os
+import src.config as config
 
 class Spacecraft:
     WIDTH = 100
     HEIGHT = 40
     HITBOX_WIDTH = 70  # Largura da caixa de colisão
     HITBOX_HEIGHT = 28 # Altura da caixa de colisão
-    
+
+    # Faixa de inclinação da nave (ver update)
+    MIN_ANGLE = -30
+    MAX_ANGLE = 60
+
+    # Atlas de sprites pré-rotacionados compartilhado entre instâncias,
+    # indexado pelas cores da chama e pelo passo angular
+    ROTATION_ATLAS_CACHE = {}
     
     def __init__(self, x, y):
         # Posição e física
         self.x = x
         self.y = y
+        # Posição no início do último update, para a colisão contínua
+        self.prev_x = x
+        self.prev_y = y
         self.velocity = 0
         self.angle = 0
         # Cores da chama substituídas: gradiente do exterior para o interior (exterior estático, interior dinâmico)
@@ -31,11 +42,15 @@ class Spacecraft:
         self.thrust_display_time = 400  # ms para exibir a chama do empuxo
         # Largura da extensão da chama para uma chama de motor mais proeminente (mais larga para maior efeito)
         self.flame_extent = 40
+        # Caixa de colisão persistente, atualizada no lugar por update_hitbox
+        self.hitbox = pygame.Rect(0, 0, self.HITBOX_WIDTH, self.HITBOX_HEIGHT)
         # Variáveis de animação da chama
         self.animation_frames = 10
         self.current_frame = 0
         self.animation_speed = 0.1
         self.animation_counter = 0
+        # Passo angular (graus) dos sprites pré-rotacionados
+        self.rotation_step = max(1, int(config.SPACECRAFT_ROTATION_STEP))
         # Carrega o sprite da espaçonave
         self.sprite_path = os.path.join("assets", "images", "nova_2x.png")
         self.sprite = pygame.image.load(self.sprite_path)
@@ -45,6 +60,10 @@ class Spacecraft:
         self.create_animation_frames()
     
     def update(self, gravity, screen_height=720, floor_height=100, planet_name=None):
+        # Guarda a posição anterior para a detecção de colisão contínua
+        self.prev_x = self.x
+        self.prev_y = self.y
+
         # Aplica a gravidade e atualiza a posição
         self.velocity += gravity
 
@@ -80,7 +99,7 @@ class Spacecraft:
         self.y = new_y
 
         # Atualiza o ângulo da espaçonave com base na velocidade
-        self.angle = min(max(-30, -self.velocity * 2), 60)
+        self.angle = min(max(self.MIN_ANGLE, -self.velocity * 2), self.MAX_ANGLE)
 
         # Anima os quadros da chama de empuxo (sempre ciclando)
         self.animation_counter += self.animation_speed
@@ -173,37 +192,82 @@ class Spacecraft:
         # Atualiza o número de quadros de animação com base nas imagens geradas
         self.animation_frames = len(self.thrust_images)
         self.current_frame = 0  # Redefine o índice do quadro por precaução
+
+        # Obtém (ou constrói) as variantes rotacionadas de todos os quadros
+        atlas_key = (self.sprite_path, tuple(self.flame_colors), self.rotation_step)
+        atlas = self.ROTATION_ATLAS_CACHE.get(atlas_key)
+        if atlas is None:
+            atlas = self._build_rotation_atlas()
+            self.ROTATION_ATLAS_CACHE[atlas_key] = atlas
+        self.rotation_atlas = atlas
+
+    def _build_rotation_atlas(self):
+        """Pré-rotaciona a imagem base e os quadros de empuxo, com e sem o tom de invulnerabilidade.
+
+        Retorna um dicionário (índice do quadro, tingido, ângulo) -> (superfície, meia largura, meia altura),
+        onde o índice 0 é a imagem base e 1..n são os quadros de empuxo.
+        """
+        frames = [self.base_image] + self.thrust_images
+        angles = list(range(self.MIN_ANGLE, self.MAX_ANGLE + 1, self.rotation_step))
+        if angles[-1] != self.MAX_ANGLE:
+            angles.append(self.MAX_ANGLE)
+
+        atlas = {}
+        for frame_index, frame in enumerate(frames):
+            # Versão com sobreposição azulada semitransparente (invulnerável)
+            tinted_frame = frame.copy()
+            overlay = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+            overlay.fill((100, 100, 255, 100))  # Azul translúcido
+            tinted_frame.blit(overlay, (0, 0))
+
+            for tinted, image in ((False, frame), (True, tinted_frame)):
+                for angle in angles:
+                    rotated = pygame.transform.rotate(image, angle)
+                    atlas[(frame_index, tinted, angle)] = (
+                        rotated, rotated.get_width() // 2, rotated.get_height() // 2
+                    )
+        return atlas
+
+    def _quantize_angle(self, angle):
+        """Arredonda o ângulo para o passo do atlas, dentro da faixa permitida"""
+        steps = round((angle - self.MIN_ANGLE) / self.rotation_step)
+        quantized = self.MIN_ANGLE + steps * self.rotation_step
+        return max(self.MIN_ANGLE, min(self.MAX_ANGLE, quantized))
     
+    def update_hitbox(self):
+        """Posiciona a caixa de colisão (centralizada no corpo da nave) e a retorna"""
+        self.hitbox.x = self.x + self.flame_extent + (self.WIDTH - self.HITBOX_WIDTH) / 2
+        self.hitbox.y = self.y + (self.HEIGHT - self.HITBOX_HEIGHT) / 2
+        return self.hitbox
+
     def update_image(self):
         """Atualiza todos os quadros de animação"""
         self.create_animation_frames()
     
-    def draw(self, screen, invulnerable=False):
-        """Desenha a espaçonave, mostrando a chama de empuxo se o empuxo foi acionado recentemente"""
+    def draw(self, screen, invulnerable=False, alpha=1.0):
+        """Desenha a espaçonave, mostrando a chama de empuxo se o empuxo foi acionado recentemente.
+
+        ``alpha`` interpola entre a posição do passo de simulação anterior (0) e a atual (1).
+        """
         # Determina se devemos exibir a chama de empuxo
         now = pygame.time.get_ticks()
         if now - self.last_thrust_time < self.thrust_display_time:
             # Imagem de empuxo animada
-            current = self.thrust_images[self.current_frame]
+            frame_index = self.current_frame + 1
         else:
             # Imagem base sem exaustão
-            current = self.base_image
-
-        # Efeito de piscar quando invulnerável
-        if invulnerable:
-            # Faz a nave piscar a cada 200ms
-            if (now // 200) % 2 == 0:
-                # Cria uma cópia da imagem para modificar
-                current = current.copy()
-                # Adiciona uma sobreposição azulada semitransparente
-                overlay = pygame.Surface(current.get_size(), pygame.SRCALPHA)
-                overlay.fill((100, 100, 255, 100))  # Azul translúcido
-                current.blit(overlay, (0, 0))
-
-        # Rotaciona a imagem do quadro atual (ângulo positivo inclina o nariz para cima)
-        rotated = pygame.transform.rotate(current, self.angle)
+            frame_index = 0
+
+        # Efeito de piscar quando invulnerável: a nave pisca a cada 200ms
+        tinted = invulnerable and (now // 200) % 2 == 0
+
+        # Obtém o quadro já rotacionado (ângulo positivo inclina o nariz para cima)
+        rotated, half_width, half_height = self.rotation_atlas[
+            (frame_index, tinted, self._quantize_angle(self.angle))
+        ]
         # Calcula a posição central considerando a extensão da chama
-        cx = self.x + self.WIDTH // 2 + self.flame_extent // 2
-        cy = self.y + self.HEIGHT // 2
-        rect = rotated.get_rect(center=(cx, cy))
-        screen.blit(rotated, rect.topleft)
\ No newline at end of file
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        cx = x + self.WIDTH // 2 + self.flame_extent // 2
+        cy = y + self.HEIGHT // 2
+        return screen.blit(rotated, (cx - half_width, cy - half_height))
\ No newline at end of file
@@ -0,0 +1,93 @@
+import math
+import numpy as np
+import pygame
+
+
+class Starfield:
+    """Campo de estrelas cintilantes armazenado em arrays NumPy.
+
+    Posições, fases, velocidades de cintilação e brilho ficam em arrays; a
+    cintilação é calculada em um único passo vetorizado e o desenho usa
+    sprites pré-renderizados por raio e faixa de brilho, enviados ao
+    ``Surface.blits`` em lote. Camadas de paralaxe rolam a velocidades
+    diferentes quando ``update`` recebe um deslocamento horizontal.
+    """
+
+    BRIGHTNESS_LEVELS = 32  # Faixas de brilho com sprite próprio
+    MIN_SIZE = 0.5
+    MAX_SIZE = 2.0
+
+    def __init__(self, count, width, height, layers=1, rng=None):
+        self.width = width
+        self.height = height
+        self.layers = max(1, layers)
+        rng = rng if rng is not None else np.random.default_rng()
+
+        self.x = rng.integers(0, width + 1, count).astype(np.float64)
+        self.y = rng.integers(0, height + 1, count).astype(np.int32)
+        # O raio desenhado é a parte inteira do tamanho (como em pygame.draw.circle)
+        self.radius = rng.uniform(self.MIN_SIZE, self.MAX_SIZE, count).astype(np.int32)
+        self.base_brightness = rng.integers(150, 256, count).astype(np.float64)
+        self.twinkle_speed = rng.uniform(0.02, 0.1, count)
+        self.phase = rng.uniform(0, 2 * math.pi, count)
+        self.brightness = self.base_brightness.copy()
+
+        # Camadas mais distantes rolam mais devagar
+        self.layer = rng.integers(0, self.layers, count)
+        self.layer_speed = (self.layer + 1) / self.layers
+
+        self._sprites, self._sprite_offsets = self._build_sprites()
+
+    def _build_sprites(self):
+        """Pré-renderiza o sprite de cada combinação de raio e faixa de brilho.
+
+        Retorna uma tabela de superfícies (raio x faixa) e os deslocamentos
+        do canto superior esquerdo de cada raio em relação ao centro.
+        """
+        max_radius = int(self.MAX_SIZE)
+        sprites = np.empty((max_radius + 1, self.BRIGHTNESS_LEVELS), dtype=object)
+        offsets = np.zeros((max_radius + 1, 2), dtype=np.int32)
+        has_display = pygame.display.get_surface() is not None
+
+        for radius in range(max_radius + 1):
+            for level in range(self.BRIGHTNESS_LEVELS):
+                value = level * 255 // (self.BRIGHTNESS_LEVELS - 1)
+                canvas_size = 2 * radius + 3
+                canvas = pygame.Surface((canvas_size, canvas_size))
+                canvas.fill((0, 0, 0))
+                center = canvas_size // 2
+                rect = pygame.draw.circle(canvas, (value, value, value), (center, center), radius)
+                if rect.width == 0 or rect.height == 0 or value == 0:
+                    # Raio zero (ou brilho nulo) não desenha nada
+                    sprites[radius, level] = None
+                    continue
+                sprite = canvas.subsurface(rect).copy()
+                sprite.set_colorkey((0, 0, 0))
+                if has_display:
+                    sprite = sprite.convert()
+                sprites[radius, level] = sprite
+                offsets[radius] = (rect.x - center, rect.y - center)
+        return sprites, offsets
+
+    def update(self, scroll_x=0.0):
+        """Avança a cintilação e, opcionalmente, rola as camadas de paralaxe"""
+        self.phase += self.twinkle_speed
+        self.brightness = self.base_brightness * (0.5 + 0.5 * np.sin(self.phase))
+        if scroll_x:
+            self.x = (self.x - scroll_x * self.layer_speed) % (self.width + 1)
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """Desenha todas as estrelas visíveis com uma única chamada a ``blits``"""
+        levels = (self.brightness * ((self.BRIGHTNESS_LEVELS - 1) / 255.0)).astype(np.int32)
+        sprites = self._sprites[self.radius, levels]
+        visible = np.not_equal(sprites, None)
+        if not visible.any():
+            return
+
+        radius = self.radius[visible]
+        xs = self.x[visible].astype(np.int32) + self._sprite_offsets[radius, 0] + offset_x
+        ys = self.y[visible] + self._sprite_offsets[radius, 1] + offset_y
+        screen.blits(zip(sprites[visible].tolist(), zip(xs.tolist(), ys.tolist())), doreturn=False)
+
+    def __len__(self):
+        return len(self.x)
@@ -1,5 +1,6 @@
 import pygame
 import src.config as config
+from src.rng import quiz_random
 
 class StateManager:
     def __init__(self, game):
@@ -9,7 +10,16 @@ class StateManager:
         self.welcome_sound_timer = 0
         self.quiz_failure_timer = 0
         self.last_countdown_number = 0
-        self.splash_image = pygame.image.load("assets/images/inicial.png")
+        self.splash_image = self._load_splash_image()
+
+    @staticmethod
+    def _load_splash_image():
+        """Carrega a imagem da tela inicial, com uma tela preta se ela não existir"""
+        try:
+            return pygame.image.load("assets/images/inicial.png")
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Não foi possível carregar a imagem da tela inicial: {e}")
+            return pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         
     def change_state(self, new_state):
         """Muda o estado do jogo e realiza a configuração necessária"""
@@ -21,7 +31,7 @@ class StateManager:
         if new_state == config.TRANSITION:
             self.transition_time = 0
         elif new_state == config.QUIZ_FAILURE:
-            self.quiz_failure_timer = 180  # 3 segundos a 60fps
+            self.quiz_failure_timer = config.QUIZ_FAILURE_DURATION
             self.last_countdown_number = 3
             
         # Inicia música do planeta ao entrar no modo de jogo
@@ -61,7 +71,7 @@ class StateManager:
         """Atualiza temporizadores e transições de estado"""
         # Atualiza o temporizador do som de boas-vindas
         if self.welcome_sound_timer > 0:
-            self.welcome_sound_timer -= 16  # Aproximadamente 16ms por quadro a 60fps
+            self.welcome_sound_timer -= config.SIMULATION_STEP_MS  # Um passo fixo de simulação
 
         try:
             # Lida com temporizadores e transições específicos do estado
@@ -96,7 +106,7 @@ class StateManager:
                             # NÃO parar a música, apenas continuar tocando
                                 
                             self.change_state(config.QUIZ_FAILURE)
-                            self.quiz_failure_timer = 180  # 3 segundos a 60fps
+                            self.quiz_failure_timer = config.QUIZ_FAILURE_DURATION
                             self.last_countdown_number = 3
                             # Adiciona uma mensagem da NOVA sobre a falha no quiz
                             if hasattr(self.game, 'nova'):
@@ -106,7 +116,7 @@ class StateManager:
                 self.quiz_failure_timer -= 1
 
                 # Atualiza o número da contagem regressiva, se necessário
-                current_countdown = self.quiz_failure_timer // 60 + 1
+                current_countdown = self.quiz_failure_timer // config.SIMULATION_HZ + 1
                 if current_countdown < self.last_countdown_number and current_countdown >= 0:
                     self.last_countdown_number = current_countdown
 
@@ -176,8 +186,7 @@ class StateManager:
             # Certifica-se de que o jogo tem os atributos necessários
             if hasattr(self.game, 'current_planet') and hasattr(self.game, 'quiz'):
                 # Seleciona uma pergunta aleatória do quiz para o planeta atual
-                import random
-                question_data = random.choice(self.game.current_planet.quiz_questions)
+                question_data = quiz_random.choice(self.game.current_planet.quiz_questions)
 
                 # Inicia o quiz com a pergunta selecionada
                 self.game.quiz.start_quiz(
@@ -187,6 +196,12 @@ class StateManager:
                     question_data.get("explanation")
                 )
                 
+                # Pré-carrega a imagem de transição do próximo planeta enquanto
+                # o jogador responde, para que a transição não trave
+                next_index = self.game.current_planet_index + 1
+                if hasattr(self.game, 'ui_manager') and next_index < len(self.game.planets):
+                    self.game.ui_manager.warm_up_transition(self.game.planets[next_index])
+
                 # Certifica-se de que a música continue tocando durante o quiz
                 if hasattr(self.game, 'sound_manager') and not pygame.mixer.music.get_busy():
                     # A música parou por algum motivo, reinicia
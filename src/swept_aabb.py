@@ -0,0 +1,34 @@
+def _axis_interval(start, size, delta, low, high):
+    """Intervalo de tempo em que [start, start + size) + t * delta sobrepõe (low, high) em um eixo"""
+    # A caixa sobrepõe a faixa quando seu início está entre low - size e high
+    low -= size
+    if delta == 0:
+        if low < start < high:
+            return float("-inf"), float("inf")
+        return None
+    t0 = (low - start) / delta
+    t1 = (high - start) / delta
+    return (t0, t1) if t0 < t1 else (t1, t0)
+
+
+def sweep_aabb(x, y, width, height, dx, dy, left, top, right, bottom):
+    """Primeiro instante t em [0, 1] em que a caixa em movimento toca o retângulo fixo.
+
+    A caixa começa em (x, y) com tamanho (width, height) e se desloca
+    (dx, dy) durante o quadro; o retângulo vai de (left, top) a
+    (right, bottom), e os limites podem ser infinitos. Retorna None quando
+    não há contato em nenhum ponto do trajeto, o que evita que objetos
+    rápidos atravessem obstáculos finos entre dois quadros (tunneling).
+    """
+    interval_x = _axis_interval(x, width, dx, left, right)
+    if interval_x is None:
+        return None
+    interval_y = _axis_interval(y, height, dy, top, bottom)
+    if interval_y is None:
+        return None
+
+    t_enter = max(0.0, interval_x[0], interval_y[0])
+    t_exit = min(1.0, interval_x[1], interval_y[1])
+    if t_enter >= t_exit:
+        return None
+    return t_enter
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+import src.config as config
+
+
+class TextSurfaceCache:
+    """Cache LRU de superfícies de texto renderizadas.
+
+    A HUD e os menus desenham as mesmas strings a cada quadro; o cache guarda
+    a superfície de cada combinação (fonte, texto, cor, antialias) e só
+    rasteriza os glifos quando o texto muda.
+    """
+
+    def __init__(self, max_entries=config.TEXT_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._surfaces = OrderedDict()
+
+        # Estatísticas de uso
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """Retorna a superfície do texto, renderizando apenas na primeira vez
+
+        Os argumentos seguem a ordem de ``pygame.font.Font.render``.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            # Quem aplica efeitos de alfa (texto pulsante) redefine o valor a
+            # cada quadro; os demais recebem a superfície totalmente opaca
+            if surface.get_alpha() != 255:
+                surface.set_alpha(255)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def get_stats(self):
+        """Retorna as estatísticas de acertos e falhas do cache"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        """Zera os contadores de acertos e falhas"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        """Descarta todas as superfícies em cache"""
+        self._surfaces.clear()
+
+
+# Cache padrão usado pelos caminhos de desenho da interface
+text_cache = TextSurfaceCache()
+
+
+def render_text(font, text, antialias, color):
+    """Atalho para renderizar texto através do cache padrão"""
+    return text_cache.render(font, text, antialias, color)
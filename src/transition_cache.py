@@ -0,0 +1,81 @@
+import os
+import pygame
+from src.planet_data import PLANET_NAME_PT
+
+
+class TransitionImageCache:
+    """Cache das imagens de transição já convertidas e redimensionadas para a tela.
+
+    Cada imagem ``transicao_*.png`` é carregada, convertida para o formato do
+    display e redimensionada apenas uma vez por planeta e resolução, evitando
+    o carregamento de um PNG de 2560x1440 a cada quadro do estado TRANSITION.
+    """
+
+    def __init__(self):
+        # (nome do planeta, (largura, altura)) -> (superfície, posição)
+        self._images = {}
+        # Planetas cuja imagem não pôde ser carregada (evita novas tentativas)
+        self._failed = set()
+
+    @staticmethod
+    def get_image_path(planet_name):
+        """Retorna o caminho da imagem de transição de um planeta"""
+        # O caminho de arquivo usa o nome em português sem acentos
+        planet_name_pt = PLANET_NAME_PT.get(planet_name, planet_name).lower()
+        planet_name_pt = planet_name_pt.replace("ê", "e").replace("ú", "u").replace("í", "i").replace("ô", "o").replace("á", "a").replace("é", "e")
+        return os.path.join("assets", "images", "planets_sprites", planet_name_pt, f"transicao_{planet_name_pt}.png")
+
+    def get(self, planet_name, screen_size):
+        """Obtém a imagem de transição pronta para a tela.
+
+        Retorna uma tupla ``(superfície, (x, y))`` com a imagem centralizada ou
+        ``None`` se a imagem do planeta não estiver disponível.
+        """
+        key = (planet_name, tuple(screen_size))
+        cached = self._images.get(key)
+        if cached is not None:
+            return cached
+        if planet_name in self._failed:
+            return None
+
+        try:
+            cached = self._load_scaled(planet_name, screen_size)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Erro ao carregar imagem de transição: {e}")
+            self._failed.add(planet_name)
+            return None
+
+        self._images[key] = cached
+        return cached
+
+    def warm_up(self, planet_name, screen_size):
+        """Pré-carrega a imagem de transição de um planeta (ex.: o próximo)"""
+        return self.get(planet_name, screen_size) is not None
+
+    def clear(self):
+        """Descarta todas as imagens em cache (ex.: ao mudar a resolução)"""
+        self._images.clear()
+        self._failed.clear()
+
+    def _load_scaled(self, planet_name, screen_size):
+        """Carrega, redimensiona e converte a imagem de transição"""
+        transition_image = pygame.image.load(self.get_image_path(planet_name))
+
+        # Redimensiona a imagem para preencher a tela mantendo proporção
+        screen_width, screen_height = screen_size
+        img_width, img_height = transition_image.get_size()
+        scale = max(screen_width / img_width, screen_height / img_height)
+        new_width = int(img_width * scale)
+        new_height = int(img_height * scale)
+
+        scaled_image = pygame.transform.scale(transition_image, (new_width, new_height))
+
+        # As imagens de transição são opacas, então a conversão sem alfa
+        # produz a superfície mais rápida para o blit
+        if pygame.display.get_surface() is not None:
+            scaled_image = scaled_image.convert()
+
+        # Centraliza a imagem na tela
+        x = (screen_width - new_width) // 2
+        y = (screen_height - new_height) // 2
+        return scaled_image, (x, y)
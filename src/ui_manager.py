@@ -1,15 +1,56 @@
 import pygame
 import math
-import os
 import src.config as config
 from src.planet_data import PLANET_NAME_PT, LEVEL_PROGRESSION_THRESHOLDS
+from src.transition_cache import TransitionImageCache
+from src.font_registry import get_font
+from src.text_cache import render_text
+from src.overlay_cache import get_overlay
+from src.dirty_rects import dirty_rects, mark_dirty
 
 class UIManager:
+    # Estados animados por toda a tela (rolagem do chão, personagens), sempre
+    # apresentados por inteiro no modo de retângulos sujos
+    FULL_REDRAW_STATES = (config.SPLASH, config.PLAYING, config.DIALOGUE)
+
     def __init__(self, game):
         self.game = game
+        # Imagens de transição carregadas uma única vez por planeta e resolução
+        self.transition_cache = TransitionImageCache()
+        # Estado e planeta do último quadro desenhado (modo de retângulos sujos)
+        self._last_frame_key = None
+
+    def warm_up_transition(self, planet):
+        """Pré-carrega a imagem de transição de um planeta antes do estado TRANSITION"""
+        if not config.TRANSITION_IMAGE_WARM_UP:
+            return False
+        screen = pygame.display.get_surface()
+        if screen is None:
+            return False
+        return self.transition_cache.warm_up(planet.name, screen.get_size())
         
     def draw(self, screen):
         """Desenha a interface do jogo de acordo com o estado atual"""
+        # Mudanças de estado ou de planeta alteram a tela inteira
+        frame_key = (self.game.state, self.game.current_planet.name)
+        if frame_key != self._last_frame_key or self.game.state in self.FULL_REDRAW_STATES:
+            dirty_rects.mark_full()
+            self._last_frame_key = frame_key
+
+        self._draw_state(screen)
+
+        if config.DIRTY_RECTS_SHOW_COVERAGE and dirty_rects.enabled:
+            self._draw_dirty_rect_coverage(screen)
+
+    def _draw_dirty_rect_coverage(self, screen):
+        """Desenha a fração da tela atualizada no último quadro"""
+        coverage_text = render_text(
+            config.SMALL_FONT, f"Tela atualizada: {dirty_rects.last_coverage:.0%}", True, (255, 255, 0)
+        )
+        mark_dirty(screen.blit(coverage_text, (10, config.SCREEN_HEIGHT - coverage_text.get_height() - 10)))
+
+    def _draw_state(self, screen):
+        """Desenha o conteúdo do estado atual"""
         # Verifica se está na tela inicial (splash screen)
         if self.game.state == config.SPLASH:
             self.draw_splash_screen(screen)
@@ -28,7 +69,7 @@ class UIManager:
             elif self.game.state == config.GAME_OVER:
                 self.draw_game_over_screen(screen)
             elif self.game.state == config.QUIZ_FAILURE and self.game.state_manager.quiz_failure_timer > 0:
-                countdown = math.ceil(self.game.state_manager.quiz_failure_timer / 60)
+                countdown = math.ceil(self.game.state_manager.quiz_failure_timer / config.SIMULATION_HZ)
                 self.game.visual_effects.draw_countdown(screen, countdown)
                 
         elif self.game.state == config.TRANSITION:
@@ -72,7 +113,8 @@ class UIManager:
             
         # Sempre desenha a assistente NOVA por cima, a menos que no estado DIALOGUE ou MUSIC_PLAYER
         if self.game.state != config.DIALOGUE and self.game.state != config.MUSIC_PLAYER:
-            self.game.nova.draw(screen)
+            for rect in self.game.nova.draw(screen):
+                mark_dirty(rect)
     
     def draw_splash_screen(self, screen):
         """Desenha a tela inicial com a imagem de splash"""
@@ -103,23 +145,27 @@ class UIManager:
             
     def _draw_game_elements(self, screen):
         """Desenha elementos comuns do jogo (obstáculos, itens, nave, etc.)"""
+        # Interpola entre passos de simulação só quando as entidades estão se movendo
+        alpha = self.game.render_alpha if self.game.state == config.PLAYING else 1.0
+
         # Desenha os obstáculos
         for obstacle in self.game.obstacles:
-            obstacle.draw(screen)
+            mark_dirty(obstacle.draw(screen, alpha))
             
         # Desenha os colecionáveis
         for collectible in self.game.collectibles:
-            collectible.draw(screen)
+            mark_dirty(collectible.draw(screen, alpha))
 
         # Desenha os projéteis disparados
         for proj in self.game.weapon_system.projectiles:
-            proj.desenhar(screen)
+            mark_dirty(proj.desenhar(screen, alpha))
             
-        # Desenha o chão
-        self.game.current_planet.draw_ground(screen, self.game.floor_x, config.SCREEN_HEIGHT)
+        # Desenha o chão (rola na velocidade dos obstáculos; draw_ground aplica o módulo)
+        floor_x = self.game.floor_x + self.game.obstacle_speed * (1.0 - alpha)
+        self.game.current_planet.draw_ground(screen, floor_x, config.SCREEN_HEIGHT)
         
         # Desenha a nave (com efeito de invulnerabilidade se aplicável)
-        self.game.spacecraft.draw(screen, self.game.invulnerable)
+        mark_dirty(self.game.spacecraft.draw(screen, self.game.invulnerable, alpha))
         
         # Desenha informações do jogo se não estiver no menu
         if self.game.state != config.MENU:
@@ -129,13 +175,13 @@ class UIManager:
         """Desenha informações do jogo (pontuação, vidas etc.)"""
         # Informações do lado esquerdo
         display_name = PLANET_NAME_PT.get(self.game.current_planet.name, self.game.current_planet.name)
-        planet_text = config.SMALL_FONT.render(f"Planeta: {display_name}", True, (255, 255, 255))
+        planet_text = render_text(config.SMALL_FONT, f"Planeta: {display_name}", True, (255, 255, 255))
         screen.blit(planet_text, (20, 20))
         
         # Mostra o planeta mais distante alcançado
         furthest_planet = self.game.planets[self.game.furthest_planet_index].name
         furthest_planet_pt = PLANET_NAME_PT.get(furthest_planet, furthest_planet)
-        furthest_text = config.SMALL_FONT.render(f"Mais distante: {furthest_planet_pt}", True, (255, 215, 0))
+        furthest_text = render_text(config.SMALL_FONT, f"Mais distante: {furthest_planet_pt}", True, (255, 215, 0))
         screen.blit(furthest_text, (20, 50))
         
         # Obtém o limite para o planeta atual
@@ -144,11 +190,11 @@ class UIManager:
             10  # Limite padrão
         )
         
-        score_text = config.SMALL_FONT.render(f"Pontuação: {self.game.score}/{current_threshold}", True, (255, 255, 255))
+        score_text = render_text(config.SMALL_FONT, f"Pontuação: {self.game.score}/{current_threshold}", True, (255, 255, 255))
         screen.blit(score_text, (20, 80))
         
         # Desenha o indicador de vidas
-        lives_text = config.SMALL_FONT.render(f"Vidas:", True, (255, 255, 255))
+        lives_text = render_text(config.SMALL_FONT, f"Vidas:", True, (255, 255, 255))
         screen.blit(lives_text, (20, 110))
         
         # Desenha ícones de vida
@@ -156,19 +202,17 @@ class UIManager:
         
         # Exibe o status da arma no topo, se ativa
         if self.game.weapon_active:
-            weapon_time = self.game.weapon_timer // 60  # Converte para segundos
-            weapon_text = config.SMALL_FONT.render(f"Arma Ativa: {weapon_time}s", True, (255, 100, 100))
-            screen.blit(weapon_text, (config.SCREEN_WIDTH // 2 - weapon_text.get_width() // 2, 20))
+            weapon_time = self.game.weapon_timer // config.SIMULATION_HZ  # Converte para segundos
+            weapon_text = render_text(config.SMALL_FONT, f"Arma Ativa: {weapon_time}s", True, (255, 100, 100))
+            mark_dirty(screen.blit(weapon_text, (config.SCREEN_WIDTH // 2 - weapon_text.get_width() // 2, 20)))
             
     def draw_menu_screen(self, screen):
         """Desenha a tela de menu"""
         # Sobreposição semitransparente
-        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((0, 0, 0), 180), (0, 0))
         
-        title_text = config.GAME_FONT.render("PROJETO VIOLETA NOVA", True, (255, 255, 255))
-        subtitle_text = config.SMALL_FONT.render("Explorador do Sistema Solar", True, (200, 200, 255))
+        title_text = render_text(config.GAME_FONT, "PROJETO VIOLETA NOVA", True, (255, 255, 255))
+        subtitle_text = render_text(config.SMALL_FONT, "Explorador do Sistema Solar", True, (200, 200, 255))
 
         screen.blit(title_text, (config.SCREEN_WIDTH // 2 - title_text.get_width() // 2, 180))
         screen.blit(subtitle_text, (config.SCREEN_WIDTH // 2 - subtitle_text.get_width() // 2, 220))
@@ -206,30 +250,30 @@ class UIManager:
                 pygame.draw.rect(screen, (100, 100, 255), (box_x, box_y, box_width, box_height), 
                                2, border_radius=10)
                 
-                option_text = config.GAME_FONT.render(option, True, (255, 255, 255))
+                option_text = render_text(config.GAME_FONT, option, True, (255, 255, 255))
             else:
-                option_text = config.GAME_FONT.render(option, True, (180, 180, 180))
+                option_text = render_text(config.GAME_FONT, option, True, (180, 180, 180))
             
             screen.blit(option_text, (config.SCREEN_WIDTH // 2 - option_text.get_width() // 2, y_pos))
         
         # Exibe a dificuldade atual
         diff_name = config.DIFFICULTY_NAMES.get(self.game.difficulty, "")
-        diff_text = config.SMALL_FONT.render(
+        diff_text = render_text(config.SMALL_FONT, 
             f"Dificuldade: {diff_name}", True, (255, 255, 255)
         )
         screen.blit(diff_text, (config.SCREEN_WIDTH // 2 - diff_text.get_width() // 2, config.MENU_START_Y - 40))
 
         # Mostra os controles
-        controls_title = config.SMALL_FONT.render("Controles do Menu:", True, (255, 255, 255))
-        controls_nav = config.SMALL_FONT.render("SETA PARA CIMA/BAIXO - Navegar | ENTER/ESPAÇO - Selecionar", True, (200, 200, 200))
+        controls_title = render_text(config.SMALL_FONT, "Controles do Menu:", True, (255, 255, 255))
+        controls_nav = render_text(config.SMALL_FONT, "SETA PARA CIMA/BAIXO - Navegar | ENTER/ESPAÇO - Selecionar", True, (200, 200, 200))
         
         controls_y = config.SCREEN_HEIGHT - 150
         screen.blit(controls_title, (config.SCREEN_WIDTH // 2 - controls_title.get_width() // 2, controls_y))
         screen.blit(controls_nav, (config.SCREEN_WIDTH // 2 - controls_nav.get_width() // 2, controls_y + 30))
         
         # Mostra controles do jogo
-        game_controls_title = config.SMALL_FONT.render("Controles do Jogo:", True, (255, 255, 255))
-        controls_space = config.SMALL_FONT.render("ESPAÇO - Impulsionar | W - Usar Arma", True, (200, 200, 200))
+        game_controls_title = render_text(config.SMALL_FONT, "Controles do Jogo:", True, (255, 255, 255))
+        controls_space = render_text(config.SMALL_FONT, "ESPAÇO - Impulsionar | W - Usar Arma", True, (200, 200, 200))
         
         screen.blit(game_controls_title, (config.SCREEN_WIDTH // 2 - game_controls_title.get_width() // 2, controls_y + 60))
         screen.blit(controls_space, (config.SCREEN_WIDTH // 2 - controls_space.get_width() // 2, controls_y + 90))
@@ -237,32 +281,30 @@ class UIManager:
     def draw_game_over_screen(self, screen):
         """Desenha a tela de fim de jogo"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((0, 0, 0), 180), (0, 0))
         
         # Determina se foi falha ou conclusão baseado no estado do jogo
         if self.game.mission_failed:
-            game_over_text = config.GAME_FONT.render("MISSÃO FRACASSADA", True, (255, 50, 50))
+            game_over_text = render_text(config.GAME_FONT, "MISSÃO FRACASSADA", True, (255, 50, 50))
         else:
             # Verifica se é Netuno completo para mensagem especial
             if self.game.current_planet.name == "Neptune" and self.game.score >= LEVEL_PROGRESSION_THRESHOLDS["Neptune"]:
-                game_over_text = config.GAME_FONT.render("PARABÉNS! SISTEMA SOLAR EXPLORADO!", True, (255, 215, 0))
+                game_over_text = render_text(config.GAME_FONT, "PARABÉNS! SISTEMA SOLAR EXPLORADO!", True, (255, 215, 0))
             else:
-                game_over_text = config.GAME_FONT.render("MISSÃO CONCLUÍDA", True, (255, 215, 0))
-        score_text = config.GAME_FONT.render(f"Pontuação Final: {self.game.score}", True, (255, 255, 255))
+                game_over_text = render_text(config.GAME_FONT, "MISSÃO CONCLUÍDA", True, (255, 215, 0))
+        score_text = render_text(config.GAME_FONT, f"Pontuação Final: {self.game.score}", True, (255, 255, 255))
         
         # Mensagem personalizada baseada no checkpoint
         difficulty_settings = config.DIFFICULTY_SETTINGS[self.game.difficulty]
         if difficulty_settings["save_checkpoint"]:
-            restart_text = config.GAME_FONT.render("Pressione ESPAÇO para continuar a missão", True, (255, 255, 255))
+            restart_text = render_text(config.GAME_FONT, "Pressione ESPAÇO para continuar a missão", True, (255, 255, 255))
         else:
-            restart_text = config.GAME_FONT.render("Pressione ESPAÇO para nova missão desde a Terra", True, (255, 255, 255))
+            restart_text = render_text(config.GAME_FONT, "Pressione ESPAÇO para nova missão desde a Terra", True, (255, 255, 255))
         
         # Calcula o planeta mais distante alcançado
         furthest_planet = self.game.planets[min(self.game.current_planet_index, len(self.game.planets) - 1)].name
         furthest_planet_pt = PLANET_NAME_PT.get(furthest_planet, furthest_planet)
-        planet_text = config.GAME_FONT.render(f"Planeta mais distante: {furthest_planet_pt}", True, (255, 255, 255))
+        planet_text = render_text(config.GAME_FONT, f"Planeta mais distante: {furthest_planet_pt}", True, (255, 255, 255))
         
         screen.blit(game_over_text, (config.SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
         screen.blit(score_text, (config.SCREEN_WIDTH // 2 - score_text.get_width() // 2, 220))
@@ -271,72 +313,47 @@ class UIManager:
         
     def draw_transition_screen(self, screen):
         """Desenha a tela de transição usando imagens de cada planeta"""
-        # Obtém o nome do planeta em português para o caminho do arquivo
-        planet_name = self.game.current_planet.name
-        planet_name_pt = PLANET_NAME_PT.get(planet_name, planet_name).lower()
-        
-        # Remove acentos e caracteres especiais para o caminho do arquivo
-        planet_name_pt = planet_name_pt.replace("ê", "e").replace("ú", "u").replace("í", "i").replace("ô", "o").replace("á", "a").replace("é", "e")
-        
-        # O caminho de arquivo usa o nome em português sem acentos com os.path.join para compatibilidade entre plataformas
-        transition_image_path = os.path.join("assets", "images", "planets_sprites", planet_name_pt, f"transicao_{planet_name_pt}.png")
-        
-        try:
-            transition_image = pygame.image.load(transition_image_path)
-            
-            # Redimensiona a imagem para preencher a tela mantendo proporção
-            screen_width, screen_height = pygame.display.get_surface().get_size()
-            img_width, img_height = transition_image.get_size()
-            
-            # Calcula a escala necessária para preencher a tela
-            scale = max(screen_width / img_width, screen_height / img_height)
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            
-            # Redimensiona a imagem
-            scaled_image = pygame.transform.scale(transition_image, (new_width, new_height))
-            
-            # Centraliza a imagem na tela
-            x = (screen_width - new_width) // 2
-            y = (screen_height - new_height) // 2
-            
+        screen_width, screen_height = screen.get_size()
+
+        # Obtém a imagem já carregada e redimensionada do cache
+        transition = self.transition_cache.get(self.game.current_planet.name, (screen_width, screen_height))
+
+        if transition is not None:
+            transition_image, position = transition
+
             # Desenha a imagem
-            screen.blit(scaled_image, (x, y))
+            screen.blit(transition_image, position)
             
             # Sobreposição semitransparente apenas para parte inferior (para texto)
             overlay_height = 100
-            overlay = pygame.Surface((screen_width, overlay_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
+            overlay = get_overlay((0, 0, 0), 150, (screen_width, overlay_height))
             screen.blit(overlay, (0, screen_height - overlay_height))
             
             # Indicador de progresso
-            progress_text = config.SMALL_FONT.render(f"Planeta {self.game.current_planet_index + 1} de {len(self.game.planets)}", True, (180, 180, 180))
+            progress_text = render_text(config.SMALL_FONT, f"Planeta {self.game.current_planet_index + 1} de {len(self.game.planets)}", True, (180, 180, 180))
             screen.blit(progress_text, (screen_width // 2 - progress_text.get_width() // 2, screen_height - overlay_height + 10))
             
             # Mostra instrução para continuar
-            if self.game.state_manager.transition_time > 60:  # Only show after 1 second
-                continue_text = config.SMALL_FONT.render("Pressione ESPAÇO para continuar", True, (255, 255, 255))
+            if self.game.state_manager.transition_time > config.SIMULATION_HZ:  # Only show after 1 second
+                continue_text = render_text(config.SMALL_FONT, "Pressione ESPAÇO para continuar", True, (255, 255, 255))
                 # Pulsating effect
                 alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.005))
                 continue_text.set_alpha(alpha)
-                screen.blit(continue_text, (screen_width // 2 - continue_text.get_width() // 2, screen_height - overlay_height + 50))
+                mark_dirty(screen.blit(continue_text, (screen_width // 2 - continue_text.get_width() // 2, screen_height - overlay_height + 50)))
                 
-        except Exception as e:
+        else:
             # Fallback para o método original caso a imagem não seja encontrada
-            print(f"Erro ao carregar imagem de transição: {e}")
             
             # Sobreposição semitransparente
-            overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))  # Sobreposição mais escura para leitura
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_overlay((0, 0, 0), 200), (0, 0))  # Sobreposição mais escura para leitura
             
             # Exibe o nome do planeta de destino
             display_name = PLANET_NAME_PT.get(self.game.current_planet.name, self.game.current_planet.name)
-            planet_title = config.GAME_FONT.render(f"Bem-vindo a {display_name}", True, (255, 255, 255))
+            planet_title = render_text(config.GAME_FONT, f"Bem-vindo a {display_name}", True, (255, 255, 255))
             screen.blit(planet_title, (config.SCREEN_WIDTH // 2 - planet_title.get_width() // 2, 100))
             
             # Mostra a informação de gravidade
-            gravity_text = config.GAME_FONT.render(f"Gravidade: {self.game.current_planet.gravity_factor}% da Terra", True, (255, 255, 255))
+            gravity_text = render_text(config.GAME_FONT, f"Gravidade: {self.game.current_planet.gravity_factor}% da Terra", True, (255, 255, 255))
             screen.blit(gravity_text, (config.SCREEN_WIDTH // 2 - gravity_text.get_width() // 2, 150))
             
             # Texto informativo do planeta
@@ -347,8 +364,7 @@ class UIManager:
             line = ""
             for word in words:
                 test_line = line + word + " "
-                test_surface = config.SMALL_FONT.render(test_line, True, (255, 255, 255))
-                if test_surface.get_width() < config.SCREEN_WIDTH - 100:
+                if config.SMALL_FONT.size(test_line)[0] < config.SCREEN_WIDTH - 100:
                     line = test_line
                 else:
                     wrapped_lines.append(line)
@@ -357,30 +373,28 @@ class UIManager:
             
             # Desenha o texto quebrado
             for i, line in enumerate(wrapped_lines):
-                line_surface = config.SMALL_FONT.render(line, True, (200, 200, 255))
+                line_surface = render_text(config.SMALL_FONT, line, True, (200, 200, 255))
                 screen.blit(line_surface, (config.SCREEN_WIDTH // 2 - line_surface.get_width() // 2, 220 + i * 30))
                 
             # Indicador de progresso
-            progress_text = config.SMALL_FONT.render(f"Planeta {self.game.current_planet_index + 1} de {len(self.game.planets)}", True, (180, 180, 180))
+            progress_text = render_text(config.SMALL_FONT, f"Planeta {self.game.current_planet_index + 1} de {len(self.game.planets)}", True, (180, 180, 180))
             screen.blit(progress_text, (config.SCREEN_WIDTH // 2 - progress_text.get_width() // 2, 350))
             
             # Mostra instrução para continuar
-            if self.game.state_manager.transition_time > 60:  # Only show after 1 second
-                continue_text = config.SMALL_FONT.render("Pressione ESPAÇO para continuar", True, (255, 255, 255))
+            if self.game.state_manager.transition_time > config.SIMULATION_HZ:  # Only show after 1 second
+                continue_text = render_text(config.SMALL_FONT, "Pressione ESPAÇO para continuar", True, (255, 255, 255))
                 # Pulsating effect
                 alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.005))
                 continue_text.set_alpha(alpha)
-                screen.blit(continue_text, (config.SCREEN_WIDTH // 2 - continue_text.get_width() // 2, 450))
+                mark_dirty(screen.blit(continue_text, (config.SCREEN_WIDTH // 2 - continue_text.get_width() // 2, 450)))
             
     def draw_quiz_failure_screen(self, screen):
         """Desenha a tela de falha no quiz com contagem regressiva"""
         # Adiciona sobreposição semitransparente
-        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Preto semitransparente mais visível
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((0, 0, 0), 180), (0, 0))  # Preto semitransparente mais visível
         
         # Calcula o número da contagem regressiva
-        countdown_number = self.game.state_manager.quiz_failure_timer // 60 + 1
+        countdown_number = self.game.state_manager.quiz_failure_timer // config.SIMULATION_HZ + 1
         
         # Desenha o número grande de contagem
         self.game.visual_effects.draw_countdown(screen, countdown_number)
@@ -389,7 +403,7 @@ class UIManager:
         self.game.visual_effects.draw_pulsing_text(
             screen,
             "Retornando à órbita...",
-            pygame.font.Font(None, 42),  # Fonte temporária para texto pulsante
+            get_font(42),  # Fonte compartilhada para texto pulsante
             (255, 255, 255),
             (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 100)
         )
@@ -397,12 +411,10 @@ class UIManager:
     def draw_difficulty_menu(self, screen):
         """Desenha o submenu de seleção de dificuldade"""
         # Criar um overlay escuro para melhor visibilidade
-        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((0, 0, 0), 200), (0, 0))
         
         # Título principal
-        title = config.GAME_FONT.render("Selecione a Dificuldade", True, (255, 255, 255))
+        title = render_text(config.GAME_FONT, "Selecione a Dificuldade", True, (255, 255, 255))
         screen.blit(title, (config.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
         
         # Descrições e cores para cada dificuldade
@@ -480,7 +492,7 @@ class UIManager:
                 screen.blit(box_surf, (box_x, box_y))
                 
                 # Indicador de seleção
-                arrow = config.GAME_FONT.render("►", True, data["color"])
+                arrow = render_text(config.GAME_FONT, "►", True, data["color"])
                 screen.blit(arrow, (box_x - 40, box_y + box_height//2 - arrow.get_height()//2))
             else:
                 # Box não selecionado
@@ -494,16 +506,16 @@ class UIManager:
                 screen.blit(box_surf, (box_x, box_y))
             
             # Nome da dificuldade
-            name_text = config.GAME_FONT.render(data["name"], True, data["color"])
+            name_text = render_text(config.GAME_FONT, data["name"], True, data["color"])
             screen.blit(name_text, (box_x + 20, box_y + 10))
             
             # Descrição
-            desc_text = config.SMALL_FONT.render(data["description"], True, (200, 200, 200))
+            desc_text = render_text(config.SMALL_FONT, data["description"], True, (200, 200, 200))
             screen.blit(desc_text, (box_x + 20, box_y + 40))
             
             # Detalhes
             for j, detail in enumerate(data["details"]):
-                detail_text = config.SMALL_FONT.render(detail, True, (180, 180, 180))
+                detail_text = render_text(config.SMALL_FONT, detail, True, (180, 180, 180))
                 screen.blit(detail_text, (box_x + 300, box_y + 15 + j * 22))
             
             # Desenhar estrelas para indicar dificuldade - canto superior direito
@@ -530,11 +542,11 @@ class UIManager:
             
             # Indicador de dificuldade atual
             if self.game.difficulty == diff:
-                current_text = config.SMALL_FONT.render("(Atual)", True, data["color"])
+                current_text = render_text(config.SMALL_FONT, "(Atual)", True, data["color"])
                 screen.blit(current_text, (box_x + name_text.get_width() + 30, box_y + 12))
         
         # Instruções
-        info_text = config.SMALL_FONT.render(
+        info_text = render_text(config.SMALL_FONT, 
             "SETA PARA CIMA/BAIXO - Escolher | ENTER - Confirmar | ESC - Voltar",
             True,
             (200, 200, 200),
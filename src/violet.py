@@ -2,6 +2,8 @@ import pygame
 import math
 import random
 import os
+from collections import OrderedDict
+import src.config as config
 
 class Violet:
     # Dimensões base
@@ -11,6 +13,11 @@ class Violet:
     # Tamanhos para foco/não-foco
     FOCUSED_SCALE = 1.3
     UNFOCUSED_SCALE = 0.9
+
+    # Quantização do cache de quadros pré-renderizados
+    SCALE_STEPS = config.VIOLET_SCALE_STEPS    # Tamanhos distintos entre a menor e a maior escala
+    COLOR_STEPS = config.VIOLET_COLOR_STEPS    # Passos da mistura de cores entre expressões
+    FRAME_CACHE_SIZE = config.VIOLET_FRAME_CACHE_SIZE  # Máximo de quadros mantidos
     
     # Cores para diferentes expressões
     COLORS = {
@@ -45,6 +52,9 @@ class Violet:
         self.pulse_speed = 0.003
         self.pulse_min = 0.97
         self.pulse_max = 1.03
+
+        # Quadros já redimensionados/desfocados/tingidos, em ordem de uso (LRU)
+        self._frame_cache = OrderedDict()
         
         # Carrega a imagem de Violet (gatinha astronauta)
         self.image = None
@@ -98,7 +108,7 @@ class Violet:
             scale = self.FOCUSED_SCALE if self.is_focused else self.UNFOCUSED_SCALE
             
         # Aplica o efeito de pulsação ao fator de escala
-        scale *= self.pulse_factor
+        scale = self._quantize_scale(scale * self.pulse_factor)
         
         # Determina o tamanho final da imagem
         width = int(self.BASE_WIDTH * scale)
@@ -106,18 +116,43 @@ class Violet:
         
         # Calcula a mistura de cores para a expressão
         if self.transition_progress < 1.0:
-            # Durante a transição de expressão, mescla as cores
+            # Durante a transição de expressão, mescla as cores (em passos quantizados)
+            progress = round(self.transition_progress * self.COLOR_STEPS) / self.COLOR_STEPS
             curr_color = self.COLORS[self.expression]
             prev_color = self.COLORS[self.previous_expression]
-            color = [
-                int(prev_color[0] * (1-self.transition_progress) + curr_color[0] * self.transition_progress),
-                int(prev_color[1] * (1-self.transition_progress) + curr_color[1] * self.transition_progress),
-                int(prev_color[2] * (1-self.transition_progress) + curr_color[2] * self.transition_progress)
-            ]
+            color = (
+                int(prev_color[0] * (1-progress) + curr_color[0] * progress),
+                int(prev_color[1] * (1-progress) + curr_color[1] * progress),
+                int(prev_color[2] * (1-progress) + curr_color[2] * progress)
+            )
         else:
             # Após a transição, usa a cor final
             color = self.COLORS[self.expression]
-            
+
+        # Quando em foco a cor não é aplicada, então não faz parte da chave
+        key = (width, height, self.is_focused, None if self.is_focused else color)
+        surface = self._frame_cache.get(key)
+        if surface is not None:
+            self._frame_cache.move_to_end(key)
+        else:
+            surface = self._render_frame(width, height, color)
+            self._frame_cache[key] = surface
+            if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        self.surface = surface
+
+    def _quantize_scale(self, scale):
+        """Arredonda a escala para um dos SCALE_STEPS tamanhos possíveis"""
+        min_scale = self.UNFOCUSED_SCALE * self.pulse_min
+        max_scale = self.FOCUSED_SCALE * self.pulse_max
+        if self.SCALE_STEPS < 2:
+            return scale
+        step = (max_scale - min_scale) / (self.SCALE_STEPS - 1)
+        index = round((scale - min_scale) / step)
+        return min_scale + max(0, min(self.SCALE_STEPS - 1, index)) * step
+
+    def _render_frame(self, width, height, color):
+        """Renderiza um quadro de Violet com escala, desfoque e tingimento aplicados"""
         # Determina a opacidade/brilho - mais brilhante quando em foco, mais suave quando não
         if self.is_focused:
             alpha = 255  # Totalmente opaca quando em foco
@@ -127,7 +162,7 @@ class Violet:
             blur_factor = 1  # Aplica leve desfoque quando fora de foco
             
         # Cria a superfície de trabalho
-        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
         # Redimensiona a imagem original
         scaled_image = pygame.transform.smoothscale(self.image, (width, height))
@@ -142,15 +177,16 @@ class Violet:
         # Quando em foco, usa a imagem original sem tinting
         if self.is_focused:
             # Mantém a cor original quando em foco
-            self.surface.blit(scaled_image, (0, 0))
+            surface.blit(scaled_image, (0, 0))
         else:
             # Aplica o efeito de cor apenas quando não está em foco
             color_surface = pygame.Surface((width, height), pygame.SRCALPHA)
             color_surface.fill((*color, int(alpha * 0.3)))  # Cor leve apenas como tingimento
             
             # Combina imagem e cor
-            self.surface.blit(scaled_image, (0, 0))
-            self.surface.blit(color_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            surface.blit(scaled_image, (0, 0))
+            surface.blit(color_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return surface
             
     def update(self):
         """Atualiza a animação de Violet"""
@@ -1,14 +1,28 @@
-import random
 import math
 import pygame
 import src.config as config
+from src.font_registry import get_font
+from src.text_cache import render_text
+from src.overlay_cache import get_overlay, overlay_cache
+from src.starfield import Starfield
+from src.background_cache import PlanetBackgroundCache
+from src.glow_text import glow_text_cache
+from src.rng import rng, cosmetic_random
+from src.dirty_rects import dirty_rects, mark_dirty
 
 class VisualEffectsManager:
     def __init__(self, game):
         self.game = game
         self.screen_shake = 0
         self.flash_effect = 0
-        self.stars = self._generate_stars(100)
+        self.starfield = Starfield(
+            config.STAR_COUNT,
+            config.SCREEN_WIDTH,
+            config.SCREEN_HEIGHT - config.FLOOR_HEIGHT,
+            layers=config.STAR_PARALLAX_LAYERS,
+            rng=rng.numpy("cosmetic")
+        )
+        self.background_cache = PlanetBackgroundCache()
         
         # Carrega os sprites de vida
         self.life_full_sprite = pygame.image.load("assets/images/vida_cheia.png")
@@ -23,7 +37,7 @@ class VisualEffectsManager:
     def update(self):
         """Atualiza todos os efeitos visuais"""
         # Atualiza o efeito de cintilação das estrelas
-        self._update_stars()
+        self.starfield.update()
         
         # Atualiza o tremor da tela
         if self.screen_shake > 0:
@@ -33,34 +47,6 @@ class VisualEffectsManager:
         if self.flash_effect > 0:
             self.flash_effect -= 1
     
-    def _update_stars(self):
-        """Atualiza o efeito de cintilação das estrelas"""
-        for star in self.stars:
-            star["phase"] += star["twinkle_speed"]
-            twinkle_factor = 0.5 + 0.5 * math.sin(star["phase"])
-            star["brightness"] = int(star["base_brightness"] * twinkle_factor)
-    
-    def _generate_stars(self, count):
-        """Gera estrelas de fundo"""
-        stars = []
-        for _ in range(count):
-            x = random.randint(0, config.SCREEN_WIDTH)
-            y = random.randint(0, config.SCREEN_HEIGHT - config.FLOOR_HEIGHT)
-            size = random.uniform(0.5, 2.0)
-            brightness = random.randint(150, 255)
-            twinkle_speed = random.uniform(0.02, 0.1)
-            phase = random.uniform(0, 2 * math.pi)
-            stars.append({
-                "x": x,
-                "y": y,
-                "size": size,
-                "brightness": brightness,
-                "base_brightness": brightness,
-                "twinkle_speed": twinkle_speed,
-                "phase": phase
-            })
-        return stars
-    
     def trigger_screen_shake(self, intensity=18):
         """Aciona um efeito de tremor de tela"""
         self.screen_shake = intensity
@@ -73,8 +59,8 @@ class VisualEffectsManager:
         """Obtém o deslocamento atual do tremor da tela para renderização"""
         if self.screen_shake > 0:
             shake_intensity = min(8, self.screen_shake / 2)
-            offset_x = random.randint(-int(shake_intensity), int(shake_intensity))
-            offset_y = random.randint(-int(shake_intensity), int(shake_intensity))
+            offset_x = cosmetic_random.randint(-int(shake_intensity), int(shake_intensity))
+            offset_y = cosmetic_random.randint(-int(shake_intensity), int(shake_intensity))
             return offset_x, offset_y
         return 0, 0
     
@@ -82,58 +68,47 @@ class VisualEffectsManager:
         """Desenha o fundo com estrelas e o fundo do planeta"""
         # Obtém o deslocamento do tremor da tela
         offset_x, offset_y = self.get_screen_shake_offset()
-        
-        # Preenche com fundo escuro do espaço
-        screen.fill((0, 0, 20))
-        
-        # Desenha estrelas
-        self._draw_stars(screen, offset_x, offset_y)
-        
-        # Desenha o fundo do planeta
-        self._draw_planet_background(screen, planet, offset_x, offset_y)
+
+        # Tremor e flash alteram a tela inteira
+        if offset_x or offset_y or self.flash_effect > 0:
+            dirty_rects.mark_full()
+
+        # Fundo composto do planeta (céu já ladrilhado em uma única superfície)
+        background = self.background_cache.get(planet, screen.get_size())
+        if background is not None:
+            # O céu é opaco e cobre as estrelas; durante o tremor, preenche a
+            # faixa revelada no topo/esquerda com o espaço e as estrelas
+            if offset_x > 0 or offset_y > 0:
+                screen.fill((0, 0, 20))
+                self.starfield.draw(screen, offset_x, offset_y)
+            screen.blit(background, (offset_x, offset_y))
+        else:
+            # As estrelas cintilam visíveis por toda a tela
+            dirty_rects.mark_full()
+
+            # Preenche com fundo escuro do espaço
+            screen.fill((0, 0, 20))
+
+            # Desenha estrelas
+            self.starfield.draw(screen, offset_x, offset_y)
+
+            # Desenha o fundo do planeta
+            self._draw_planet_background(screen, planet, offset_x, offset_y)
         
         # Desenha o efeito de flash de dano
         self._draw_flash_effect(screen)
     
-    def _draw_stars(self, screen, offset_x, offset_y):
-        """Desenha estrelas cintilantes"""
-        for star in self.stars:
-            color = (star["brightness"], star["brightness"], star["brightness"])
-            x_pos = int(star["x"]) + offset_x
-            y_pos = int(star["y"]) + offset_y
-            # pygame.draw.circle expects the radius as an integer. When using a
-            # float radius, some versions of pygame raise a TypeError. Cast to
-            # int to avoid runtime errors on platforms that enforce this.
-            pygame.draw.circle(screen, color, (x_pos, y_pos), int(star["size"]))
-    
     def _draw_planet_background(self, screen, planet, offset_x, offset_y):
-        """Desenha a imagem de fundo ou cor do planeta"""
-        if planet.background_image:
-            # Se o planeta tiver uma imagem de fundo, ladrilhe-a
-            bg_width, bg_height = planet.background_image.get_size()
-            
-            # Calcula os ladrilhos necessários
-            tiles_x = config.SCREEN_WIDTH // bg_width + 1
-            tiles_y = config.SCREEN_HEIGHT // bg_height + 1
-            
-            # Desenha os ladrilhos
-            for y in range(tiles_y):
-                for x in range(tiles_x):
-                    screen.blit(planet.background_image,
-                              (x * bg_width + offset_x, y * bg_height + offset_y))
-        else:
-            # Usa sobreposição de cor
-            bg_overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-            bg_color = (*planet.background_color, 100)  # Adiciona alfa
-            bg_overlay.fill(bg_color)
-            screen.blit(bg_overlay, (offset_x, offset_y))
+        """Desenha a sobreposição de cor do planeta (sem imagem de céu)"""
+        bg_overlay = get_overlay(planet.background_color, 100)
+        screen.blit(bg_overlay, (offset_x, offset_y))
     
     def _draw_flash_effect(self, screen):
         """Desenha o efeito de flash de dano"""
         if self.flash_effect > 0:
             flash_alpha = min(180, self.flash_effect * 40)
-            flash_overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash_overlay.fill((255, 0, 0, flash_alpha))  # Flash vermelho
+            # Alfa quantizado para reutilizar poucas sobreposições durante a animação
+            flash_overlay = overlay_cache.get_quantized((255, 0, 0), flash_alpha)  # Flash vermelho
             screen.blit(flash_overlay, (0, 0))
     
     def draw_life_icons(self, screen, lives, max_lives):
@@ -173,52 +148,40 @@ class VisualEffectsManager:
                 life_icon = self.life_empty_sprite.copy()
             
             # Desenha o ícone
-            screen.blit(life_icon, (icon_x, life_y))
+            mark_dirty(screen.blit(life_icon, (icon_x, life_y)))
             
     def draw_countdown(self, screen, countdown_number):
         """Desenha um grande número de contagem regressiva com efeitos especiais"""
         if countdown_number <= 0:
             return
 
-        # Adiciona efeito de pulso ao tamanho
-        pulse_factor = 1.0 + 0.15 * math.sin(pygame.time.get_ticks() * 0.01)
-        pulse_size = int(config.COUNTDOWN_FONT_SIZE * pulse_factor)
+        now = pygame.time.get_ticks()
+
+        # Adiciona efeito de pulso ao tamanho (em passos quantizados)
+        pulse_factor = 1.0 + 0.15 * math.sin(now * 0.01)
+        pulse_size = int(config.COUNTDOWN_FONT_SIZE * glow_text_cache.quantize_scale(pulse_factor))
 
         # Usa a fonte de contagem regressiva com efeito de pulso
-        countdown_font = pygame.font.Font(None, pulse_size)
+        countdown_font = get_font(pulse_size)
+        text = str(countdown_number)
+        center = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
 
-        # A cor também pulsa
-        color_pulse = int(255 * (0.7 + 0.3 * math.sin(pygame.time.get_ticks() * 0.015)))
-        countdown_text = countdown_font.render(str(countdown_number), True,
-                                              (255, color_pulse, color_pulse))
-        countdown_rect = countdown_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
-        
-        # Desenha com efeito de brilho aprimorado
-        glow_size = 12
-        for offset_x in range(-glow_size, glow_size + 1, 3):
-            for offset_y in range(-glow_size, glow_size + 1, 3):
-                if offset_x == 0 and offset_y == 0:
-                    continue
-                    
-                # Calcula a distância para o desvanecimento do brilho
-                distance = math.sqrt(offset_x**2 + offset_y**2)
-                alpha = int(120 * (1 - distance/glow_size))
-                if alpha <= 0:
-                    continue
-                
-                glow_rect = countdown_rect.move(offset_x, offset_y)
-                glow_text = countdown_font.render(str(countdown_number), True, 
-                                                 (80, 80, 220, alpha))
-                screen.blit(glow_text, glow_rect)
-        
-        # Desenha o texto principal
-        screen.blit(countdown_text, countdown_rect)
+        # Número vermelho com brilho azulado, composto uma única vez
+        glow_text = glow_text_cache.get(countdown_font, text, (255, 102, 102), (80, 80, 220))
+        mark_dirty(screen.blit(glow_text, glow_text.get_rect(center=center)))
+
+        # A cor também pulsa: o texto branco por cima varia do vermelho
+        # (255, 102, 102) ao branco apenas pelo alfa
+        highlight_alpha = int(255 * (0.5 + 0.5 * math.sin(now * 0.015)))
+        highlight = render_text(countdown_font, text, True, (255, 255, 255))
+        highlight.set_alpha(highlight_alpha)
+        screen.blit(highlight, highlight.get_rect(center=center))
         
     def draw_pulsing_text(self, screen, text, font, color, position, amplitude=0.3, speed=0.008):
         """Desenha texto com efeito de alfa pulsante"""
         alpha_pulse = int(255 * (0.7 + amplitude * math.sin(pygame.time.get_ticks() * speed)))
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, True, color)
         text_surface.set_alpha(alpha_pulse)
         
         text_rect = text_surface.get_rect(center=position)
-        screen.blit(text_surface, text_rect)
\ No newline at end of file
+        mark_dirty(screen.blit(text_surface, text_rect))
\ No newline at end of file
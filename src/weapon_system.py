@@ -2,13 +2,15 @@ import pygame
 from src.planet_data import LEVEL_PROGRESSION_THRESHOLDS, PLANET_NAME_PT
 import src.config as config
 from src.projectile import Projetil
+from src.entity_pool import EntityPool
 
 class WeaponSystem:
     def __init__(self, game):
         self.game = game
         self.active = False
         self.timer = 0
-        self.projectiles = []
+        self.projectile_pool = EntityPool(Projetil)
+        self.projectiles = self.projectile_pool.active
         
     def update(self):
         """Atualiza o estado da arma"""
@@ -19,15 +21,17 @@ class WeaponSystem:
                 self.deactivate()
 
         # Atualiza projéteis existentes
-        for proj in list(self.projectiles):
+        for proj in self.projectiles:
             proj.atualizar()
 
-            # Verifica colisão com obstáculos
-            for obst in list(self.game.obstacles):
-                if proj.colide_com(obst):
-                    self.game.obstacles.remove(obst)
-                    if proj in self.projectiles:
-                        self.projectiles.remove(proj)
+            # Verifica colisão apenas com os obstáculos próximos do trajeto em x
+            candidates = self.game.obstacle_index.query(
+                proj.x_anterior - self.game.obstacle_speed, proj.x + proj.LARGURA
+            )
+            for obst in candidates:
+                if obst.alive and proj.colide_com(obst):
+                    self.game.obstacle_pool.release(obst)
+                    self.projectile_pool.release(proj)
                     self.game.score += 2
                     self.game.nova.show_message("Obstáculo destruído!", "alert")
 
@@ -63,11 +67,17 @@ class WeaponSystem:
                         self.game.state_manager.start_quiz()
                     break
 
-            if proj.fora_da_tela() and proj in self.projectiles:
-                self.projectiles.remove(proj)
+            if proj.alive and proj.fora_da_tela():
+                self.projectile_pool.release(proj)
+
+        # Devolve aos pools os projéteis e obstáculos removidos
+        self.projectile_pool.compact()
+        self.game.obstacle_pool.compact()
                 
-    def activate(self, duration=600):
-        """Ativa a arma por um tempo determinado (padrão 10s a 60fps)"""
+    def activate(self, duration=None):
+        """Ativa a arma por um tempo determinado (padrão config.WEAPON_DURATION)"""
+        if duration is None:
+            duration = config.WEAPON_DURATION
         self.active = True
         self.timer = duration
         self.game.weapon_active = True
@@ -98,4 +108,4 @@ class WeaponSystem:
             - Projetil.ALTURA // 2
         )
 
-        self.projectiles.append(Projetil(inicio_x, inicio_y))
+        self.projectile_pool.acquire(inicio_x, inicio_y)